@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Time multi-criteria author queries against a fully loaded index.
+
+Each query is run once the way `ietf author` used to build it, with a probe
+query per term to choose between an exact and a case-insensitive match and
+the per-term queries chained with INTERSECT, and once through the
+single-statement `query_author`.
+"""
+import argparse
+import os
+import tempfile
+import timeit
+
+import ietf.xml.bulk as bulk
+from ietf.sql.base import Base
+from ietf.sql.rfc import Author, Rfc
+from ietf.sql.schema import upgrade
+from ietf.utility.query_author import query_author
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from synthetic import write_index
+
+# Criteria of each timed query, as keyword arguments of `query_author`
+QUERIES = (
+    {'names': ['A. Author12'], 'orgs': ['organization 1*']},
+    {'names': ['a. author1*', 'a. author2*']},
+    {'names': ['A. Author1*'], 'titles': ['editor']},
+)
+
+
+def _probe_then_intersect(session, column, terms):
+    """The per-term query builder as it was before `query_author`."""
+    queries = []
+    for term in terms:
+        term = term.replace('*', '%')
+        query = session.query(Rfc).join(Author).filter(column == term)
+        if query.first():
+            queries.append(query)
+        else:
+            queries.append(session.query(Rfc).join(Author).
+                           filter(column.like(term)))
+    query_to_run = queries[0]
+    for query in queries[1:]:
+        query_to_run = query_to_run.intersect(query)
+    return query_to_run
+
+
+def query_before(session, names=None, titles=None, orgs=None, abbrevs=None):
+    query = session.query(Rfc)
+    for column, terms in ((Author.name, names), (Author.title, titles),
+                          (Author.organization, orgs),
+                          (Author.org_abbrev, abbrevs)):
+        if terms:
+            query = query.intersect(
+                _probe_then_intersect(session, column, terms)
+            )
+    return query
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--count', type=int, default=9000,
+                        help='number of RFC entries in the synthetic index')
+    parser.add_argument('-i', '--index',
+                        help='benchmark an existing rfc-index.xml instead')
+    parser.add_argument('-r', '--repeat', type=int, default=50,
+                        help='number of times to run every query')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = args.index
+        if path is None:
+            path = os.path.join(tmp_dir, 'rfc-index.xml')
+            write_index(path, args.count)
+        engine = create_engine('sqlite:///{}'.format(
+            os.path.join(tmp_dir, 'rfc-index.sqlite3')))
+        Base.metadata.create_all(engine)
+        with engine.begin() as connection:
+            bulk.add_all(connection, path)
+            upgrade(connection)
+        session = sessionmaker(bind=engine)()
+
+        for criteria in QUERIES:
+            print(criteria)
+            for name, build in (('probe + INTERSECT', query_before),
+                                ('single statement', query_author)):
+                def run():
+                    return build(session, **criteria).order_by(Rfc.id).all()
+                seconds = min(timeit.repeat(run, number=args.repeat,
+                                            repeat=3))
+                print('  {:<18} {:>8.3f} ms  ({} RFCs)'.format(
+                    name, seconds / args.repeat * 1e3, len(run())))
+        session.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Time building and searching the index of RFC bodies.
+
+Synthetic RFC texts are written to a temporary mirror, indexed with a
+single worker and with one per CPU, and searched through the index and by
+reading and matching every file the way `grep -l` would.
+"""
+import argparse
+import itertools
+import os
+import random
+import re
+import tempfile
+import time
+import timeit
+
+from ietf.utility import body
+
+# Searches timed, as FTS5 queries and equivalent regular expressions
+SEARCHES = (('congestion', rb'(?i)congestion'),
+            ('"key words"', rb'(?i)key\s+words'),
+            ('retrans*', rb'(?i)retrans'))
+
+# Words of the synthetic texts, most frequent first
+WORDS = ['the', 'of', 'and', 'to', 'a', 'in', 'is', 'for', 'be', 'that',
+         'protocol', 'message', 'server', 'client', 'header', 'field',
+         'packet', 'address', 'security', 'routing', 'key', 'words',
+         'timer', 'connection', 'option'] + \
+        ['term{}'.format(rank) for rank in range(20000)] + \
+        ['congestion', 'retransmission', 'retransmit']
+
+
+def write_mirror(rfc_dir: str, count: int, paragraphs: int, seed: int = 0):
+    """Write `count` RFC texts of `paragraphs` paragraphs each, drawing
+    words from `WORDS` with Zipf's law.
+    """
+    rng = random.Random(seed)
+    weights = list(itertools.accumulate(1 / (rank + 1)
+                                        for rank in range(len(WORDS))))
+    for number in range(1, count + 1):
+        lines = []
+        for page_paragraph in range(paragraphs):
+            for _ in range(rng.randint(2, 8)):
+                lines.append('   ' + ' '.join(
+                    rng.choices(WORDS, cum_weights=weights, k=11)))
+            lines.append('\f' if page_paragraph % 8 == 7 else '')
+        path = os.path.join(rfc_dir, 'rfc{}.txt'.format(number))
+        with open(path, 'w') as text_file:
+            text_file.write('\n'.join(lines))
+
+
+def scan(rfc_dir: str, pattern) -> list:
+    """Return the numbers of the RFCs in `rfc_dir` matching `pattern`."""
+    numbers = []
+    for name in os.listdir(rfc_dir):
+        with open(os.path.join(rfc_dir, name), 'rb') as text_file:
+            if pattern.search(text_file.read()):
+                numbers.append(int(name[3:-4]))
+    return numbers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--count', type=int, default=2000,
+                        help='number of synthetic RFC texts')
+    parser.add_argument('-p', '--paragraphs', type=int, default=60,
+                        help='paragraphs per RFC text')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        rfc_dir = os.path.join(tmp_dir, 'rfc')
+        os.makedirs(rfc_dir)
+        write_mirror(rfc_dir, args.count, args.paragraphs)
+        size = sum(os.path.getsize(os.path.join(rfc_dir, name))
+                   for name in os.listdir(rfc_dir))
+        print('{} files, {:.1f} MB'.format(args.count, size / 1e6))
+
+        for workers in (1, None):
+            path = os.path.join(tmp_dir, 'body-{}.sqlite3'.format(workers))
+            start = time.perf_counter()
+            body.update(rfc_dir, path, workers)
+            seconds = time.perf_counter() - start
+            print('{:<28} {:>10.2f} s'.format(
+                'index, workers={}'.format(workers or os.cpu_count()),
+                seconds))
+        start = time.perf_counter()
+        body.update(rfc_dir, path)
+        print('{:<28} {:>10.2f} s'.format('update, nothing changed',
+                                          time.perf_counter() - start))
+
+        print('{:<16} {:>12} {:>12}'.format('search', 'index', 'scan'))
+        for match, regex in SEARCHES:
+            indexed = min(timeit.repeat(lambda: body.search(path, match),
+                                        number=5, repeat=3)) / 5
+            pattern = re.compile(regex)
+            scanned = min(timeit.repeat(lambda: scan(rfc_dir, pattern),
+                                        number=1, repeat=3))
+            print('{:<16} {:>9.2f} ms {:>9.2f} ms'.format(
+                match, indexed * 1e3, scanned * 1e3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Time building, loading and walking the document graph.
+
+Traversals are timed from every RFC in the index in turn and compared with
+resolving the current replacement of each RFC through the DB.
+"""
+import argparse
+import os
+import tempfile
+import time
+import timeit
+
+import ietf.xml.bulk as bulk
+from ietf.sql.base import Base
+from ietf.sql.schema import upgrade
+from ietf.utility import graph
+from ietf.utility.query_doc import query_rfc_obsoletes
+from ietf.xml.enum import DocumentType
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from synthetic import write_index
+
+SUCCESSORS = ('obsoleted_by', 'updated_by')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--count', type=int, default=9000,
+                        help='number of RFC entries in the synthetic index')
+    parser.add_argument('-i', '--index',
+                        help='benchmark an existing rfc-index.xml instead')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = args.index
+        if path is None:
+            path = os.path.join(tmp_dir, 'rfc-index.xml')
+            write_index(path, args.count)
+        db_path = os.path.join(tmp_dir, 'rfc-index.sqlite3')
+        engine = create_engine('sqlite:///{}'.format(db_path))
+        Base.metadata.create_all(engine)
+        with engine.begin() as connection:
+            bulk.add_all(connection, path)
+            upgrade(connection)
+
+        with engine.connect() as connection:
+            start = time.perf_counter()
+            graph.build(connection, db_path)
+            build_time = time.perf_counter() - start
+        graph_file = graph.graph_path(db_path)
+        load_time = min(timeit.repeat(lambda: graph.Graph.load(graph_file),
+                                      number=10, repeat=3)) / 10
+        doc_graph = graph.Graph.load(graph_file)
+        nodes = [(DocumentType.RFC, doc_id) for (doc_type, doc_id) in
+                 map(graph._decode, doc_graph.keys)
+                 if doc_type is DocumentType.RFC]
+
+        print('{} nodes, graph file of {} bytes'.format(
+            len(doc_graph), os.path.getsize(graph_file)))
+        print('{:<28} {:>10.3f} ms'.format('build and save',
+                                           build_time * 1e3))
+        print('{:<28} {:>10.3f} ms'.format('load', load_time * 1e3))
+        for name, walk in (
+            ('current', doc_graph.current),
+            ('updated_by (transitive)', doc_graph.updated_by),
+            ('descendants', lambda node: doc_graph.descendants(node,
+                                                               SUCCESSORS)),
+            ('ancestors', lambda node: doc_graph.ancestors(node,
+                                                           SUCCESSORS)),
+        ):
+            walk(nodes[0])  # Build any inverted adjacency up front
+            seconds = min(timeit.repeat(lambda: [walk(n) for n in nodes],
+                                        number=1, repeat=3))
+            print('{:<28} {:>10.2f} us/RFC'.format(
+                name, seconds / len(nodes) * 1e6))
+
+        session = sessionmaker(bind=engine)()
+        sample = nodes[:500]
+        start = time.perf_counter()
+        for _, doc_id in sample:
+            query_rfc_obsoletes(session, doc_id)
+        seconds = time.perf_counter() - start
+        print('{:<28} {:>10.2f} us/RFC'.format(
+            'current, through the DB', seconds / len(sample) * 1e6))
+        session.close()
+
+
+if __name__ == '__main__':
+    main()
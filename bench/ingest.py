@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Time loading an index into a fresh DB through the ORM.
+
+The ORM path is timed twice: once with the per-keyword
+`SELECT ... WHERE word = ?` lookup that `_add_keyword` used to issue, and
+once with the session-wide keyword cache.  The bulk Core loader is timed
+for comparison, both parsing serially and with a pool of worker processes.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import ietf.xml.bulk as bulk
+import ietf.xml.index as index
+import ietf.xml.parallel as parallel
+import ietf.xml.rfc as rfc
+from ietf.sql.base import Base
+from ietf.sql.rfc import Keyword
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from synthetic import write_index
+
+
+def _add_keyword_uncached(session, word):
+    """The keyword lookup as it was before the cache was introduced."""
+    keyword = session.query(Keyword).filter(Keyword.word == word).one_or_none()
+    if keyword is None:
+        keyword = Keyword(word)
+        session.add(keyword)
+    return keyword
+
+
+def _engine():
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def time_orm(path: str) -> float:
+    start = time.perf_counter()
+    session = sessionmaker(bind=_engine())()
+    index.add_all(session, path)
+    session.commit()
+    return time.perf_counter() - start
+
+
+def time_bulk(path: str) -> float:
+    start = time.perf_counter()
+    with _engine().begin() as connection:
+        bulk.add_all(connection, path)
+    return time.perf_counter() - start
+
+
+def time_parallel(path: str, workers: int) -> float:
+    start = time.perf_counter()
+    with _engine().begin() as connection:
+        parallel.add_all(connection, path, workers)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--count', type=int, default=2000,
+                        help='number of RFC entries in the synthetic index')
+    parser.add_argument('-i', '--index',
+                        help='benchmark an existing rfc-index.xml instead')
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count(),
+                        help='worker processes for the parallel loader')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = args.index
+        if path is None:
+            path = os.path.join(tmp_dir, 'rfc-index.xml')
+            write_index(path, args.count)
+
+        cached_add_keyword = rfc._add_keyword
+        rfc._add_keyword = _add_keyword_uncached
+        try:
+            before = time_orm(path)
+        finally:
+            rfc._add_keyword = cached_add_keyword
+        after = time_orm(path)
+        bulk_time = time_bulk(path)
+        parallel_time = time_parallel(path, args.workers)
+
+    print('{:<28} {:>8.3f} s'.format('ORM, uncached keywords', before))
+    print('{:<28} {:>8.3f} s'.format('ORM, cached keywords', after))
+    print('{:<28} {:>8.3f} s'.format('bulk loader', bulk_time))
+    print('{:<28} {:>8.3f} s'.format(
+        'bulk loader, {} workers'.format(args.workers), parallel_time))
+
+
+if __name__ == '__main__':
+    main()
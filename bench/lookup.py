@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Time looking up RFCs one ID at a time, as scripts resolving IDs in a
+loop do.
+
+The ORM query rebuilt on every call, which `query_rfc` used to run, is
+compared with the prebuilt statement it runs now and with the Core
+id/title fast path of `query_title`.
+"""
+import argparse
+import os
+import random
+import tempfile
+import timeit
+
+import ietf.xml.bulk as bulk
+from ietf.sql.base import Base
+from ietf.sql.rfc import Rfc
+from ietf.sql.schema import upgrade
+from ietf.utility.query_doc import query_rfc, query_title
+from ietf.xml.enum import DocumentType
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from synthetic import write_index
+
+
+def rebuilt_query(session, number):
+    return session.query(Rfc).filter(Rfc.id == number).one_or_none()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--count', type=int, default=9000,
+                        help='number of RFC entries in the synthetic index')
+    parser.add_argument('-l', '--lookups', type=int, default=2000,
+                        help='RFCs looked up per round')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        xml_path = os.path.join(tmp_dir, 'rfc-index.xml')
+        write_index(xml_path, args.count)
+        engine = create_engine('sqlite:///{}'.format(
+            os.path.join(tmp_dir, 'rfc-index.sqlite3')))
+        Base.metadata.create_all(engine)
+        with engine.begin() as connection:
+            bulk.add_all(connection, xml_path)
+            upgrade(connection)
+        Session = sessionmaker(bind=engine)
+        numbers = random.Random(0).choices(range(1, args.count + 1),
+                                           k=args.lookups)
+
+        for name, lookup in (
+            ('ORM query, rebuilt', rebuilt_query),
+            ('query_rfc', query_rfc),
+            ('query_title', lambda session, number:
+             query_title(session, DocumentType.RFC, number)),
+        ):
+            def run():
+                # A new session each round, so that no RFC is already in
+                # the identity map
+                session = Session()
+                for number in numbers:
+                    lookup(session, number)
+                session.close()
+            run()  # Fill the statement caches
+            seconds = min(timeit.repeat(run, number=1, repeat=5))
+            print('{:<20} {:>8.1f} us/lookup'.format(
+                name, seconds / len(numbers) * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Time decoding the RFC entries of an index.
+
+Each entry is decoded once by calling every `find_*` function separately, the
+way `ietf.xml.rfc.add_entry` used to, and once with the single-pass
+`decode_entry`.  The memory held by the decoded records of every entry is
+reported as well.
+"""
+import argparse
+import os
+import timeit
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+import ietf.xml.parse as parse
+
+FIXTURE = os.path.join(os.path.dirname(__file__), os.pardir,
+                       'ietf/test/data/rfc-index.xml')
+
+FINDERS = (parse.find_doc_id, parse.find_title, parse.find_author,
+           parse.find_date, parse.find_format, parse.find_keywords,
+           parse.find_abstract, parse.find_draft, parse.find_notes,
+           parse.find_obsoletes, parse.find_obsoleted_by, parse.find_updates,
+           parse.find_updated_by, parse.find_is_also, parse.find_see_also,
+           parse.find_current_status, parse.find_publication_status,
+           parse.find_stream, parse.find_area, parse.find_wg_acronym,
+           parse.find_errata_url, parse.find_doi)
+
+
+def find_all_fields(entries):
+    for entry in entries:
+        for find in FINDERS:
+            find(entry)
+
+
+def decode_all(entries):
+    for entry in entries:
+        parse.decode_entry(entry)
+
+
+def held_bytes(entries):
+    """Return the bytes allocated to keep the records of `entries`."""
+    tracemalloc.start()
+    records = [parse.decode_entry(entry) for entry in entries]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-i', '--index', default=FIXTURE,
+                        help='index to decode (default: the test fixture)')
+    parser.add_argument('-r', '--repeat', type=int, default=2000,
+                        help='number of times to decode every entry')
+    args = parser.parse_args()
+
+    entries = parse.findall(ET.parse(args.index).getroot(), 'rfc-entry')
+    count = len(entries) * args.repeat
+    for name, func in (('find_* per field', find_all_fields),
+                       ('decode_entry', decode_all)):
+        seconds = min(timeit.repeat(lambda: func(entries), number=args.repeat,
+                                    repeat=3))
+        print('{:<18} {:>8.2f} us/entry'.format(name, seconds / count * 1e6))
+    print('{:<18} {:>8.0f} bytes/entry'.format(
+        'records held', held_bytes(entries) / len(entries)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Time RFC lookups through `get_db_engine` with and without the 'read'
+connection settings of `ietf.sql.pragma`.
+
+Each round opens a fresh engine, as a CLI run does, then looks up a sample
+of RFCs and their abstracts in a new session.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from unittest import mock
+
+import ietf.xml.bulk as bulk
+from ietf.sql.base import Base
+from ietf.sql.pragma import PROFILES
+from ietf.sql.schema import upgrade
+from ietf.utility import environment
+from ietf.utility.query_doc import query_rfc
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from synthetic import write_index
+
+# Value of $IETF_SQLITE_READ leaving every setting at SQLite's default
+NO_SETTINGS = ','.join('{}='.format(name) for name, _ in PROFILES['read'])
+
+
+def time_lookups(db_path, numbers, rounds):
+    """Return the fastest of `rounds` rounds of looking up `numbers` through
+    a fresh engine, in seconds.
+    """
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        engine = environment.get_db_engine(db_path)
+        session = sessionmaker(bind=engine)()
+        for number in numbers:
+            rfc = query_rfc(session, number)
+            [abstract.par for abstract in rfc.abstract]
+        session.close()
+        seconds = time.perf_counter() - start
+        engine.dispose()
+        environment._engines.clear()
+        best = seconds if best is None else min(best, seconds)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--count', type=int, default=9000,
+                        help='number of RFC entries in the synthetic index')
+    parser.add_argument('-l', '--lookups', type=int, default=500,
+                        help='RFCs looked up per round')
+    parser.add_argument('-r', '--rounds', type=int, default=5,
+                        help='rounds per setting')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        xml_path = os.path.join(tmp_dir, 'rfc-index.xml')
+        write_index(xml_path, args.count)
+        db_path = os.path.join(tmp_dir, 'rfc-index.sqlite3')
+        engine = create_engine('sqlite:///{}'.format(db_path))
+        Base.metadata.create_all(engine)
+        with engine.begin() as connection:
+            bulk.add_all(connection, xml_path)
+            upgrade(connection)
+        engine.dispose()
+        numbers = random.Random(0).sample(range(1, args.count + 1),
+                                          min(args.lookups, args.count))
+
+        print('DB of {} bytes, {} lookups per round'.format(
+            os.path.getsize(db_path), len(numbers)))
+        for name, value in (('SQLite defaults', NO_SETTINGS),
+                            ("'read' profile", '')):
+            with mock.patch.dict(os.environ, {'IETF_SQLITE_READ': value}):
+                seconds = time_lookups(db_path, numbers, args.rounds)
+            print('{:<16} {:>8.1f} ms {:>8.1f} us/lookup'.format(
+                name, seconds * 1e3, seconds / len(numbers) * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Time full-text searches against a fully loaded index.
+
+Each search is run once through the FTS5 index with `query_search` and once
+as the scan it replaces, a case-insensitive LIKE over every title and
+abstract paragraph.
+"""
+import argparse
+import os
+import tempfile
+import time
+import timeit
+
+import ietf.xml.bulk as bulk
+from ietf.sql.base import Base
+from ietf.sql.rfc import Abstract, Rfc
+from ietf.sql.schema import upgrade
+from ietf.utility.query_search import query_search
+from sqlalchemy import create_engine, or_, select
+from sqlalchemy.orm import sessionmaker
+from synthetic import write_index
+
+# Searches timed, as the terms passed to `ietf search`
+SEARCHES = (['ipv6'], ['"key words"'], ['crypt*'], ['routing', 'security'])
+
+
+def scan(session, terms):
+    """Return the IDs of the RFCs whose title or abstract contains every
+    term, by scanning both.
+    """
+    query = select(Rfc.id)
+    for term in terms:
+        pattern = '%{}%'.format(term.strip('"*'))
+        query = query.where(or_(
+            Rfc.title.like(pattern),
+            Rfc.id.in_(select(Abstract.rfc_id).
+                       where(Abstract.par.like(pattern))),
+        ))
+    return session.execute(query).scalars().all()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--count', type=int, default=9000,
+                        help='number of RFC entries in the synthetic index')
+    parser.add_argument('-i', '--index',
+                        help='benchmark an existing rfc-index.xml instead')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = args.index
+        if path is None:
+            path = os.path.join(tmp_dir, 'rfc-index.xml')
+            write_index(path, args.count)
+        engine = create_engine('sqlite:///{}'.format(
+            os.path.join(tmp_dir, 'rfc-index.sqlite3')))
+        Base.metadata.create_all(engine)
+        with engine.begin() as connection:
+            bulk.add_all(connection, path)
+            start = time.perf_counter()
+            upgrade(connection)
+            seconds = time.perf_counter() - start
+            print('{:<24} {:>10.1f} ms'.format('upgrade, filling the index',
+                                               seconds * 1e3))
+        session = sessionmaker(bind=engine)()
+
+        print('{:<24} {:>10} {:>12} {:>12}'.format(
+            'search', 'matches', 'fts5', 'scan'))
+        for terms in SEARCHES:
+            matches = query_search(session, terms).count()
+            indexed = min(timeit.repeat(
+                lambda: query_search(session, terms).limit(20).all(),
+                number=5, repeat=3)) / 5
+            scanned = min(timeit.repeat(lambda: scan(session, terms),
+                                        number=1, repeat=3))
+            print('{:<24} {:>10} {:>9.2f} ms {:>9.2f} ms'.format(
+                ' '.join(terms), matches, indexed * 1e3, scanned * 1e3))
+        session.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Time `ietf rfc` run as a fresh process, with and without `ietf serve`.
+
+A synthetic index is loaded into a temporary data dir, then each lookup is
+run as a subprocess of `bin/ietf`, first on its own and then forwarded to a
+server started against the same data dir.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import ietf.xml.bulk as bulk
+from ietf.sql.base import Base
+from ietf.sql.schema import upgrade
+from sqlalchemy import create_engine
+from synthetic import write_index
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IETF = os.path.join(ROOT, 'bin', 'ietf')
+
+
+def time_runs(argv, env, repeat):
+    """Return the fastest of `repeat` runs of `ietf argv`, in seconds."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, IETF] + argv, env=env, check=True,
+                       stdout=subprocess.DEVNULL)
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--count', type=int, default=9000,
+                        help='number of RFC entries in the synthetic index')
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help='runs of each command')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_dir = os.path.join(tmp_dir, 'ietf')
+        os.makedirs(data_dir)
+        xml_path = os.path.join(tmp_dir, 'rfc-index.xml')
+        write_index(xml_path, args.count)
+        db_path = os.path.join(data_dir, 'rfc-index.sqlite3')
+        engine = create_engine('sqlite:///{}'.format(db_path))
+        Base.metadata.create_all(engine)
+        with engine.begin() as connection:
+            bulk.add_all(connection, xml_path)
+            upgrade(connection)
+        engine.dispose()
+
+        env = dict(os.environ, XDG_DATA_HOME=tmp_dir,
+                   PYTHONPATH=os.pathsep.join(
+                       filter(None, [ROOT, os.environ.get('PYTHONPATH')])))
+        commands = (['rfc', '1'], ['rfc', '-o', '1'], ['--help'])
+        local = [time_runs(argv, env, args.repeat) for argv in commands]
+
+        server = subprocess.Popen([sys.executable, IETF, 'serve'], env=env,
+                                  stdout=subprocess.PIPE)
+        server.stdout.readline()  # Wait until it listens
+        try:
+            served = [time_runs(argv, env, args.repeat) for argv in commands]
+        finally:
+            server.terminate()
+            server.wait()
+
+        print('{:<16} {:>10} {:>10}'.format('command', 'local', 'served'))
+        for argv, local_time, served_time in zip(commands, local, served):
+            print('{:<16} {:>7.1f} ms {:>7.1f} ms'.format(
+                ' '.join(argv), local_time * 1e3, served_time * 1e3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Time the cold start of `ietf` and of each of its subcommands.
+
+Every command is run as `python -X importtime bin/ietf ... --help`, so that
+nothing but parsing happens, and the cumulative time of the top-level
+imports it reports is recorded along with the wall-clock time.  Results can
+be saved and compared against a saved baseline, in which case the exit
+status is 1 if any command's imports got slower than the tolerance allows.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from ietf.cmd import SUBCOMMANDS
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IETF = os.path.join(ROOT, 'bin', 'ietf')
+
+
+def import_time(stderr: str) -> float:
+    """Return the total cumulative time, in seconds, of the top-level
+    imports in the `-X importtime` report `stderr`.
+    """
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if cumulative.strip().isdigit() and not name.startswith('  '):
+            total += int(cumulative)
+    return total / 1e6
+
+
+def time_start(argv, env, repeat):
+    """Return the fastest import and wall-clock times, in seconds, of
+    `repeat` runs of `ietf argv`.
+    """
+    imports = []
+    walls = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        process = subprocess.run(
+            [sys.executable, '-X', 'importtime', IETF] + argv, env=env,
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+            universal_newlines=True,
+        )
+        walls.append(time.perf_counter() - start)
+        imports.append(import_time(process.stderr))
+    return min(imports), min(walls)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help='runs of each command')
+    parser.add_argument('-o', '--output',
+                        help='save the import times as JSON to this file')
+    parser.add_argument('-b', '--baseline',
+                        help='compare against import times saved earlier')
+    parser.add_argument('-t', '--tolerance', type=float, default=0.25,
+                        help='slowdown over the baseline allowed per command')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # An empty data dir, so that no running `ietf serve` answers
+        env = dict(os.environ, XDG_DATA_HOME=tmp_dir,
+                   PYTHONPATH=os.pathsep.join(
+                       filter(None, [ROOT, os.environ.get('PYTHONPATH')])))
+        results = {}
+        commands = [('ietf', ['--help'])] + [
+            (name, [name, '--help']) for name in SUBCOMMANDS]
+        for name, argv in commands:
+            results[name] = time_start(argv, env, args.repeat)
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+    regressions = []
+    print('{:<10} {:>12} {:>12} {:>12}'.format(
+        'command', 'imports', 'wall', 'baseline'))
+    for name, (imports, wall) in results.items():
+        line = '{:<10} {:>9.1f} ms {:>9.1f} ms'.format(
+            name, imports * 1e3, wall * 1e3)
+        if name in baseline:
+            line += ' {:>9.1f} ms'.format(baseline[name] * 1e3)
+            if imports > baseline[name] * (1 + args.tolerance):
+                regressions.append(name)
+                line += '  slower'
+        print(line)
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump({name: imports for name, (imports, _) in
+                       results.items()}, output_file, indent=2)
+    if regressions:
+        print('Slower than the baseline: {}'.format(', '.join(regressions)))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
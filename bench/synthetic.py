@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Generate a synthetic rfc-index.xml of arbitrary size for benchmarks.
+
+The entries are copies of the RFC entries in the test fixture with
+renumbered IDs and randomized authors, keywords and obsoletes/updates
+relations, so that the generated index exercises every table of the schema.
+"""
+import argparse
+import copy
+import os
+import random
+import xml.etree.ElementTree as ET
+
+from ietf.xml.parse import NAMESPACE
+
+FIXTURE = os.path.join(os.path.dirname(__file__), os.pardir,
+                       'ietf/test/data/rfc-index.xml')
+NS = '{{{}}}'.format(NAMESPACE['index'])
+
+# Document reference lists, paired with their inverse
+RELATIONS = (('obsoletes', 'obsoleted-by'), ('updates', 'updated-by'))
+
+
+def _sub(parent, tag, text=None):
+    element = ET.SubElement(parent, NS + tag)
+    element.text = text
+    return element
+
+
+def _insert_before(entry, tag, element):
+    """Insert `element` into `entry` right before its `tag` child."""
+    children = list(entry)
+    entry.insert(children.index(entry.find(NS + tag)), element)
+
+
+def generate(count: int, seed: int = 0, vocabulary: int = 2000,
+             authors: int = 5000) -> ET.Element:
+    """Return the root of an index holding `count` RFC entries."""
+    rng = random.Random(seed)
+    ET.register_namespace('', NAMESPACE['index'])
+    templates = ET.parse(FIXTURE).getroot().findall(NS + 'rfc-entry')
+    # Randomized relations between documents, keyed by tag then number
+    refs = {tag: {} for pair in RELATIONS for tag in pair}
+    for number in range(2, count + 1):
+        for tag, inverse in RELATIONS:
+            if rng.random() < 0.1:
+                target = rng.randrange(1, number)
+                refs[tag].setdefault(number, []).append(target)
+                refs[inverse].setdefault(target, []).append(number)
+
+    root = ET.Element(NS + 'rfc-index')
+    for number in range(1, count + 1):
+        entry = copy.deepcopy(templates[number % len(templates)])
+        entry.find(NS + 'doc-id').text = 'RFC{:0>4}'.format(number)
+        for element in list(entry):
+            tag = element.tag[len(NS):]
+            if tag in refs or tag in ('author', 'keywords', 'is-also',
+                                      'see-also'):
+                entry.remove(element)
+        # Authors drawn from a fixed pool so names repeat across RFCs
+        for _ in range(rng.randint(1, 4)):
+            author = ET.Element(NS + 'author')
+            _sub(author, 'name', 'A. Author{}'.format(rng.randrange(authors)))
+            if rng.random() < 0.2:
+                _sub(author, 'title', 'Editor')
+            if rng.random() < 0.5:
+                _sub(author, 'organization',
+                     'Organization {}'.format(rng.randrange(200)))
+            _insert_before(entry, 'date', author)
+        # Keywords drawn from a fixed vocabulary
+        keywords = ET.Element(NS + 'keywords')
+        for word in rng.sample(range(vocabulary), rng.randint(0, 8)):
+            _sub(keywords, 'kw', 'keyword{}'.format(word))
+        _insert_before(entry, 'current-status', keywords)
+        # Obsoletes and updates relations
+        for tag in refs:
+            if number in refs[tag]:
+                element = ET.Element(NS + tag)
+                for doc_id in refs[tag][number]:
+                    _sub(element, 'doc-id', 'RFC{:0>4}'.format(doc_id))
+                _insert_before(entry, 'current-status', element)
+        root.append(entry)
+    return root
+
+
+def write_index(path: str, count: int, seed: int = 0):
+    """Write a synthetic index of `count` RFC entries to `path`."""
+    ET.ElementTree(generate(count, seed)).write(path, encoding='UTF-8',
+                                                xml_declaration=True)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('path', help='destination of the generated index')
+    parser.add_argument('-n', '--count', type=int, default=9000,
+                        help='number of RFC entries to generate')
+    args = parser.parse_args()
+    write_index(args.path, args.count)
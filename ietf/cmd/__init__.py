@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+from importlib import import_module
+import argparse
+import sys
+
+# Module and help of each subcommand.  Only the module of the subcommand being
+# run is imported; the others get a placeholder parser with the same help.
+SUBCOMMANDS = {
+    'author': ('ietf.cmd.author', 'query RFCs by author'),
+    'bcp': ('ietf.cmd.bcp', 'view information about BCPs'),
+    'fyi': ('ietf.cmd.fyi', 'view information about FYIs'),
+    'keyword': ('ietf.cmd.keyword', 'query RFCs by keyword'),
+    'mirror': ('ietf.cmd.mirror', 'update a local mirror'),
+    'rfc': ('ietf.cmd.rfc', 'view information about RFCs'),
+    'search': ('ietf.cmd.search', 'search RFCs by title, abstract, keyword '
+               'and author'),
+    'serve': ('ietf.cmd.serve',
+              'answer later commands from a long-running process'),
+    'std': ('ietf.cmd.std', 'view information about STDs'),
+}
+
+
+def build_parser(loaded=None) -> argparse.ArgumentParser:
+    """Return the parser for `ietf` and its subcommands.
+
+    Only the subcommands named in `loaded`, or all of them if it is None,
+    are imported and can be parsed in full.
+    """
+    parser = argparse.ArgumentParser(prog='ietf')
+    subparsers = parser.add_subparsers(dest='subcommand')
+    subparsers.required = True  # Require a subcommand
+    for name, (module, help) in SUBCOMMANDS.items():
+        if loaded is None or name in loaded:
+            import_module(module).add_subparser(subparsers)
+        else:
+            subparsers.add_parser(name, help=help)
+    return parser
+
+
+def find_subcommand(argv) -> list:
+    """Return the subcommand `argv` runs as a list of zero or one name."""
+    for arg in argv:
+        if not arg.startswith('-'):  # `ietf` itself only takes options
+            return [arg] if arg in SUBCOMMANDS else []
+    return []
+
+
+def main(argv=None):
+    """Parse `argv` (by default the process's arguments) and run the
+    specified subcommand.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = build_parser(find_subcommand(argv))
+    args = parser.parse_args(argv)  # Parse the supplied arguments
+    args.func(args)  # Run the specified (sub)command
@@ -1,35 +1,23 @@
 #!/usr/bin/env python3
-from ietf.sql.rfc import Rfc
+from ietf.sql.rfc import Rfc, display_options
+from ietf.utility.cache import cached
 from ietf.utility.environment import (get_db_session, get_editor, get_file,
                                       get_pager)
-from ietf.utility.query_author import (query_author_by_name,
-                                       query_author_by_org,
-                                       query_author_by_orgabbrev,
-                                       query_author_by_title)
+from ietf.utility.query_author import query_author
 from subprocess import run
 import sys
 
 
+@cached
 def get_rfcs(args):
     """Get RFCs written by the passed authors."""
-    # Create an all-inclusive query to intersect with
     Session = get_db_session()
-    query = Session.query(Rfc)
-    # Add argument queries
-    if args.name:
-        query = query.intersect(query_author_by_name(Session, args.name))
-    if args.title:
-        query = query.intersect(query_author_by_title(Session, args.title))
-    if args.organization:
-        query = query.intersect(
-            query_author_by_org(Session, args.organization)
-        )
-    if args.org_abbreviation:
-        query = query.intersect(
-            query_author_by_orgabbrev(Session, args.org_abbreviation)
-        )
+    # Match every criterion in a single statement
+    query = query_author(Session, names=args.name, titles=args.title,
+                         orgs=args.organization,
+                         abbrevs=args.org_abbreviation)
     # Run the assembled query
-    rfcs = query.order_by(Rfc.id).all()
+    rfcs = query.options(*display_options()).order_by(Rfc.id).all()
     show_docs(rfcs, args.editor, args.pager)  # Display found documents
     # Exit successfully
     sys.exit(0)
@@ -1,21 +1,24 @@
 #!/usr/bin/env python3
+from ietf.utility.cache import cached
 from ietf.utility.environment import (get_db_session, get_editor, get_file,
                                       get_pager)
-from ietf.utility.query_doc import query_bcp
+from ietf.utility.query_doc import query_bcps
 from ietf.utility.query_is_also import query_bcp_is_also
 from subprocess import run
 import sys
 
 
+@cached
 def get_docs(args):
     """Get documents from the passed list and display them."""
     DbSession = get_db_session()
     numbers = sort_preserve_order(args.number)  # Remove duplicate arguments
     docs = []
     dne = []
+    found = query_bcps(DbSession, numbers)  # Look up every number at once
     if args.is_also:
         for number in numbers:
-            bcp = query_bcp(DbSession, number)
+            bcp = found[number]
             if bcp is None:
                 dne.append("BCP {} does not exist.".format(number))
             else:
@@ -23,7 +26,7 @@ def get_docs(args):
                 docs.extend(aliases)
     else:
         for number in numbers:
-            rfc = query_bcp(DbSession, number)
+            rfc = found[number]
             if rfc is not None:
                 docs.append(rfc)
             else:
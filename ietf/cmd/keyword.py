@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
-from ietf.sql.rfc import Rfc
+from ietf.sql.rfc import Rfc, display_options
+from ietf.utility.cache import cached
 from ietf.utility.environment import (
     get_db_session,
     get_editor,
@@ -11,6 +12,7 @@ from subprocess import run
 import sys
 
 
+@cached
 def get_rfcs(args):
     """Get RFCs containing passed keywords."""
     # Create an all-inclusive query to intersect with
@@ -18,7 +20,7 @@ def get_rfcs(args):
     # Add argument queries
     query = query_rfc_by_keyword(Session, args.keyword)
     # Run the assembled query
-    rfcs = query.order_by(Rfc.id).all()
+    rfcs = query.options(*display_options()).order_by(Rfc.id).all()
     show_docs(rfcs, args.editor, args.pager)  # Display found documents
     # Exit successfully
     sys.exit(0)
@@ -1,18 +1,22 @@
 #!/usr/bin/env python3
 from ietf.sql.base import Base
-from ietf.xml.bcp import add_all as add_all_bcp
-from ietf.xml.fyi import add_all as add_all_fyi
-from ietf.xml.rfc import add_all as add_all_rfc
-from ietf.xml.rfc_not_issued import add_all as add_all_rfc_not_issued
-from ietf.xml.std import add_all as add_all_std
+from ietf.sql.pragma import listen
+from ietf.sql.schema import is_current, upgrade
+from ietf.sql.shadow import shadow_build
+from ietf.utility.body import body_path, update as update_body_index
+from ietf.utility.cache import clear as clear_cache
+from ietf.utility.graph import build as build_graph
+from ietf.utility.manifest import (OUT_FORMAT, Changes, Manifest,
+                                   manifest_path, parse_itemized)
+from ietf.utility.scheduler import Job, Progress, Result, run_jobs
+from ietf.xml.incremental import update_all
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from subprocess import Popen
-from typing import List, Tuple
+from sqlalchemy.engine import URL
+from typing import List, Optional, Tuple
 from xdg import BaseDirectory
 import argparse
 import os
-import xml.etree.ElementTree as ET
+import sys
 
 __URI_DICT__ = {'charter': 'ietf.org::everything-ftp/ietf/',
                 'conflict': 'rsync.ietf.org::everything-ftp/conflict-reviews/',
@@ -31,6 +35,10 @@ __EXCLUDE_DICT__ = {'charter': [],
                             'internet-drafts/', 'ien/'],
                     'status': []}
 
+# Order in which the transfers start; the DB is built from the `rfc` mirror
+# so it goes first, and the others default to 1
+__PRIORITY_DICT__ = {'rfc': 0}
+
 
 def _expand_path(path: str) -> str:
     return os.path.expandvars(os.path.expanduser(path))
@@ -48,7 +56,8 @@ def _create_dir(path: str):
 RsyncInfo = Tuple[List[str], str]
 def assemble_rsync(doc_type: str, top_dir: str, flat: bool) -> RsyncInfo:
     # Add the rsync boilerplate
-    command = ['rsync', '-az', '--delete-during']
+    command = ['rsync', '-az', '--delete-during', '--info=progress2',
+               OUT_FORMAT]
 
     # Add any relevant `--exclude` strings
     for exclude in __EXCLUDE_DICT__[doc_type]:
@@ -67,23 +76,90 @@ def assemble_rsync(doc_type: str, top_dir: str, flat: bool) -> RsyncInfo:
     return command, dest_dir
 
 
-def _create_db(top_dir: str):
-    # Create the DB
+def _create_db(top_dir: str, changes: Optional[Changes] = None):
+    """Bring the DB and the indexes built from the `rfc` mirror up to date.
+
+    `changes` are the files of the `rfc` mirror that changed since the last
+    run; if None, everything is checked.
+    """
     db_path = os.path.join(top_dir, 'rfc-index.sqlite3')
-    engine = create_engine('sqlite:///{}'.format(db_path))
-    Base.metadata.create_all(engine, checkfirst=True)
-    session = sessionmaker(bind=engine)()
-    # Get the root of rfc-index.xml
+    if (changes is None or 'rfc-index.xml' in changes.paths() or
+            not os.path.isfile(db_path) or not _schema_is_current(db_path)):
+        _update_db(top_dir, db_path)
+    # Index the text of the RFCs that were added or changed, on every CPU
+    update_body_index(os.path.join(top_dir, 'rfc'), body_path(db_path),
+                      workers=None,
+                      names=None if changes is None else changes.paths())
+    # Results cached from the previous DB or body index are stale
+    clear_cache(db_path)
+
+
+def _schema_is_current(db_path: str) -> bool:
+    """Return whether the DB at `db_path` needs no schema upgrade, which
+    readers leave to `mirror`.
+    """
+    engine = create_engine(URL.create('sqlite', database=db_path))
+    with engine.connect() as connection:
+        current = is_current(connection)
+    engine.dispose()
+    return current
+
+
+def _update_db(top_dir: str, db_path: str):
+    # Build the new DB in a shadow copy that replaces the DB once complete,
+    # so that readers never see a partial DB
     xml_path = os.path.join(top_dir, 'rfc/rfc-index.xml')
-    tree = ET.parse(xml_path)
-    root = tree.getroot()
-    # Add all entries in root to session
-    add_all_bcp(session, root)
-    add_all_fyi(session, root)
-    add_all_rfc_not_issued(session, root)
-    add_all_rfc(session, root)
-    add_all_std(session, root)
-    session.commit()
+    with shadow_build(db_path) as engine:
+        Base.metadata.create_all(engine, checkfirst=True)
+        # Apply the entries of rfc-index.xml that changed since the last run,
+        # parsing the index on every CPU
+        with engine.begin() as connection:
+            update_all(connection, xml_path, workers=None)
+            # Add any missing indexes, rebuild the full-text index and
+            # refresh the planner's statistics
+            upgrade(connection)
+    # Save the document graph once the DB is in place so that it is newer
+    engine = listen(create_engine(URL.create('sqlite', database=db_path)),
+                    'read', db_path)
+    with engine.connect() as connection:
+        build_graph(connection, db_path)
+    engine.dispose()
+
+
+def _record_changes(top_dir: str, dest_dir: str,
+                    result: Result) -> Optional[Changes]:
+    """Record the changes the rsync job of `result` made under `dest_dir`
+    in the manifest and return them.
+
+    A transfer that failed may have changed more than it listed, so its
+    changes are returned as None.
+    """
+    manifest = Manifest(manifest_path(top_dir))
+    try:
+        applied = manifest.apply(result.name, dest_dir,
+                                 parse_itemized(result.output))
+    finally:
+        manifest.close()
+    return applied if result.ok else None
+
+
+def _show_progress(progress: Progress):
+    """Overwrite the status line with the progress of a transfer."""
+    sys.stderr.write('\r\x1b[K{}: {:,} bytes, {:,} files, {:.0f} s'.format(
+        progress.name, progress.bytes, progress.files, progress.elapsed))
+    sys.stderr.flush()
+
+
+def _show_result(result: Result):
+    if sys.stderr.isatty():
+        sys.stderr.write('\r\x1b[K')  # Clear the status line
+    if result.ok:
+        print('{}: {:,} bytes, {:,} files in {:.1f} s'.format(
+            result.name, result.bytes, result.files, result.elapsed))
+    else:
+        print('{}: rsync failed with exit status {} after {} attempts'.format(
+            result.name, result.exitcode, result.attempts))
+    sys.stdout.flush()
 
 
 def mirror(args):
@@ -92,33 +168,49 @@ def mirror(args):
     # Attempt to create directory
     _create_dir(top_dir)
 
-    # Dictionary to hold the commands
+    # Dictionary to hold the commands and where they write to
     commands = {}
+    dest_dirs = {}
     # No document type passed as an argument
     if args.type is None:
         for doc_type, _ in __URI_DICT__.items():
-            commands[doc_type], dest_dir = assemble_rsync(
+            commands[doc_type], dest_dirs[doc_type] = assemble_rsync(
                 doc_type, top_dir, args.flat)
-            _create_dir(dest_dir)
+            _create_dir(dest_dirs[doc_type])
     # One or multiple document types passed as arguments
     else:
         for doc_type in args.type:
-            commands[doc_type], dest_dir = assemble_rsync(
+            commands[doc_type], dest_dirs[doc_type] = assemble_rsync(
                 doc_type, top_dir, args.flat)
-            _create_dir(dest_dir)
+            _create_dir(dest_dirs[doc_type])
 
-    # List to hold the spawned processes' IDs
-    processes = []
-    for doc_type, command in commands.items():
-        # Start the rsync process and add its PID to processes
-        process = Popen(command)
-        processes.append(process)
+    def record_changes(result: Result):
+        _record_changes(top_dir, dest_dirs[result.name], result)
 
-    # Wait for each rsync process to complete
-    exitcodes = [p.wait() for p in processes]
+    def build(result: Result):
+        changes = _record_changes(top_dir, dest_dirs[result.name], result)
+        # Keep the published DB rather than build one from a partial mirror
+        if result.ok:
+            _create_db(top_dir, changes)
 
+    # Stage run as soon as each transfer is done, while the others go on;
+    # the DB only depends on the `rfc` mirror
+    stages = dict.fromkeys(commands, record_changes)
     if (args.type is None) and (not args.flat):
-        _create_db(top_dir)
+        stages['rfc'] = build
+
+    # Run the transfers a few at a time, `rfc` first since the DB needs it
+    jobs = [Job(doc_type, command, __PRIORITY_DICT__.get(doc_type, 1),
+                stages[doc_type])
+            for doc_type, command in commands.items()]
+    results = run_jobs(jobs, workers=args.jobs, retries=args.retries,
+                       on_progress=(_show_progress if sys.stderr.isatty()
+                                    else None),
+                       on_done=_show_result)
+
+    # Report that the mirror is stale if any transfer failed for good
+    if not all(result.ok for result in results.values()):
+        sys.exit(1)
 
 
 def add_subparser(subparsers: argparse._SubParsersAction):
@@ -149,4 +241,14 @@ def add_subparser(subparsers: argparse._SubParsersAction):
                  'rfc'],
         default=None,
         help='type of documents to download')
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=2,
+        help='number of transfers to run at once (default: %(default)s)')
+    parser.add_argument(
+        '--retries',
+        type=int,
+        default=3,
+        help='times to retry a failed transfer (default: %(default)s)')
     parser.set_defaults(func=mirror)
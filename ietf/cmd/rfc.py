@@ -1,41 +1,57 @@
 #!/usr/bin/env python3
-from ietf.utility.environment import (get_db_session, get_editor, get_file,
-                                      get_pager)
-from ietf.utility.query_doc import (query_rfc,
-                                    query_rfc_updates,
-                                    query_rfc_obsoletes,
+from ietf.sql.rfc import display_options
+from ietf.utility.cache import cached
+from ietf.utility.environment import (get_db_path, get_db_session,
+                                      get_editor, get_file, get_pager)
+from ietf.utility.graph import load as load_graph
+from ietf.utility.query_doc import (query_docs,
+                                    query_rfcs,
+                                    query_rfcs_updates,
+                                    query_rfcs_obsoletes,
                                     query_rfc_see_also,
-                                    query_rfc_not_issued,)
+                                    query_rfcs_not_issued,)
 from ietf.utility.query_is_also import (query_rfc_is_also,)
+from ietf.xml.enum import DocumentType
 from subprocess import run
 import sys
 
+# Relations leading from a document to the documents that supersede it
+_SUCCESSORS = ('obsoleted_by', 'updated_by')
 
+# Label of each relation in `--tree` output
+_LABELS = {'obsoleted_by': 'Obsoleted By', 'updated_by': 'Updated By'}
+
+
+@cached
 def get_docs(args):
     """Get documents from the passed list and display them."""
     db_session = get_db_session()
     numbers = sort_preserve_order(args.number)  # Remove duplicate arguments
     docs = []
-    dne = []
+    missing = []  # Numbers for which nothing was found
     if args.updates:
+        # Resolve every number's chain of updates at once
+        found = query_rfcs_updates(db_session, numbers, display_options())
         for number in numbers:
-            doc = query_rfc_updates(db_session, number)
+            doc = found[number]
             if doc is not None:
                 docs.append(doc)
             else:
-                dne.append(choose_dne_string(db_session, number))
+                missing.append(number)
     elif args.obsoletes:
+        # Resolve every number's chain of obsoletions at once
+        found = query_rfcs_obsoletes(db_session, numbers, display_options())
         for number in numbers:
-            rfc = query_rfc_obsoletes(db_session, number)
+            rfc = found[number]
             if rfc is not None:
                 docs.append(rfc)
             else:
-                dne.append(choose_dne_string(db_session, number))
+                missing.append(number)
     elif args.is_also:
+        found = query_rfcs(db_session, numbers)
         for number in numbers:
-            rfc = query_rfc(db_session, number)
-            if rfc is None:
-                dne.append(choose_dne_string(db_session, number))
+            if found[number] is None:
+                missing.append(number)
             else:
                 aliases = query_rfc_is_also(db_session, number)
                 docs.extend(aliases)
@@ -45,14 +61,36 @@ def get_docs(args):
             if reference is not None:
                 docs.append(reference)
             else:
-                dne.append(choose_dne_string(db_session, number))
+                missing.append(number)
+    elif args.tree:
+        found = query_rfcs(db_session, numbers)
+        graph = load_graph(db_session.connection(), get_db_path())
+        for number in numbers:
+            if found[number] is None:
+                missing.append(number)
+            else:
+                show_tree(graph, number)
+    elif args.closure:
+        found = query_rfcs(db_session, numbers)
+        graph = load_graph(db_session.connection(), get_db_path())
+        nodes = []  # Every superseding document, nearest first
+        for number in numbers:
+            if found[number] is None:
+                missing.append(number)
+            else:
+                nodes.extend(graph.descendants((DocumentType.RFC, number),
+                                               _SUCCESSORS))
+        closure = query_docs(db_session, nodes, display_options())
+        docs.extend(doc for doc in closure.values() if doc is not None)
     else:
+        found = query_rfcs(db_session, numbers, display_options())
         for number in numbers:
-            rfc = query_rfc(db_session, number)
+            rfc = found[number]
             if rfc is not None:
                 docs.append(rfc)
             else:
-                dne.append(choose_dne_string(db_session, number))
+                missing.append(number)
+    dne = choose_dne_strings(db_session, missing)
 
     # Display found documents
     show_docs(sort_preserve_order(docs), args.editor, args.pager)
@@ -64,11 +102,30 @@ def get_docs(args):
     sys.exit(0)
 
 
-def choose_dne_string(db_session, number):
-    if query_rfc_not_issued(db_session, number):  # If exists but not issued
-        return "RFC {} was never issued.".format(number)
-    else:
-        return "RFC {} does not exist.".format(number)
+def choose_dne_strings(db_session, numbers):
+    """Return a message for each of the RFC `numbers` that were not found."""
+    not_issued = query_rfcs_not_issued(db_session, numbers)
+    dne = []
+    for number in numbers:
+        if not_issued[number]:  # If exists but not issued
+            dne.append("RFC {} was never issued.".format(number))
+        else:
+            dne.append("RFC {} does not exist.".format(number))
+    return dne
+
+
+def show_tree(graph, number):
+    """Print the tree of documents that obsolete or update RFC `number`,
+    directly or transitively.
+    """
+    root = (DocumentType.RFC, number)
+    for (doc_type, doc_id), depth, relation in graph.dfs(root, _SUCCESSORS):
+        if relation is None:
+            print("{} {}".format(doc_type.value, doc_id))
+        else:
+            print("{}{} {} {}".format('  ' * depth, _LABELS[relation],
+                                      doc_type.value, doc_id))
+    print()  # newline
 
 
 def sort_preserve_order(sequence):
@@ -147,6 +204,18 @@ def add_subparser(parent_parser):
         action='store_true',
         help='lookup documents referenced by the specified RFCs',
     )
+    lookup_group.add_argument(
+        '-t', '--tree',
+        action='store_true',
+        help='show the tree of documents that obsolete or update the '
+             'specified RFCs',
+    )
+    lookup_group.add_argument(
+        '-c', '--closure',
+        action='store_true',
+        help='lookup every document that obsoletes or updates the specified '
+             'RFCs, directly or transitively',
+    )
 
     # Add RFC number as a required argument
     parser.add_argument(
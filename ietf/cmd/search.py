@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+from ietf.sql.rfc import display_options
+from ietf.utility.body import body_path, search as search_bodies
+from ietf.utility.cache import cached
+from ietf.utility.environment import (
+    get_db_path,
+    get_db_session,
+    get_editor,
+    get_file,
+    get_pager,
+)
+from ietf.utility.query_doc import query_rfcs
+from ietf.utility.query_search import query_search
+from sqlalchemy.exc import OperationalError
+from subprocess import run
+import os
+import sqlite3
+import sys
+
+
+@cached
+def get_rfcs(args):
+    """Get the RFCs best matching the passed search terms."""
+    if args.body:
+        get_body_matches(args)
+    Session = get_db_session()
+    query = query_search(Session, args.term, display_options())
+    try:
+        rfcs = query.limit(args.limit).all()
+    except OperationalError as error:  # FTS5 rejected the query
+        print("Invalid search '{}': {}".format(' '.join(args.term),
+                                               error.orig))
+        sys.exit(2)
+    show_docs(rfcs, args.editor, args.pager)  # Display found documents
+    # Exit successfully
+    sys.exit(0)
+
+
+def get_body_matches(args):
+    """Get the RFCs whose text best matches the passed search terms."""
+    path = body_path(get_db_path())
+    if not os.path.isfile(path):
+        print("The body index at '{}' does not exist.  "
+              "Run the `mirror` subcommand to create it."
+              .format(path))
+        sys.exit(1)
+    try:
+        matches = search_bodies(path, ' '.join(args.term), args.limit)
+    except sqlite3.OperationalError as error:  # FTS5 rejected the query
+        print("Invalid search '{}': {}".format(' '.join(args.term), error))
+        sys.exit(2)
+    if args.editor or args.pager:
+        # Open the files of the matching RFCs
+        found = query_rfcs(get_db_session(),
+                           [match.rfc_id for match in matches])
+        show_docs([found[match.rfc_id] for match in matches
+                   if found[match.rfc_id] is not None],
+                  args.editor, args.pager)
+    else:
+        for match in matches:
+            print('RFC {}, byte {}: {}'.format(*match))
+    # Exit successfully
+    sys.exit(0)
+
+
+def show_docs(docs, edit, page):
+    """Display the passed documents."""
+    # Get the command to run (if any)
+    if edit:
+        cmd = get_editor()
+    elif page:
+        cmd = get_pager()
+    # Run `cmd` on the passed docs if `cmd` exists.
+    if 'cmd' in vars():
+        added_to_cmd = False  # To see if any files actually exist
+        for doc in docs:
+            file_path = get_file(doc)  # Get the doc's plaintext file
+            if file_path:
+                added_to_cmd = True  # We have a reason to run `cmd`
+                cmd.append(file_path)  # Add the path as an argument to `cmd`
+        if added_to_cmd:
+            run(cmd)  # Block while running external process
+    # Otherwise print to stdout
+    else:
+        for doc in docs:
+            print(doc)
+            print()  # newline
+
+
+def add_subparser(parent_parser):
+    """Create the parser for the `search` subcommand."""
+    parser = parent_parser.add_parser(
+        'search',
+        help='search RFCs by title, abstract, keyword and author',
+    )
+
+    # Add mutually exclusive group for pager and editor
+    view_group = parser.add_mutually_exclusive_group()
+    view_group.add_argument(
+        '-e', '--editor',
+        action='store_true',
+        help='open RFC files in $EDITOR',
+    )
+    view_group.add_argument(
+        '-p', '--pager',
+        action='store_true',
+        help='open RFC files in $PAGER',
+    )
+
+    parser.add_argument(
+        '-b', '--body',
+        action='store_true',
+        help='search the text of the mirrored RFCs instead, showing where '
+             'in each file the best match is',
+    )
+
+    parser.add_argument(
+        '-n', '--limit',
+        type=int,
+        default=20,
+        help='show at most this many RFCs (default: %(default)s)',
+    )
+
+    # Required search terms
+    parser.add_argument(
+        'term',
+        type=str,
+        nargs='+',
+        help='term to search for: a word, a prefix such as `crypt*`, '
+             'a "quoted phrase" or any other FTS5 query',
+    )
+
+    # Pass arguments to `get_rfcs()`
+    parser.set_defaults(func=get_rfcs)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+from contextlib import redirect_stderr, redirect_stdout
+from ietf.utility.client import socket_path
+from ietf.utility.environment import get_db_path, get_db_session
+from ietf.utility.graph import load as load_graph
+import argparse
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import traceback
+
+# Subcommands that must run in the calling process
+_LOCAL_SUBCOMMANDS = ('mirror', 'serve')
+
+
+def _exit_status(code) -> int:
+    """Return the exit status the interpreter would use for `code`."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def run_command(parser: argparse.ArgumentParser, argv) -> dict:
+    """Run `argv` with `parser` and return the reply to send to the client.
+
+    The reply asks the client to run the command itself when it opens
+    $EDITOR or $PAGER, or cannot be served at all.
+    """
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            args = parser.parse_args(argv)
+            if (args.subcommand in _LOCAL_SUBCOMMANDS or
+                    getattr(args, 'editor', False) or
+                    getattr(args, 'pager', False)):
+                return {'local': True}
+            args.func(args)
+            status = 0
+        except SystemExit as stop:
+            status = _exit_status(stop.code)
+        except Exception:
+            traceback.print_exc()
+            status = 1
+    return {'status': status,
+            'stdout': stdout.getvalue(),
+            'stderr': stderr.getvalue()}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline().decode('utf-8'))
+            argv = [str(arg) for arg in request['argv']]
+        except (ValueError, KeyError, TypeError):
+            return  # Not a client; hang up
+        reply = run_command(self.server.parser, argv)
+        self.wfile.write(json.dumps(reply).encode('utf-8'))
+
+
+class Server(socketserver.UnixStreamServer):
+    """Run the commands of clients connecting to a Unix socket, one at a
+    time, in this process.
+    """
+
+    def __init__(self, path: str, parser: argparse.ArgumentParser):
+        self.parser = parser
+        old_umask = os.umask(0o177)  # Only the owner may connect
+        try:
+            super().__init__(path, _Handler)
+        finally:
+            os.umask(old_umask)
+
+    def server_close(self):
+        super().server_close()
+        try:
+            os.remove(self.server_address)
+        except FileNotFoundError:
+            pass
+
+
+def _remove_stale_socket(path: str):
+    """Remove the socket at `path` unless a server is listening on it."""
+    if not os.path.exists(path):
+        return
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            probe.connect(path)
+    except OSError:  # Left behind by a server that is gone
+        os.remove(path)
+        return
+    print("`ietf serve` is already listening on '{}'.".format(path))
+    sys.exit(1)
+
+
+def _stop(signum, frame):
+    sys.exit(0)
+
+
+def serve(args):
+    """Keep the DB and document graph loaded and answer `ietf` commands
+    forwarded over a Unix socket.
+    """
+    from ietf.cmd import build_parser
+    path = socket_path()
+    _remove_stale_socket(path)
+    # Warm up the engine, its schema check and the document graph
+    db_session = get_db_session()
+    load_graph(db_session.connection(), get_db_path())
+    db_session.close()
+    server = Server(path, build_parser())
+    signal.signal(signal.SIGTERM, _stop)
+    print("Listening on '{}'.".format(path))
+    sys.stdout.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def add_subparser(subparsers: argparse._SubParsersAction):
+    """Create the parser for the `serve` subcommand."""
+    parser = subparsers.add_parser(
+        'serve',
+        help='answer later commands from a long-running process')
+    parser.set_defaults(func=serve)
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+from ietf.sql.base import Base
+from sqlalchemy import Column, Integer, String
+
+
+class Fingerprint(Base):
+    """Digest of an rfc-index.xml entry as of the last time it was loaded."""
+    __tablename__ = 'fingerprint'
+
+    entry_type = Column(String, primary_key=True)  # e.g. 'rfc-entry'
+    doc_id = Column(Integer, primary_key=True)
+    digest = Column(String, nullable=False)
+
+    def __repr__(self):
+        return "<Fingerprint(entry_type='{}', doc_id={}, digest='{}')>"\
+            .format(self.entry_type, self.doc_id, self.digest)
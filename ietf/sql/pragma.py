@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Settings applied to every new SQLite connection, grouped in profiles by
+the way the connection is used.
+
+Any setting of a profile can be overridden through the environment variable
+named in `ENV_VARS`, as comma-separated `name=value` pairs; an empty value
+leaves SQLite's default in place.  For example:
+
+    IETF_SQLITE_READ='mmap_size=0,cache_size=-8192' ietf rfc 2119
+"""
+from sqlalchemy import event
+from typing import Dict, Optional
+import os
+import re
+import sqlalchemy.engine
+import sys
+
+# Value of `mmap_size` mapping the whole DB into memory
+AUTO = 'auto'
+
+# Upper bound of an `AUTO` memory map
+MAX_MMAP_BYTES = 1 << 30
+
+PROFILES = {
+    # Read-only queries from the CLI and the serve daemon
+    'read': (('query_only', 'ON'),
+             ('temp_store', 'MEMORY'),
+             ('cache_size', -64 * 1024),  # In KiB, so 64 MiB
+             ('mmap_size', AUTO)),
+    # Writes to a shadow DB, which is rebuilt from scratch if a crash loses
+    # it, so durability is traded for speed
+    'build': (('journal_mode', 'OFF'),
+              ('synchronous', 'OFF'),
+              ('temp_store', 'MEMORY'),
+              ('cache_size', -256 * 1024)),
+}
+
+ENV_VARS = {profile: 'IETF_SQLITE_{}'.format(profile.upper())
+            for profile in PROFILES}
+
+_SETTING_RE = re.compile(r'^\s*([a-z_]+)\s*=\s*(-?\w*)\s*$')
+
+
+def parse(value: str) -> Dict[str, str]:
+    """Return the settings in the comma-separated `name=value` pairs of
+    `value`, or raise ValueError.
+    """
+    settings = {}
+    for pair in value.split(','):
+        if not pair.strip():
+            continue
+        match = _SETTING_RE.match(pair)
+        if match is None:
+            raise ValueError('invalid setting {!r}'.format(pair.strip()))
+        settings[match.group(1)] = match.group(2)
+    return settings
+
+
+def _mmap_size(db_path: Optional[str]) -> int:
+    """Return the size of the DB at `db_path` rounded up to a whole MiB,
+    capped at `MAX_MMAP_BYTES`.
+    """
+    if db_path is None:
+        return 0
+    try:
+        size = os.path.getsize(db_path)
+    except OSError:
+        return 0
+    mebibyte = 1 << 20
+    return min(-(-size // mebibyte) * mebibyte, MAX_MMAP_BYTES)
+
+
+def get_pragmas(profile: str, db_path: Optional[str] = None):
+    """Return the (name, value) settings of `profile` for the DB at
+    `db_path`, with the overrides of its environment variable applied.
+
+    Exit 2 if the environment variable cannot be parsed.
+    """
+    settings = dict(PROFILES[profile])
+    env_var = ENV_VARS[profile]
+    try:
+        settings.update(parse(os.environ.get(env_var, '')))
+    except ValueError as error:
+        print('Cannot parse ${}: {}.'.format(env_var, error))
+        sys.exit(2)
+    pragmas = []
+    for name, value in settings.items():
+        if value == '':
+            continue
+        if name == 'mmap_size' and value == AUTO:
+            value = _mmap_size(db_path)
+        pragmas.append((name, value))
+    return pragmas
+
+
+def listen(engine: sqlalchemy.engine.Engine, profile: str,
+           db_path: Optional[str] = None) -> sqlalchemy.engine.Engine:
+    """Apply the settings of `profile` to every new connection of `engine`
+    and return `engine`.
+    """
+    pragmas = get_pragmas(profile, db_path)
+
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas:
+            cursor.execute('PRAGMA {} = {}'.format(name, value))
+        cursor.close()
+
+    event.listen(engine, 'connect', set_pragmas)
+    return engine
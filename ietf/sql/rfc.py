@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
 from ietf.sql.base import Base
 from ietf.xml.enum import DocumentType, FileType, Status, Stream
-from sqlalchemy import (BigInteger, Column, Enum, ForeignKey, Integer, String,
-                        Table,)
-from sqlalchemy.orm import relationship
+from sqlalchemy import (BigInteger, Column, Enum, ForeignKey, Index, Integer,
+                        String, Table,)
+from sqlalchemy.orm import relationship, selectinload
 
 
 class Abstract(Base):
@@ -11,7 +11,7 @@ class Abstract(Base):
 
     id = Column(Integer, primary_key=True)
     par = Column(String, nullable=False)
-    rfc_id = Column(Integer, ForeignKey('rfc.id'))
+    rfc_id = Column(Integer, ForeignKey('rfc.id'), index=True)
 
     rfc = relationship('Rfc', back_populates='abstract')
 
@@ -27,14 +27,22 @@ class Author(Base):
     __tablename__ = 'author'
 
     id = Column(Integer, primary_key=True)
-    name = Column(String, nullable=False)  # no `minOccurs` in XSD
-    title = Column(String)
-    organization = Column(String)
-    org_abbrev = Column(String)
-    rfc_id = Column(Integer, ForeignKey('rfc.id'))
+    name = Column(String, nullable=False, index=True)  # no `minOccurs` in XSD
+    title = Column(String, index=True)
+    organization = Column(String, index=True)
+    org_abbrev = Column(String, index=True)
+    rfc_id = Column(Integer, ForeignKey('rfc.id'), index=True)
 
     rfc = relationship('Rfc', back_populates='authors')
 
+    # Case-insensitive indexes for the LIKE lookups in `query_author`
+    __table_args__ = (
+        Index('ix_author_name_nocase', name.collate('NOCASE')),
+        Index('ix_author_title_nocase', title.collate('NOCASE')),
+        Index('ix_author_organization_nocase', organization.collate('NOCASE')),
+        Index('ix_author_org_abbrev_nocase', org_abbrev.collate('NOCASE')),
+    )
+
     def __repr__(self):
         """String representation of object."""
         representation = self.name
@@ -54,7 +62,7 @@ class FileFormat(Base):
     filetype = Column(Enum(FileType), nullable=False)
     char_count = Column(BigInteger, nullable=False)
     page_count = Column(Integer)
-    rfc_id = Column(Integer, ForeignKey('rfc.id'))
+    rfc_id = Column(Integer, ForeignKey('rfc.id'), index=True)
 
     rfc = relationship('Rfc', back_populates='formats')
 
@@ -72,10 +80,13 @@ class IsAlso(Base):
     id = Column(Integer, primary_key=True)
     doc_id = Column(Integer, nullable=False)
     doc_type = Column(Enum(DocumentType), nullable=False)
-    rfc_id = Column(Integer, ForeignKey('rfc.id'))
+    rfc_id = Column(Integer, ForeignKey('rfc.id'), index=True)
 
     rfc = relationship('Rfc', back_populates='is_also')
 
+    # Lookup of the RFCs that are also a given BCP, FYI or STD
+    __table_args__ = (Index('ix_is_also_doc', 'doc_type', 'doc_id'),)
+
     def __repr__(self):
         return "{} {}".format(self.doc_type.value, self.doc_id)
 
@@ -85,7 +96,8 @@ rfc_keyword = Table(
     'rfc_keyword',
     Base.metadata,
     Column('rfc_id', ForeignKey('rfc.id'), primary_key=True),
-    Column('keyword_id', ForeignKey('keyword.id'), primary_key=True)
+    Column('keyword_id', ForeignKey('keyword.id'), primary_key=True,
+           index=True)
 )
 
 
@@ -113,7 +125,7 @@ class ObsoletedBy(Base):
     id = Column(Integer, primary_key=True)
     doc_id = Column(Integer, nullable=False)
     doc_type = Column(Enum(DocumentType), nullable=False)
-    rfc_id = Column(Integer, ForeignKey('rfc.id'))
+    rfc_id = Column(Integer, ForeignKey('rfc.id'), index=True)
 
     rfc = relationship('Rfc', back_populates='obsoleted_by')
 
@@ -127,7 +139,7 @@ class Obsoletes(Base):
     id = Column(Integer, primary_key=True)
     doc_id = Column(Integer, nullable=False)
     doc_type = Column(Enum(DocumentType), nullable=False)
-    rfc_id = Column(Integer, ForeignKey('rfc.id'))
+    rfc_id = Column(Integer, ForeignKey('rfc.id'), index=True)
 
     rfc = relationship('Rfc', back_populates='obsoletes')
 
@@ -141,7 +153,7 @@ class SeeAlso(Base):
     id = Column(Integer, primary_key=True)
     doc_id = Column(Integer, nullable=False)
     doc_type = Column(Enum(DocumentType), nullable=False)
-    rfc_id = Column(Integer, ForeignKey('rfc.id'))
+    rfc_id = Column(Integer, ForeignKey('rfc.id'), index=True)
 
     rfc = relationship('Rfc', back_populates='see_also')
 
@@ -154,7 +166,7 @@ class Stream(Base):
 
     id = Column(Integer, primary_key=True)
     stream = Column(Enum(Stream), nullable=False)
-    rfc_id = Column(Integer, ForeignKey('rfc.id'))
+    rfc_id = Column(Integer, ForeignKey('rfc.id'), index=True)
 
     rfc = relationship('Rfc', back_populates='stream')
 
@@ -171,7 +183,7 @@ class UpdatedBy(Base):
     id = Column(Integer, primary_key=True)
     doc_id = Column(Integer, nullable=False)
     doc_type = Column(Enum(DocumentType), nullable=False)
-    rfc_id = Column(Integer, ForeignKey('rfc.id'))
+    rfc_id = Column(Integer, ForeignKey('rfc.id'), index=True)
 
     rfc = relationship('Rfc', back_populates='updated_by')
 
@@ -185,7 +197,7 @@ class Updates(Base):
     id = Column(Integer, primary_key=True)
     doc_id = Column(Integer, nullable=False)
     doc_type = Column(Enum(DocumentType), nullable=False)
-    rfc_id = Column(Integer, ForeignKey('rfc.id'))
+    rfc_id = Column(Integer, ForeignKey('rfc.id'), index=True)
 
     rfc = relationship('Rfc', back_populates='updates')
 
@@ -357,3 +369,19 @@ class Rfc(Base):
 
         # Return a string of list_repr's elements joined using newlines
         return '\n'.join(list_repr)
+
+
+# Collections shown by `Rfc.__repr__`
+_DISPLAYED = ('authors', 'formats', 'keywords', 'abstract', 'obsoletes',
+              'obsoleted_by', 'updates', 'updated_by', 'is_also', 'see_also',
+              'stream')
+
+
+def display_options():
+    """Return the loader options for a query of Rfc objects that are about to
+    be displayed.
+
+    Every collection shown by `Rfc.__repr__` is loaded with one batched
+    SELECT per collection instead of one lazy SELECT per RFC and collection.
+    """
+    return [selectinload(getattr(Rfc, name)) for name in _DISPLAYED]
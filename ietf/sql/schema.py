@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+from ietf.sql import search
+from ietf.sql.base import Base
+from sqlalchemy import Column, Integer
+import sqlalchemy.engine
+import sqlalchemy.exc
+
+# Version of the schema, tables and indexes, that `upgrade` brings DBs to.
+# Bump it whenever a table or index is added.
+SCHEMA_VERSION = 2
+
+
+class SchemaVersion(Base):
+    __tablename__ = 'schema_version'
+
+    version = Column(Integer, primary_key=True)
+
+
+def get_version(connection: sqlalchemy.engine.Connection):
+    """Return the schema version stamped on the DB, or None if it has none.
+    """
+    try:
+        # Plain SQL, which is cheaper to run once than to compile
+        return connection.exec_driver_sql(
+            'SELECT version FROM schema_version'
+        ).scalar()
+    except sqlalchemy.exc.OperationalError:  # No `schema_version` table
+        return None
+
+
+def is_current(connection: sqlalchemy.engine.Connection) -> bool:
+    """Return whether the DB is stamped with `SCHEMA_VERSION` or later."""
+    version = get_version(connection)
+    return version is not None and version >= SCHEMA_VERSION
+
+
+def create_indexes(connection: sqlalchemy.engine.Connection):
+    """Create every index declared on the models that is missing from the DB.
+
+    `Base.metadata.create_all` only creates the indexes of tables it creates,
+    so DBs built before an index was declared need this to catch up.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+
+def upgrade(connection: sqlalchemy.engine.Connection):
+    """Bring the tables and indexes of the DB up to date, rebuild the
+    full-text index, refresh the statistics the query planner uses to pick
+    between indexes, and stamp the DB with `SCHEMA_VERSION`.
+    """
+    Base.metadata.create_all(connection, checkfirst=True)
+    create_indexes(connection)
+    search.rebuild(connection)
+    connection.exec_driver_sql('ANALYZE')
+    connection.execute(SchemaVersion.__table__.delete())
+    connection.execute(SchemaVersion.__table__.insert(),
+                       {'version': SCHEMA_VERSION})
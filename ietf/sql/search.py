@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+from sqlalchemy import column, func, literal_column, table
+import sqlalchemy.engine
+
+# Columns of the full-text index, with their weight in the bm25 ranking
+COLUMNS = (('title', 10.0),
+           ('abstract', 1.0),
+           ('keywords', 5.0),
+           ('authors', 2.0))
+
+# FTS5 table indexing every RFC under its ID as rowid.  The porter tokenizer
+# matches the variants of each word, and the prefix indexes speed up
+# queries such as `crypt*`.
+_CREATE = (
+    'CREATE VIRTUAL TABLE IF NOT EXISTS rfc_search USING fts5('
+    '{}, tokenize = \'porter unicode61\', prefix = \'2 3\')'.format(
+        ', '.join(name for name, _ in COLUMNS))
+)
+
+_FILL = '''
+INSERT INTO rfc_search (rowid, title, abstract, keywords, authors)
+SELECT rfc.id,
+       rfc.title,
+       (SELECT group_concat(par, ' ') FROM abstract
+        WHERE abstract.rfc_id = rfc.id),
+       (SELECT group_concat(word, ' ') FROM keyword
+        JOIN rfc_keyword ON rfc_keyword.keyword_id = keyword.id
+        WHERE rfc_keyword.rfc_id = rfc.id),
+       (SELECT group_concat(name, ', ') FROM author
+        WHERE author.rfc_id = rfc.id)
+FROM rfc
+'''
+
+# The FTS5 table, for use in queries
+rfc_search = table('rfc_search', column('rowid'), column('rfc_search'))
+
+
+def rebuild(connection: sqlalchemy.engine.Connection):
+    """Create the full-text index if it is missing and fill it with the
+    RFCs currently in the DB.
+    """
+    connection.exec_driver_sql(_CREATE)
+    connection.exec_driver_sql('DELETE FROM rfc_search')
+    connection.exec_driver_sql(_FILL)
+    # Merge the index into as few b-trees as possible for faster queries
+    connection.exec_driver_sql(
+        "INSERT INTO rfc_search (rfc_search) VALUES ('optimize')"
+    )
+
+
+def rank():
+    """Return the bm25 score of the matched RFC; lower is better."""
+    return func.bm25(literal_column('rfc_search'),
+                     *(weight for _, weight in COLUMNS))
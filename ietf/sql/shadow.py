@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Build a new version of a DB next to it and swap it in atomically, so
+that readers only ever see a complete DB.
+"""
+from contextlib import contextmanager
+from ietf.sql.pragma import listen
+from sqlalchemy import create_engine
+from sqlalchemy.engine import URL
+from urllib.parse import quote
+import os
+import sqlite3
+import sqlalchemy.engine
+
+
+def shadow_path(db_path: str) -> str:
+    """Return the path the next version of the DB at `db_path` is built at.
+    """
+    return db_path + '.build'
+
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _fsync(path: str, flags: int = os.O_RDONLY):
+    descriptor = os.open(path, flags)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+def _vacuum_into(source: str, target: str, read_only: bool = False):
+    """Write a compacted copy of the DB at `source` to `target`."""
+    _remove(target)  # VACUUM INTO refuses to overwrite
+    uri = 'file:{}{}'.format(quote(source), '?mode=ro' if read_only else '')
+    connection = sqlite3.connect(uri, uri=True)
+    try:
+        connection.execute('VACUUM INTO ?', (target,))
+    finally:
+        connection.close()
+
+
+def build_engine(path: str) -> sqlalchemy.engine.Engine:
+    """Return an engine writing to the shadow DB at `path` with the 'build'
+    settings of `ietf.sql.pragma`.
+    """
+    return listen(create_engine(URL.create('sqlite', database=path)),
+                  'build')
+
+
+def publish(path: str, db_path: str):
+    """Replace the DB at `db_path` with a compacted copy of the shadow DB at
+    `path`, then remove the shadow.
+
+    The copy is flushed to disk before it atomically replaces the DB, and
+    the directory is flushed after, so that a crash leaves either the old
+    or the new DB in place.
+    """
+    new_path = db_path + '.new'
+    _vacuum_into(path, new_path)
+    _fsync(new_path)
+    os.replace(new_path, db_path)
+    _fsync(os.path.dirname(os.path.abspath(db_path)))
+    _remove(path)
+
+
+@contextmanager
+def shadow_build(db_path: str):
+    """Yield an engine for a shadow copy of the DB at `db_path`, then swap
+    the shadow in for the DB.
+
+    The shadow starts as a copy of the current DB, if there is one, so that
+    it can be updated incrementally.  If the block raises, the shadow is
+    discarded and the DB left untouched.
+    """
+    path = shadow_path(db_path)
+    if os.path.isfile(db_path):
+        _vacuum_into(db_path, path, read_only=True)
+    else:
+        _remove(path)  # Left behind by a build that crashed
+    engine = build_engine(path)
+    try:
+        yield engine
+        engine.dispose()
+        publish(path, db_path)
+    except BaseException:
+        engine.dispose()
+        _remove(path)
+        _remove(db_path + '.new')
+        raise
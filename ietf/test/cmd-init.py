@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+import os
+import subprocess
+import sys
+import unittest
+
+import ietf.cmd as cmd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+
+# Report the modules imported by running `ietf` with the given arguments
+_IMPORTED = '''
+import sys
+from ietf.cmd import main
+try:
+    main(sys.argv[1:])
+except SystemExit:
+    pass
+print(' '.join(sorted(sys.modules)), file=sys.stderr)
+'''
+
+
+def imported_modules(*argv):
+    """Return the modules imported by `ietf argv` in a new interpreter."""
+    process = subprocess.run(
+        [sys.executable, '-c', _IMPORTED] + list(argv),
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, cwd=ROOT,
+        env=dict(os.environ, PYTHONPATH=ROOT), universal_newlines=True,
+    )
+    return set(process.stderr.splitlines()[-1].split())
+
+
+class TestLazyImports(unittest.TestCase):
+
+    def test_find_subcommand(self):
+        self.assertEqual(['rfc'], cmd.find_subcommand(['rfc', '2119']))
+        self.assertEqual(['rfc'], cmd.find_subcommand(['-h', 'rfc']))
+        self.assertEqual([], cmd.find_subcommand(['--help']))
+        self.assertEqual([], cmd.find_subcommand(['bogus', 'rfc']))
+
+    def test_same_help(self):
+        self.assertEqual(cmd.build_parser().format_help(),
+                         cmd.build_parser([]).format_help())
+
+    def test_help_imports_no_subcommand(self):
+        modules = imported_modules('--help')
+        self.assertNotIn('sqlalchemy', modules)
+        self.assertNotIn('xdg', modules)
+        self.assertFalse({module for module, _ in cmd.SUBCOMMANDS.values()}
+                         & modules)
+
+    def test_subcommand_imports_only_its_module(self):
+        modules = imported_modules('rfc', '--help')
+        self.assertIn('ietf.cmd.rfc', modules)
+        self.assertNotIn('ietf.cmd.author', modules)
+        self.assertNotIn('ietf.cmd.mirror', modules)
+
+
+if __name__ == '__main__':
+    unittest.main()
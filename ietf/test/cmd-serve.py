@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import threading
+import unittest
+
+from ietf.cmd import serve
+from ietf.utility import client
+
+
+def echo(args):
+    print(' '.join(args.word))
+    if args.word == ['fail']:
+        raise ValueError('failed')
+    if args.word == ['stop']:
+        raise SystemExit(3)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='ietf')
+    subparsers = parser.add_subparsers(dest='subcommand')
+    subparsers.required = True
+    for name in ('echo', 'mirror'):
+        subparser = subparsers.add_parser(name)
+        subparser.add_argument('-p', '--pager', action='store_true')
+        subparser.add_argument('word', nargs='+')
+        subparser.set_defaults(func=echo)
+    return parser
+
+
+class TestServe(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, client.SOCKET_NAME)
+        self.server = serve.Server(self.path, build_parser())
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.thread.join()
+        self.server.server_close()
+        self.tmp_dir.cleanup()
+
+    def forward(self, argv):
+        """Forward `argv` and return its exit status and output."""
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            with contextlib.redirect_stderr(stderr):
+                status = client.forward(argv, self.path)
+        return status, stdout.getvalue(), stderr.getvalue()
+
+    def test_forward(self):
+        self.assertEqual((0, 'hello world\n', ''),
+                         self.forward(['echo', 'hello', 'world']))
+        self.assertEqual((3, 'stop\n', ''), self.forward(['echo', 'stop']))
+        status, stdout, stderr = self.forward(['echo', 'fail'])
+        self.assertEqual((1, 'fail\n'), (status, stdout))
+        self.assertIn('ValueError: failed', stderr)
+        status, stdout, stderr = self.forward(['bogus'])
+        self.assertEqual((2, ''), (status, stdout))
+        self.assertIn('invalid choice', stderr)
+
+    def test_run_locally(self):
+        # Commands that need the terminal, and `mirror`, are not served
+        self.assertEqual((None, '', ''),
+                         self.forward(['echo', '--pager', 'hello']))
+        self.assertEqual((None, '', ''), self.forward(['mirror', 'hello']))
+        # Nor is anything when no server is running
+        missing = os.path.join(self.tmp_dir.name, 'missing.sock')
+        self.assertIsNone(client.forward(['echo', 'hello'], missing))
+
+    def test_socket(self):
+        self.assertEqual(0o600, os.stat(self.path).st_mode & 0o777)
+        stale = os.path.join(self.tmp_dir.name, 'stale.sock')
+        serve.Server(stale, build_parser()).socket.close()  # Not removed
+        self.assertTrue(os.path.exists(stale))
+        serve._remove_stale_socket(stale)
+        self.assertFalse(os.path.exists(stale))
+        # A live server is left alone
+        with contextlib.redirect_stdout(io.StringIO()):
+            with self.assertRaises(SystemExit):
+                serve._remove_stale_socket(self.path)
+        self.assertTrue(os.path.exists(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
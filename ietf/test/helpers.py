@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""Helpers shared by the tests."""
+from contextlib import contextmanager
+from ietf.sql.base import Base
+from sqlalchemy import event
+import sqlalchemy.engine
+
+
+def dump(engine: sqlalchemy.engine.Engine) -> dict:
+    """Return every row of every table in the DB bound to `engine`."""
+    rows = {}
+    with engine.connect() as connection:
+        for table in Base.metadata.sorted_tables:
+            rows[table.name] = connection.execute(
+                table.select().order_by(*table.primary_key.columns)
+            ).fetchall()
+    return rows
+
+
+@contextmanager
+def count_statements(engine: sqlalchemy.engine.Engine):
+    """Yield a list that collects the SQL of every statement `engine` runs
+    until the block ends.
+    """
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', count)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', count)
@@ -1,12 +1,21 @@
 #!/usr/bin/env python3
+import argparse
 import os
+import sqlite3
+import stat
 import sys
+import tempfile
 import unittest
+from unittest import mock
+from ietf.cmd import mirror
 from ietf.cmd.mirror import assemble_rsync
+from ietf.sql.schema import SCHEMA_VERSION
+from ietf.utility.manifest import Changes
 
 
 class TestAssembleRsync(unittest.TestCase):
-    boilerplate = ['rsync', '-az', '--delete-during']
+    boilerplate = ['rsync', '-az', '--delete-during', '--info=progress2',
+                   '--out-format=%i %n']
 
     rsync_no_path = (('charter', boilerplate +
                       ['ietf.org::everything-ftp/ietf/']),
@@ -57,5 +66,126 @@ class TestAssembleRsync(unittest.TestCase):
             self.assertEqual(expected_path, returned_path)
 
 
+
+class TestCreateDb(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.top_dir = self.tmp_dir.name
+        self.db_path = os.path.join(self.top_dir, 'rfc-index.sqlite3')
+        connection = sqlite3.connect(self.db_path)
+        with connection:
+            connection.execute(
+                'CREATE TABLE schema_version (version INTEGER)')
+            connection.execute('INSERT INTO schema_version VALUES (?)',
+                               (SCHEMA_VERSION,))
+        connection.close()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def create_db(self, changes):
+        """Run `_create_db` and return the mocked stages it ran."""
+        with mock.patch.object(mirror, '_update_db') as update_db, \
+                mock.patch.object(mirror, 'update_body_index') as body, \
+                mock.patch.object(mirror, 'clear_cache'):
+            mirror._create_db(self.top_dir, changes)
+        return update_db, body
+
+    def test_only_deltas(self):
+        update_db, body = self.create_db(
+            Changes({'rfc9999.txt'}, set(), {'rfc1.txt'}))
+        update_db.assert_not_called()
+        self.assertEqual({'rfc9999.txt', 'rfc1.txt'},
+                         body.call_args.kwargs['names'])
+
+    def test_index_changed(self):
+        update_db, body = self.create_db(
+            Changes(set(), {'rfc-index.xml'}, set()))
+        update_db.assert_called_once()
+
+    def test_unknown_changes(self):
+        update_db, body = self.create_db(None)
+        update_db.assert_called_once()
+        self.assertIsNone(body.call_args.kwargs['names'])
+
+    def test_stale_schema(self):
+        # Readers leave upgrading an older DB to `mirror`
+        connection = sqlite3.connect(self.db_path)
+        with connection:
+            connection.execute('DROP TABLE schema_version')
+        connection.close()
+        update_db, body = self.create_db(Changes({'rfc9999.txt'}, set(),
+                                                 set()))
+        update_db.assert_called_once()
+
+
+# Stand-in for rsync that copies the fixture index into the `rfc` mirror and
+# fails the transfers whose URI contains $FAKE_RSYNC_FAIL, `iana` by default
+FAKE_RSYNC = '''#!{python}
+import os, shutil, sys
+uri, dest_dir = sys.argv[-2:]
+if 'in-notes' in uri:
+    shutil.copy({index!r}, dest_dir + '/rfc-index.xml')
+    print('>f+++++++++ rfc-index.xml')
+sys.exit(5 if os.environ.get('FAKE_RSYNC_FAIL', 'iana') in uri else 0)
+'''
+
+
+class TestMirror(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        bin_dir = os.path.join(self.tmp_dir.name, 'bin')
+        os.makedirs(bin_dir)
+        rsync = os.path.join(bin_dir, 'rsync')
+        index = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             'data', 'rfc-index.xml')
+        with open(rsync, 'w') as rsync_file:
+            rsync_file.write(FAKE_RSYNC.format(python=sys.executable,
+                                               index=index))
+        os.chmod(rsync, stat.S_IRWXU)
+        self.path = mock.patch.dict(os.environ, {
+            'PATH': bin_dir + os.pathsep + os.environ['PATH']})
+        self.path.start()
+
+    def tearDown(self):
+        self.path.stop()
+        self.tmp_dir.cleanup()
+
+    def run_mirror(self, top_dir: str) -> int:
+        """Mirror every document type to `top_dir` and return the exit
+        status.
+        """
+        args = argparse.Namespace(dir=top_dir, type=None, flat=False,
+                                  jobs=2, retries=0)
+        with mock.patch('sys.stdout'), self.assertRaises(SystemExit) as stop:
+            mirror.mirror(args)
+        return stop.exception.code
+
+    def test_mirror(self):
+        top_dir = os.path.join(self.tmp_dir.name, 'mirror')
+        self.assertEqual(1, self.run_mirror(top_dir))  # `iana` failed
+        for name in ('rfc-index.sqlite3', 'rfc-index.graph',
+                     'rfc-index.body.sqlite3', 'manifest.sqlite3'):
+            self.assertTrue(os.path.isfile(os.path.join(top_dir, name)))
+
+    def test_rfc_failed(self):
+        top_dir = os.path.join(self.tmp_dir.name, 'mirror')
+        db_path = os.path.join(top_dir, 'rfc-index.sqlite3')
+        with mock.patch.dict(os.environ, {'FAKE_RSYNC_FAIL': 'in-notes'}):
+            # No DB is built from a partial mirror
+            self.assertEqual(1, self.run_mirror(top_dir))
+            self.assertFalse(os.path.exists(db_path))
+            # Nor does one replace the published DB
+            with mock.patch.dict(os.environ, {'FAKE_RSYNC_FAIL': 'iana'}):
+                self.run_mirror(top_dir)
+            published = os.stat(db_path)
+            self.assertEqual(1, self.run_mirror(top_dir))
+        self.assertEqual(published.st_ino, os.stat(db_path).st_ino)
+        self.assertEqual(published.st_mtime_ns,
+                         os.stat(db_path).st_mtime_ns)
+
+
 if __name__ == '__main__':
     unittest.main()
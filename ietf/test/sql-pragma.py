@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from ietf.sql import pragma
+from sqlalchemy import create_engine
+from sqlalchemy.engine import URL
+
+
+class TestPragma(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, 'rfc-index.sqlite3')
+        with open(self.db_path, 'wb') as db_file:
+            db_file.truncate(3 << 20)  # Size only matters for the mmap
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_parse(self):
+        self.assertEqual({'cache_size': '-8192', 'mmap_size': ''},
+                         pragma.parse(' cache_size = -8192, mmap_size=,'))
+        self.assertEqual({}, pragma.parse(''))
+        for value in ('cache_size', 'cache_size=1; DROP TABLE rfc',
+                      'Cache Size=1'):
+            with self.assertRaises(ValueError):
+                pragma.parse(value)
+
+    def test_mmap_sized_to_db(self):
+        pragmas = dict(pragma.get_pragmas('read', self.db_path))
+        self.assertEqual(3 << 20, pragmas['mmap_size'])
+        with mock.patch.object(pragma, 'MAX_MMAP_BYTES', 1 << 20):
+            pragmas = dict(pragma.get_pragmas('read', self.db_path))
+        self.assertEqual(1 << 20, pragmas['mmap_size'])
+        pragmas = dict(pragma.get_pragmas('read'))
+        self.assertEqual(0, pragmas['mmap_size'])
+
+    def test_environment_overrides(self):
+        environ = {'IETF_SQLITE_READ': 'mmap_size=,cache_size=-100'}
+        with mock.patch.dict(os.environ, environ):
+            pragmas = dict(pragma.get_pragmas('read', self.db_path))
+        self.assertNotIn('mmap_size', pragmas)
+        self.assertEqual('-100', pragmas['cache_size'])
+        with mock.patch.dict(os.environ, {'IETF_SQLITE_BUILD': 'oops'}):
+            with mock.patch('sys.stdout'):
+                with self.assertRaises(SystemExit) as stop:
+                    pragma.get_pragmas('build')
+        self.assertEqual(2, stop.exception.code)
+
+    def test_listen(self):
+        path = os.path.join(self.tmp_dir.name, 'new.sqlite3')
+        engine = pragma.listen(create_engine(URL.create('sqlite',
+                                                        database=path)),
+                               'read', self.db_path)
+        with engine.connect() as connection:
+            for name, value in (('query_only', 1), ('temp_store', 2),
+                                ('cache_size', -64 * 1024),
+                                ('mmap_size', 3 << 20)):
+                self.assertEqual(value, connection.exec_driver_sql(
+                    'PRAGMA {}'.format(name)).scalar())
+        engine.dispose()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,7 +4,8 @@ import unittest
 from ietf.sql.base import Base
 from ietf.sql.rfc import (Abstract, Author, FileFormat, IsAlso, Keyword,
                           ObsoletedBy, Obsoletes, Rfc, SeeAlso, Stream,
-                          UpdatedBy, Updates,)
+                          UpdatedBy, Updates, display_options,)
+from ietf.test.helpers import count_statements
 from ietf.xml.enum import DocumentType, FileType, Status, Stream as StreamEnum
 from ietf.xml.rfc import _add_keyword as add_keyword
 from sqlalchemy import create_engine
@@ -226,6 +227,21 @@ class TestSqlRfc(unittest.TestCase):
             all()
         self.assertEqual([], self.third_query)
 
+    def test_keywords_existing(self):
+        # Commit a keyword through another session
+        other_session = sessionmaker(bind=self.engine)()
+        other_session.add(Keyword('existing'))
+        other_session.commit()
+
+        # The keyword cache is seeded from the rows already in the DB
+        keyword = add_keyword(self.session, 'existing')
+        self.assertIsNotNone(keyword.id)
+        self.assertEqual(1, self.session.query(Keyword).count())
+
+        # Repeated words return the same instance
+        self.assertIs(add_keyword(self.session, 'new'),
+                      add_keyword(self.session, 'new'))
+
     def test_obsoleted_by(self):
         self.assertEqual(0, len(self.rfc0001.obsoleted_by))  # none added
         self.assertEqual(0, len(self.rfc0002.obsoleted_by))  # none added
@@ -436,6 +452,39 @@ class TestSqlRfc(unittest.TestCase):
         self.assertEqual(StreamEnum['LEGACY'],
                          self.rfc0002_query.stream[1].stream)
 
+    def test_display_options(self):
+        # Give every RFC a row in each displayed collection
+        for number in range(3, 50):
+            rfc = Rfc(id=number, title='title for RFC {}'.format(number),
+                      date_month=1, date_year=1,
+                      current_status=Status.UNKNOWN,
+                      publication_status=Status.UNKNOWN)
+            rfc.authors = [Author(name='author of RFC {}'.format(number))]
+            rfc.formats = [FileFormat(filetype=FileType['ASCII'],
+                                      char_count=1)]
+            rfc.keywords = [add_keyword(self.session, 'keyword')]
+            rfc.abstract = [Abstract(par='abstract')]
+            rfc.obsoletes = [Obsoletes(doc_id=1, doc_type=DocumentType.RFC)]
+            rfc.obsoleted_by = [ObsoletedBy(doc_id=2,
+                                            doc_type=DocumentType.RFC)]
+            rfc.updates = [Updates(doc_id=1, doc_type=DocumentType.RFC)]
+            rfc.updated_by = [UpdatedBy(doc_id=2, doc_type=DocumentType.RFC)]
+            rfc.is_also = [IsAlso(doc_id=1, doc_type=DocumentType.BCP)]
+            rfc.see_also = [SeeAlso(doc_id=1, doc_type=DocumentType.RFC)]
+            rfc.stream = [Stream(StreamEnum['IETF'])]
+            self.session.add(rfc)
+        self.session.commit()
+        self.session.expunge_all()  # Start from an empty identity map
+
+        with count_statements(self.engine) as statements:
+            rfcs = self.session.query(Rfc).options(*display_options()).\
+                order_by(Rfc.id).all()
+            text = '\n'.join(repr(rfc) for rfc in rfcs)
+        self.assertEqual(49, len(rfcs))
+        self.assertIn('author of RFC 49', text)
+        # One SELECT for the RFCs plus one per displayed collection
+        self.assertEqual(12, len(statements))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+import unittest
+
+from ietf.sql.base import Base
+from ietf.sql.rfc import Author, IsAlso, Rfc
+from ietf.sql.schema import SCHEMA_VERSION, get_version, upgrade
+from ietf.xml.enum import DocumentType
+from sqlalchemy import create_engine, inspect, select
+
+
+class TestSchema(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine, checkfirst=True)
+
+    def plan(self, connection, query):
+        """Return the query plan of `query` as a single string."""
+        compiled = query.compile(self.engine,
+                                 compile_kwargs={'literal_binds': True})
+        rows = connection.exec_driver_sql(
+            'EXPLAIN QUERY PLAN {}'.format(compiled)
+        )
+        return '\n'.join(row[-1] for row in rows)
+
+    def test_upgrade_creates_missing_indexes(self):
+        # Simulate a DB built before the indexes were declared
+        with self.engine.begin() as connection:
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.drop(connection)
+            upgrade(connection)
+            names = {index['name'] for index in
+                     inspect(connection).get_indexes('author')}
+            self.assertIn('ix_author_rfc_id', names)
+            self.assertIn('ix_author_name_nocase', names)
+            # ANALYZE stored its statistics
+            stat_tables = connection.exec_driver_sql(
+                "SELECT name FROM sqlite_master WHERE name = 'sqlite_stat1'"
+            ).all()
+            self.assertEqual(1, len(stat_tables))
+
+    def test_upgrade_twice(self):
+        with self.engine.begin() as connection:
+            upgrade(connection)
+            upgrade(connection)
+
+    def test_upgrade_stamps_version(self):
+        with self.engine.begin() as connection:
+            self.assertIsNone(get_version(connection))
+            upgrade(connection)
+            upgrade(connection)
+            self.assertEqual(SCHEMA_VERSION, get_version(connection))
+        # DBs without the table at all have no version either
+        engine = create_engine('sqlite:///:memory:')
+        with engine.connect() as connection:
+            self.assertIsNone(get_version(connection))
+
+    def test_author_like_uses_index(self):
+        with self.engine.begin() as connection:
+            upgrade(connection)
+            query = select(Author.rfc_id).where(Author.name.like('Bradner%'))
+            self.assertIn('ix_author_name_nocase',
+                          self.plan(connection, query))
+
+    def test_is_also_uses_index(self):
+        with self.engine.begin() as connection:
+            upgrade(connection)
+            query = select(Rfc.id).join(IsAlso).\
+                where(IsAlso.doc_type == DocumentType.BCP).\
+                where(IsAlso.doc_id == 14)
+            self.assertIn('ix_is_also_doc', self.plan(connection, query))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from ietf.sql import shadow
+
+
+class TestShadowBuild(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, 'rfc-index.sqlite3')
+        connection = sqlite3.connect(self.db_path)
+        with connection:
+            connection.execute('CREATE TABLE rfc (id INTEGER PRIMARY KEY)')
+            connection.execute('INSERT INTO rfc VALUES (1)')
+        connection.close()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def ids(self):
+        connection = sqlite3.connect(self.db_path)
+        try:
+            return [row[0] for row in
+                    connection.execute('SELECT id FROM rfc ORDER BY id')]
+        finally:
+            connection.close()
+
+    def files(self):
+        return sorted(os.listdir(self.tmp_dir.name))
+
+    def test_swap(self):
+        inode = os.stat(self.db_path).st_ino
+        with shadow.shadow_build(self.db_path) as engine:
+            with engine.begin() as connection:
+                # The shadow starts as a copy of the DB and is tuned for speed
+                self.assertEqual(1, connection.exec_driver_sql(
+                    'SELECT count(*) FROM rfc').scalar())
+                self.assertEqual('off', connection.exec_driver_sql(
+                    'PRAGMA journal_mode').scalar())
+                self.assertEqual(0, connection.exec_driver_sql(
+                    'PRAGMA synchronous').scalar())
+                connection.exec_driver_sql('INSERT INTO rfc VALUES (2)')
+            # Readers still see the old DB
+            self.assertEqual([1], self.ids())
+        self.assertEqual([1, 2], self.ids())
+        self.assertNotEqual(inode, os.stat(self.db_path).st_ino)
+        self.assertEqual(['rfc-index.sqlite3'], self.files())
+        # The DB itself is an ordinary, journaled DB
+        connection = sqlite3.connect(self.db_path)
+        self.assertEqual('delete', connection.execute(
+            'PRAGMA journal_mode').fetchone()[0])
+        connection.close()
+
+    def test_failed_build_is_discarded(self):
+        with self.assertRaises(ValueError):
+            with shadow.shadow_build(self.db_path) as engine:
+                with engine.begin() as connection:
+                    connection.exec_driver_sql('DELETE FROM rfc')
+                raise ValueError('build failed')
+        self.assertEqual([1], self.ids())
+        self.assertEqual(['rfc-index.sqlite3'], self.files())
+
+    def test_new_db(self):
+        os.remove(self.db_path)
+        # A shadow left behind by a crash is not reused
+        open(shadow.shadow_path(self.db_path), 'w').close()
+        with shadow.shadow_build(self.db_path) as engine:
+            with engine.begin() as connection:
+                connection.exec_driver_sql('CREATE TABLE rfc (id INTEGER)')
+                connection.exec_driver_sql('INSERT INTO rfc VALUES (3)')
+        self.assertEqual([3], self.ids())
+        self.assertEqual(['rfc-index.sqlite3'], self.files())
+
+
+if __name__ == '__main__':
+    unittest.main()
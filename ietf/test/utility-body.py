@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from ietf.utility import body
+from ietf.utility.manifest import Changes
+
+# Two paragraphs, a page break and a third paragraph
+TEXT = (b'Key words for use in RFCs.\n\n'
+        b'The key words MUST and SHALL are to be interpreted as follows.\n'
+        b'\n\x0c\n'
+        b'Security considerations: none.\n')
+
+
+class TestBody(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.rfc_dir = os.path.join(self.tmp_dir.name, 'rfc')
+        os.makedirs(self.rfc_dir)
+        self.path = body.body_path(
+            os.path.join(self.tmp_dir.name, 'rfc-index.sqlite3'))
+        self.write(2119, TEXT)
+        self.write(8174, b'Uppercase key words only.\n')
+        self.write(1, b'')
+        self.write(2, b'Host software.\n')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write(self, number, data):
+        with open(os.path.join(self.rfc_dir, 'rfc{}.txt'.format(number)),
+                  'wb') as text_file:
+            text_file.write(data)
+
+    def test_split_chunks(self):
+        self.assertEqual([(0, TEXT)], list(body.split_chunks(TEXT)))
+        chunks = list(body.split_chunks(TEXT, chunk_bytes=1))
+        self.assertEqual([0, 28, 94], [offset for offset, _ in chunks])
+        for offset, chunk in chunks:
+            self.assertEqual(chunk, TEXT[offset:offset + len(chunk)])
+        self.assertEqual([], list(body.split_chunks(b'\n\n  \n')))
+
+    def test_iterchunks_in_pool(self):
+        paths = [(number, os.path.join(self.rfc_dir, 'rfc{}.txt'.format(
+            number))) for number in (2119, 1, 8174, 2)]
+        self.assertEqual(list(body.iterchunks(paths, workers=1)),
+                         list(body.iterchunks(paths, workers=2)))
+
+    def test_update_and_search(self):
+        self.assertEqual(4, body.update(self.rfc_dir, self.path, workers=1))
+        matches = body.search(self.path, '"key words"')
+        self.assertEqual([2119, 8174],
+                         sorted(match.rfc_id for match in matches))
+        self.assertEqual([], body.search(self.path, 'missing'))
+        self.assertEqual([(2, 0, '[Host] software.')],
+                         body.search(self.path, 'host'))
+        with self.assertRaises(sqlite3.OperationalError):
+            body.search(self.path, 'AND')
+
+    def test_offsets(self):
+        body.update(self.rfc_dir, self.path, workers=2, chunk_bytes=1)
+        match, = body.search(self.path, 'security')
+        self.assertEqual(2119, match.rfc_id)
+        self.assertTrue(TEXT[match.offset:].startswith(b'Security'))
+        self.assertIn('[Security]', match.snippet)
+
+    def test_incremental(self):
+        body.update(self.rfc_dir, self.path, workers=1)
+        self.assertEqual(0, body.update(self.rfc_dir, self.path, workers=1))
+        self.write(2, b'Protocol software.\n')
+        os.remove(os.path.join(self.rfc_dir, 'rfc8174.txt'))
+        self.assertEqual(1, body.update(self.rfc_dir, self.path, workers=1))
+        self.assertEqual([], body.search(self.path, 'host'))
+        self.assertEqual([2], [match.rfc_id for match in
+                               body.search(self.path, 'protocol')])
+        self.assertEqual([2119], [match.rfc_id for match in
+                                  body.search(self.path, 'key')])
+
+    def test_named_files_only(self):
+        body.update(self.rfc_dir, self.path, workers=1)
+        self.write(2, b'Protocol software.\n')
+        self.write(8174, b'Lowercase key words too.\n')
+        os.remove(os.path.join(self.rfc_dir, 'rfc2119.txt'))
+        # Only the listed files are looked at
+        self.assertEqual(1, body.update(self.rfc_dir, self.path, workers=1,
+                                        names=['rfc2.txt', 'rfc2119.txt',
+                                               'bcp/bcp14.txt']))
+        self.assertEqual([2], [match.rfc_id for match in
+                               body.search(self.path, 'protocol')])
+        self.assertEqual([8174], [match.rfc_id for match in
+                                  body.search(self.path, 'key')])
+        self.assertEqual([], body.search(self.path, 'lowercase'))
+
+    def test_named_files_new_index(self):
+        # The first run after the mirror already held files, or after the
+        # index was lost, must index every file, not just the listed ones
+        changes = Changes({'rfc2.txt'}, set(), set())
+        for _ in range(2):
+            self.assertEqual(4, body.update(self.rfc_dir, self.path,
+                                            workers=1,
+                                            names=changes.paths()))
+            self.assertEqual([2119, 8174], sorted(
+                match.rfc_id for match in body.search(self.path, 'key')))
+            os.remove(self.path)
+        # So must an index whose chunks are gone
+        body.update(self.rfc_dir, self.path, workers=1)
+        connection = sqlite3.connect(self.path)
+        connection.execute('DROP TABLE body')
+        connection.close()
+        self.assertEqual(4, body.update(self.rfc_dir, self.path, workers=1,
+                                        names=changes.paths()))
+        self.assertEqual([2119, 8174], sorted(
+            match.rfc_id for match in body.search(self.path, 'key')))
+
+    def test_limit(self):
+        body.update(self.rfc_dir, self.path, workers=1)
+        self.assertEqual(1, len(body.search(self.path, 'key', limit=1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
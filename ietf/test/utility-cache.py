@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from ietf.utility import cache
+
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, 'rfc-index.sqlite3')
+        with open(self.db_path, 'w') as db_file:
+            db_file.write('version 1')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def open(self, max_bytes=cache.MAX_BYTES):
+        return cache.ResultCache(cache.cache_path(self.db_path), max_bytes)
+
+    def test_get_and_put(self):
+        results = self.open()
+        self.assertIsNone(results.get('key', 'stamp'))
+        results.put('key', 'stamp', 'output')
+        self.assertEqual('output', results.get('key', 'stamp'))
+        # Results of another DB version are never returned
+        self.assertIsNone(results.get('key', 'other stamp'))
+        results.close()
+
+    def test_lru_eviction(self):
+        results = self.open(max_bytes=10)
+        results.put('a', 'stamp', 'aaaa')
+        results.put('b', 'stamp', 'bbbb')
+        results.get('a', 'stamp')  # `b` is now the least recently used
+        results.put('c', 'stamp', 'cccc')
+        self.assertEqual('aaaa', results.get('a', 'stamp'))
+        self.assertIsNone(results.get('b', 'stamp'))
+        self.assertEqual('cccc', results.get('c', 'stamp'))
+        results.close()
+
+    def test_args_key(self):
+        first = argparse.Namespace(subcommand='rfc', number=[1, 2],
+                                   func=print)
+        second = argparse.Namespace(number=[1, 2], subcommand='rfc',
+                                    func=len)
+        third = argparse.Namespace(subcommand='rfc', number=[2, 1],
+                                   func=print)
+        self.assertEqual(cache.args_key(first), cache.args_key(second))
+        self.assertNotEqual(cache.args_key(first), cache.args_key(third))
+
+    def run_command(self, command, args):
+        """Run `command` decorated with `cached` and return its exit status
+        and output.
+        """
+        output = io.StringIO()
+        with mock.patch.object(cache, 'get_db_path',
+                               return_value=self.db_path):
+            with contextlib.redirect_stdout(output):
+                with self.assertRaises(SystemExit) as stop:
+                    cache.cached(command)(args)
+        return stop.exception.code, output.getvalue()
+
+    def test_cached(self):
+        calls = []
+
+        def command(args):
+            calls.append(args)
+            print('RFC {}'.format(args.number))
+            raise SystemExit(0)
+
+        args = argparse.Namespace(number=1, editor=False, pager=False,
+                                  func=command)
+        self.assertEqual((0, 'RFC 1\n'), self.run_command(command, args))
+        self.assertEqual((0, 'RFC 1\n'), self.run_command(command, args))
+        self.assertEqual(1, len(calls))
+        # A new DB invalidates the cached output
+        with open(self.db_path, 'w') as db_file:
+            db_file.write('version 2, rebuilt')
+        self.assertEqual((0, 'RFC 1\n'), self.run_command(command, args))
+        self.assertEqual(2, len(calls))
+        # So does clearing the cache
+        cache.clear(self.db_path)
+        self.assertFalse(os.path.exists(cache.cache_path(self.db_path)))
+        self.run_command(command, args)
+        self.assertEqual(3, len(calls))
+
+    def test_failures_not_cached(self):
+        calls = []
+
+        def command(args):
+            calls.append(args)
+            print('partial')
+            raise SystemExit(2)
+
+        args = argparse.Namespace(editor=False, pager=False)
+        self.assertEqual((2, 'partial\n'), self.run_command(command, args))
+        self.assertEqual((2, 'partial\n'), self.run_command(command, args))
+        self.assertEqual(2, len(calls))
+
+    def test_closed_on_errors(self):
+        def command(args):
+            print('RFC 1')
+            raise SystemExit(0)
+
+        args = argparse.Namespace(number=1, editor=False, pager=False)
+        connection = mock.MagicMock()
+        with mock.patch.object(cache.sqlite3, 'connect',
+                               return_value=connection):
+            # A cache that cannot be read is ignored, then closed
+            connection.execute.side_effect = [
+                None, None, cache.sqlite3.OperationalError('locked')]
+            self.assertEqual((0, 'RFC 1\n'), self.run_command(command, args))
+            connection.close.assert_called_once()
+            # As is one that cannot even be created
+            connection.reset_mock()
+            connection.execute.side_effect = cache.sqlite3.DatabaseError(
+                'file is not a database')
+            self.assertEqual((0, 'RFC 1\n'), self.run_command(command, args))
+            connection.close.assert_called_once()
+        # A command that fails still closes the cache
+        with mock.patch.object(cache.ResultCache, 'close') as close:
+            with self.assertRaises(ValueError):
+                with mock.patch.object(cache, 'get_db_path',
+                                       return_value=self.db_path):
+                    cache.cached(mock.Mock(side_effect=ValueError))(args)
+        close.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
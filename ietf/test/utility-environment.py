@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from ietf.sql.base import Base
+from ietf.sql.schema import SCHEMA_VERSION, get_version, upgrade
+from ietf.utility import environment
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import URL
+from sqlalchemy.exc import OperationalError
+
+
+class TestGetDbEngine(unittest.TestCase):
+
+    def setUp(self):
+        # Characters that have a meaning in URIs must not break the path
+        self.tmp_dir = tempfile.TemporaryDirectory(prefix='ietf #%')
+        self.db_path = os.path.join(self.tmp_dir.name, 'rfc-index.sqlite3')
+        # A DB built before the schema was versioned
+        engine = create_engine(URL.create('sqlite', database=self.db_path))
+        with engine.begin() as connection:
+            connection.exec_driver_sql('CREATE TABLE legacy (id INTEGER)')
+        engine.dispose()
+
+    def tearDown(self):
+        for _, engine in environment._engines.values():
+            engine.dispose()
+        environment._engines.clear()
+        self.tmp_dir.cleanup()
+
+    def stamp(self):
+        """Bring the DB to the current schema, as `mirror` does."""
+        engine = create_engine(URL.create('sqlite', database=self.db_path))
+        with engine.begin() as connection:
+            upgrade(connection)
+        engine.dispose()
+
+    def test_stale_schema_exits(self):
+        with open(self.db_path, 'rb') as db_file:
+            before = db_file.read()
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            with self.assertRaises(SystemExit) as stop:
+                environment.get_db_engine(self.db_path)
+        self.assertEqual(1, stop.exception.code)
+        self.assertIn('mirror', stdout.getvalue())
+        # The DB was not upgraded behind a reader's back
+        with open(self.db_path, 'rb') as db_file:
+            self.assertEqual(before, db_file.read())
+        self.assertEqual({}, environment._engines)
+
+    def test_reads_only(self):
+        self.stamp()
+        engine = environment.get_db_engine(self.db_path)
+        with engine.connect() as connection:
+            self.assertEqual(SCHEMA_VERSION, get_version(connection))
+            for table in Base.metadata.sorted_tables:
+                connection.execute(table.select().limit(1)).all()
+            with self.assertRaises(OperationalError) as caught:
+                connection.execute(text('DELETE FROM legacy'))
+            self.assertIn('readonly', str(caught.exception))
+        self.assertIs(engine, environment.get_db_engine(self.db_path))
+
+    def test_replaced_db_gets_new_engine(self):
+        self.stamp()
+        engine = environment.get_db_engine(self.db_path)
+        new_path = self.db_path + '.new'
+        new_engine = create_engine(URL.create('sqlite', database=new_path))
+        with new_engine.begin() as connection:
+            upgrade(connection)
+        new_engine.dispose()
+        os.replace(new_path, self.db_path)
+        self.assertIsNot(engine, environment.get_db_engine(self.db_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+import os
+import struct
+import tempfile
+import unittest
+from unittest import mock
+
+from ietf.sql.base import Base
+from ietf.sql.bcp import Bcp
+from ietf.sql.rfc import IsAlso, ObsoletedBy, Rfc, UpdatedBy
+from ietf.utility import graph
+from ietf.xml.enum import DocumentType, Status
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+RFC = DocumentType.RFC
+BCP = DocumentType.BCP
+
+
+class TestGraph(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, 'rfc-index.sqlite3')
+        self.engine = create_engine('sqlite:///{}'.format(self.db_path))
+        Base.metadata.create_all(self.engine, checkfirst=True)
+        session = sessionmaker(bind=self.engine)()
+        for number in (1, 2, 3, 4, 10, 11, 20):
+            session.add(Rfc(id=number,
+                            title='title for RFC {}'.format(number),
+                            date_month=1, date_year=1,
+                            current_status=Status.UNKNOWN,
+                            publication_status=Status.UNKNOWN))
+        session.add(Bcp(id=14, title='title for BCP 14'))
+        session.flush()
+        # 1 is obsoleted by 2, which is obsoleted by 3; 10 and 11 by each other
+        for number, doc_id in ((1, 2), (2, 3), (10, 11), (11, 10)):
+            session.add(ObsoletedBy(rfc_id=number, doc_id=doc_id,
+                                    doc_type=RFC))
+        # 1 is updated by 4 and 20, 4 by 3
+        for number, doc_id in ((1, 4), (1, 20), (4, 3)):
+            session.add(UpdatedBy(rfc_id=number, doc_id=doc_id,
+                                  doc_type=RFC))
+        session.add(IsAlso(rfc_id=2, doc_id=14, doc_type=BCP))
+        session.commit()
+        session.close()
+        with self.engine.connect() as connection:
+            self.graph = graph.Graph.from_connection(connection)
+
+    def tearDown(self):
+        self.engine.dispose()
+        self.tmp_dir.cleanup()
+
+    def test_neighbours(self):
+        self.assertEqual([(RFC, 4), (RFC, 20)],
+                         self.graph.neighbours((RFC, 1), 'updated_by'))
+        self.assertEqual([(BCP, 14)],
+                         self.graph.neighbours((RFC, 2), 'is_also'))
+        self.assertEqual([], self.graph.neighbours((RFC, 3), 'updated_by'))
+        self.assertEqual([], self.graph.neighbours((RFC, 99), 'updated_by'))
+        self.assertIn((BCP, 14), self.graph)
+        self.assertNotIn((RFC, 99), self.graph)
+
+    def test_bfs(self):
+        self.assertEqual([((RFC, 1), 0), ((RFC, 2), 1), ((RFC, 4), 1),
+                          ((RFC, 20), 1), ((RFC, 3), 2)],
+                         list(self.graph.bfs((RFC, 1),
+                                             ('obsoleted_by', 'updated_by'))))
+
+    def test_dfs(self):
+        self.assertEqual([((RFC, 1), 0, None),
+                          ((RFC, 2), 1, 'obsoleted_by'),
+                          ((RFC, 3), 2, 'obsoleted_by'),
+                          ((RFC, 4), 1, 'updated_by'),
+                          ((RFC, 20), 1, 'updated_by')],
+                         list(self.graph.dfs((RFC, 1),
+                                             ('obsoleted_by', 'updated_by'))))
+
+    def test_descendants_and_ancestors(self):
+        self.assertEqual([(RFC, 4), (RFC, 20), (RFC, 3)],
+                         self.graph.updated_by((RFC, 1)))
+        self.assertEqual([(RFC, 4), (RFC, 1)],
+                         self.graph.ancestors((RFC, 3), ('updated_by',)))
+        self.assertEqual([(RFC, 2)],
+                         self.graph.ancestors((BCP, 14), ('is_also',)))
+
+    def test_current(self):
+        self.assertEqual((RFC, 3), self.graph.current((RFC, 1)))
+        self.assertEqual((RFC, 3), self.graph.current((RFC, 3)))
+        self.assertEqual((RFC, 99), self.graph.current((RFC, 99)))
+        # Cycles end at the last document before repeating
+        self.assertEqual((RFC, 11), self.graph.current((RFC, 10)))
+
+    def test_save_and_load(self):
+        path = os.path.join(self.tmp_dir.name, 'saved.graph')
+        self.graph.save(path)
+        loaded = graph.Graph.load(path)
+        self.assertEqual(list(self.graph.keys), list(loaded.keys))
+        for name in graph.RELATIONS:
+            self.assertEqual(self.graph.edges[name], loaded.edges[name])
+        # No temporary file is left behind
+        self.assertEqual(['rfc-index.sqlite3', 'saved.graph'],
+                         sorted(os.listdir(self.tmp_dir.name)))
+        # Anything else is not a graph
+        with open(path, 'wb') as graph_file:
+            graph_file.write(b'not a graph')
+        self.assertIsNone(graph.Graph.load(path))
+
+    def test_little_endian(self):
+        path = os.path.join(self.tmp_dir.name, 'saved.graph')
+        self.graph.save(path)
+        with open(path, 'rb') as graph_file:
+            graph_file.seek(graph._HEADER.size)
+            first_key = graph_file.read(8)
+        self.assertEqual(struct.pack('<q', self.graph.keys[0]), first_key)
+        # Arrays are swapped on big-endian hosts, on save and on load
+        with mock.patch.object(graph, '_SWAP', True):
+            self.graph.save(path)
+            loaded = graph.Graph.load(path)
+        self.assertEqual(self.graph.keys, loaded.keys)
+        with open(path, 'rb') as graph_file:
+            graph_file.seek(graph._HEADER.size)
+            self.assertEqual(struct.pack('>q', self.graph.keys[0]),
+                             graph_file.read(8))
+
+    def test_load_truncated(self):
+        path = os.path.join(self.tmp_dir.name, 'saved.graph')
+        self.graph.save(path)
+        size = os.path.getsize(path)
+        for length in (size - 1, graph._HEADER.size + 4):
+            with open(path, 'r+b') as graph_file:
+                graph_file.truncate(length)
+            self.assertIsNone(graph.Graph.load(path))
+
+    def test_load_rebuilds_truncated(self):
+        path = graph.graph_path(self.db_path)
+        with self.engine.connect() as connection:
+            graph.build(connection, self.db_path)
+            with open(path, 'r+b') as graph_file:
+                graph_file.truncate(os.path.getsize(path) // 2)
+            graph._loaded.clear()  # As in a new process
+            loaded = graph.load(connection, self.db_path)
+        self.assertEqual((RFC, 3), loaded.current((RFC, 1)))
+        # The file is left for `mirror` to replace
+        self.assertIsNone(graph.Graph.load(path))
+
+    def test_load_next_to_db(self):
+        path = graph.graph_path(self.db_path)
+        self.assertEqual(os.path.join(self.tmp_dir.name, 'rfc-index.graph'),
+                         path)
+        with self.engine.connect() as connection:
+            # Built in memory, but not saved, when missing
+            loaded = graph.load(connection, self.db_path)
+            self.assertEqual((RFC, 3), loaded.current((RFC, 1)))
+            self.assertFalse(os.path.exists(path))
+            self.assertIs(loaded, graph.load(connection, self.db_path))
+            # Saved by `build` and loaded from the file from then on
+            graph.build(connection, self.db_path)
+            with mock.patch.object(graph.Graph, 'from_connection') as build:
+                loaded = graph.load(connection, self.db_path)
+            build.assert_not_called()
+            self.assertEqual((RFC, 3), loaded.current((RFC, 1)))
+            # A graph older than the DB is ignored but left in place
+            os.utime(path, (0, 0))
+            loaded = graph.load(connection, self.db_path)
+        self.assertEqual(0, os.path.getmtime(path))
+        self.assertEqual((RFC, 3), loaded.current((RFC, 1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
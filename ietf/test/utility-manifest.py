@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+import os
+import tempfile
+import unittest
+
+from ietf.utility import manifest
+
+# Output of `rsync -az --delete-during --out-format='%i %n'`
+ITEMIZED = '''\
+*deleting   rfc1.txt
+*deleting   old/
+cd+++++++++ bcp/
+>f+++++++++ bcp/bcp14.txt
+>f+++++++++ rfc8174.txt
+>f.st...... rfc-index.xml
+>f..t...... rfc2119.txt
+.f...p..... rfc2.txt
+cL+++++++++ latest -> rfc8174.txt
+'''
+
+
+class TestManifest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.tmp_dir.name, 'rfc')
+        os.makedirs(self.root)
+        self.manifest = manifest.Manifest(
+            manifest.manifest_path(self.tmp_dir.name))
+
+    def tearDown(self):
+        self.manifest.close()
+        self.tmp_dir.cleanup()
+
+    def write(self, path, data):
+        with open(os.path.join(self.root, path), 'w') as mirrored_file:
+            mirrored_file.write(data)
+
+    def test_parse_itemized(self):
+        changes = manifest.parse_itemized(ITEMIZED.splitlines(True))
+        self.assertEqual({'bcp/bcp14.txt', 'rfc8174.txt'}, changes.added)
+        self.assertEqual({'rfc-index.xml', 'rfc2119.txt'}, changes.modified)
+        self.assertEqual({'rfc1.txt'}, changes.deleted)
+        self.assertEqual(5, len(changes.paths()))
+
+    def test_apply(self):
+        self.write('rfc1.txt', 'one')
+        self.write('rfc2.txt', 'two')
+        applied = self.manifest.apply('rfc', self.root, manifest.Changes(
+            {'rfc1.txt', 'rfc2.txt'}, set(), set()))
+        self.assertEqual({'rfc1.txt', 'rfc2.txt'}, applied.added)
+        size, _, digest = self.manifest.get('rfc', 'rfc1.txt')
+        self.assertEqual(3, size)
+        self.assertEqual(manifest.file_hash(
+            os.path.join(self.root, 'rfc1.txt')), digest)
+
+        # rfc1.txt was only touched, rfc2.txt really changed, and rfc3.txt
+        # vanished before it could be recorded
+        self.write('rfc1.txt', 'one')
+        self.write('rfc2.txt', 'TWO')
+        os.remove(os.path.join(self.root, 'rfc1.txt'))
+        self.write('rfc1.txt', 'one')
+        applied = self.manifest.apply('rfc', self.root, manifest.Changes(
+            set(), {'rfc1.txt', 'rfc2.txt', 'rfc3.txt'}, set()))
+        self.assertEqual(manifest.Changes(set(), {'rfc2.txt'}, {'rfc3.txt'}),
+                         applied)
+
+        applied = self.manifest.apply('rfc', self.root, manifest.Changes(
+            set(), set(), {'rfc1.txt'}))
+        self.assertEqual({'rfc1.txt'}, applied.deleted)
+        self.assertIsNone(self.manifest.get('rfc', 'rfc1.txt'))
+        self.assertIsNotNone(self.manifest.get('rfc', 'rfc2.txt'))
+        # Document types are kept apart
+        self.assertIsNone(self.manifest.get('draft', 'rfc2.txt'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+import unittest
+
+from ietf.sql.base import Base
+from ietf.sql.rfc import Author, Rfc
+from ietf.test.helpers import count_statements
+from ietf.utility.query_author import (query_author, query_author_by_name,
+                                       query_author_by_org,
+                                       query_author_by_orgabbrev,
+                                       query_author_by_title)
+from ietf.xml.enum import Status
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+
+class TestQueryAuthor(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine, checkfirst=True)
+        self.session = sessionmaker(bind=self.engine)()
+        authors = {
+            1: [Author(name='J. Doe', organization='Example Inc',
+                       org_abbrev='EX'),
+                Author(name='A. Smith', title='Editor')],
+            2: [Author(name='j. doe', organization='Other')],
+            3: [Author(name='B. Jones', organization='Example Inc')],
+        }
+        for number, rfc_authors in authors.items():
+            rfc = Rfc(id=number, title='title for RFC {}'.format(number),
+                      date_month=1, date_year=1,
+                      current_status=Status.UNKNOWN,
+                      publication_status=Status.UNKNOWN)
+            rfc.authors.extend(rfc_authors)
+            self.session.add(rfc)
+        self.session.commit()
+
+    def ids(self, query):
+        return [rfc.id for rfc in query.order_by(Rfc.id)]
+
+    def test_exact_match_wins(self):
+        self.assertEqual([1], self.ids(
+            query_author_by_name(self.session, ['J. Doe'])
+        ))
+
+    def test_case_insensitive_fallback(self):
+        self.assertEqual([1, 2], self.ids(
+            query_author_by_name(self.session, ['J. DOE'])
+        ))
+
+    def test_wildcard(self):
+        self.assertEqual([1, 2], self.ids(
+            query_author_by_name(self.session, ['*doe'])
+        ))
+        self.assertEqual([1, 3], self.ids(
+            query_author_by_org(self.session, ['example*'])
+        ))
+
+    def test_title_and_abbrev(self):
+        self.assertEqual([1], self.ids(
+            query_author_by_title(self.session, ['editor'])
+        ))
+        self.assertEqual([1], self.ids(
+            query_author_by_orgabbrev(self.session, ['ex'])
+        ))
+
+    def test_every_term_must_match(self):
+        self.assertEqual([], self.ids(
+            query_author_by_name(self.session, ['j. doe', 'A. Smith'])
+        ))
+        self.assertEqual([1], self.ids(
+            query_author(self.session, names=['J. Doe'], orgs=['example*'])
+        ))
+
+    def test_no_criteria(self):
+        self.assertEqual([1, 2, 3], self.ids(query_author(self.session)))
+
+    def test_single_statement(self):
+        with count_statements(self.engine) as statements:
+            rfcs = query_author(self.session, names=['J. Doe', 'a. smith'],
+                                titles=['Editor'], orgs=['example*'],
+                                abbrevs=['EX']).all()
+        self.assertEqual([1], [rfc.id for rfc in rfcs])
+        self.assertEqual(1, len(statements))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+import unittest
+
+from ietf.sql.base import Base
+from ietf.sql.bcp import Bcp
+from ietf.sql.rfc import ObsoletedBy, Rfc, UpdatedBy
+from ietf.sql.rfc_not_issued import RfcNotIssued
+from ietf.test.helpers import count_statements
+from ietf.utility import query_doc
+from ietf.utility.query_doc import (query_bcp, query_bcps, query_rfc,
+                                    query_rfc_chains, query_rfc_not_issued,
+                                    query_rfc_obsoletes, query_rfc_updates,
+                                    query_rfcs, query_rfcs_not_issued,
+                                    query_rfcs_obsoletes, query_rfcs_updates,
+                                    query_title, query_titles,)
+from ietf.xml.enum import DocumentType, Status
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+
+class TestQueryDoc(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine, checkfirst=True)
+        self.session = sessionmaker(bind=self.engine)()
+        # Obsoleted by, as (obsoleted RFC, obsoleting RFC)
+        obsoleted_by = ((1, 2), (2, 3), (10, 11), (11, 10), (40, 41))
+        # Updated by, as (updated RFC, updating document)
+        updated_by = ((20, (DocumentType.RFC, 21)),
+                      (21, (DocumentType.BCP, 5)),
+                      (30, (DocumentType.RFC, 31)),
+                      (30, (DocumentType.RFC, 32)),
+                      (32, (DocumentType.IEN, 7)))
+        for number in (1, 2, 3, 10, 11, 20, 21, 30, 31, 32, 40):
+            self.session.add(Rfc(id=number,
+                                 title='title for RFC {}'.format(number),
+                                 date_month=1, date_year=1,
+                                 current_status=Status.UNKNOWN,
+                                 publication_status=Status.UNKNOWN))
+        self.session.add(Bcp(id=5, title='title for BCP 5'))
+        self.session.add(RfcNotIssued(id=4))
+        self.session.flush()
+        for number, doc_id in obsoleted_by:
+            self.session.add(ObsoletedBy(rfc_id=number, doc_id=doc_id,
+                                         doc_type=DocumentType.RFC))
+        for number, (doc_type, doc_id) in updated_by:
+            self.session.add(UpdatedBy(rfc_id=number, doc_id=doc_id,
+                                       doc_type=doc_type))
+        self.session.commit()
+
+    def test_obsoletes(self):
+        self.assertEqual(3, query_rfc_obsoletes(self.session, 1).id)
+        self.assertEqual(3, query_rfc_obsoletes(self.session, 3).id)
+        self.assertIsNone(query_rfc_obsoletes(self.session, 99))
+        # The obsoleting RFC is not in the DB
+        self.assertIsNone(query_rfc_obsoletes(self.session, 40))
+
+    def test_obsoletes_cycle(self):
+        self.assertEqual(11, query_rfc_obsoletes(self.session, 10).id)
+        self.assertEqual(10, query_rfc_obsoletes(self.session, 11).id)
+
+    def test_updates(self):
+        # Followed transitively, ending in a BCP
+        doc = query_rfc_updates(self.session, 20)
+        self.assertIsInstance(doc, Bcp)
+        self.assertEqual(5, doc.id)
+        # The latest update is followed; IENs cannot be looked up
+        self.assertEqual(32, query_rfc_updates(self.session, 30).id)
+        self.assertEqual(3, query_rfc_updates(self.session, 3).id)
+        self.assertIsNone(query_rfc_updates(self.session, 99))
+
+    def test_chains(self):
+        chains = query_rfc_chains(self.session, ObsoletedBy, [1, 10, 99])
+        self.assertEqual({1: [(DocumentType.RFC, 1), (DocumentType.RFC, 2),
+                              (DocumentType.RFC, 3)],
+                          10: [(DocumentType.RFC, 10),
+                               (DocumentType.RFC, 11)]},
+                         chains)
+
+    def test_batch_single_query(self):
+        numbers = [1, 2, 3, 10, 11, 20, 30, 40, 99]
+        with count_statements(self.engine) as statements:
+            docs = query_rfcs_obsoletes(self.session, numbers)
+        self.assertEqual(1, len(statements))
+        self.assertEqual({1: 3, 2: 3, 3: 3, 10: 11, 11: 10, 20: 20, 30: 30,
+                          40: None, 99: None},
+                         {number: doc and doc.id
+                          for number, doc in docs.items()})
+        # Only the BCP needs a further query
+        docs = query_rfcs_updates(self.session, numbers)
+        self.assertEqual(5, docs[20].id)
+        self.assertEqual(32, docs[30].id)
+
+    def test_query_by_ids(self):
+        rfcs = query_rfcs(self.session, [3, 4, 1, 99])
+        self.assertEqual([3, 4, 1, 99], list(rfcs))
+        self.assertEqual(3, rfcs[3].id)
+        self.assertEqual(1, rfcs[1].id)
+        self.assertIsNone(rfcs[4])
+        self.assertIsNone(rfcs[99])
+        not_issued = query_rfcs_not_issued(self.session, [3, 4])
+        self.assertIsNone(not_issued[3])
+        self.assertEqual(4, not_issued[4].id)
+        self.assertEqual(5, query_bcps(self.session, [5])[5].id)
+
+    def test_query_by_ids_chunked(self):
+        numbers = list(range(1, 2 * query_doc._MAX_IDS + 2))
+        with count_statements(self.engine) as statements:
+            rfcs = query_rfcs(self.session, numbers)
+        self.assertEqual(3, len(statements))
+        self.assertEqual(11, len([rfc for rfc in rfcs.values() if rfc]))
+
+    def test_query_by_id(self):
+        rfc = query_rfc(self.session, 3)
+        self.assertIsInstance(rfc, Rfc)
+        self.assertEqual('title for RFC 3', rfc.title)
+        self.assertIsNone(query_rfc(self.session, 4))
+        self.assertEqual(4, query_rfc_not_issued(self.session, 4).id)
+        self.assertIsNone(query_rfc_not_issued(self.session, 3))
+        self.assertEqual(5, query_bcp(self.session, 5).id)
+        self.assertIsNone(query_bcp(self.session, 3))
+
+    def test_query_titles(self):
+        self.session.expunge_all()
+        titles = query_titles(self.session, DocumentType.RFC, [3, 99, 1])
+        self.assertEqual([3, 99, 1], list(titles))
+        self.assertEqual((3, 'title for RFC 3'), tuple(titles[3]))
+        self.assertEqual('title for RFC 1', titles[1].title)
+        self.assertIsNone(titles[99])
+        self.assertEqual((5, 'title for BCP 5'),
+                         tuple(query_title(self.session, DocumentType.BCP,
+                                           5)))
+        self.assertIsNone(query_title(self.session, DocumentType.BCP, 3))
+        # No ORM object is loaded
+        self.assertEqual(0, len(self.session.identity_map))
+        # Pending changes are seen, as by ORM queries
+        self.session.add(Bcp(id=6, title='title for BCP 6'))
+        self.assertEqual('title for BCP 6', query_title(
+            self.session, DocumentType.BCP, 6).title)
+
+    def test_query_titles_chunked(self):
+        numbers = list(range(1, 2 * query_doc._MAX_IDS + 2))
+        with count_statements(self.engine) as statements:
+            titles = query_titles(self.session, DocumentType.RFC, numbers)
+        self.assertEqual(3, len(statements))
+        self.assertEqual(11, len([row for row in titles.values() if row]))
+
+
+if __name__ == '__main__':
+    unittest.main()
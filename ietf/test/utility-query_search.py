@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+import unittest
+
+from ietf.sql import search
+from ietf.sql.base import Base
+from ietf.sql.rfc import Abstract, Author, Keyword, Rfc
+from ietf.utility.query_search import query_search
+from ietf.xml.enum import Status
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+
+class TestQuerySearch(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine, checkfirst=True)
+        self.session = sessionmaker(bind=self.engine)()
+        entries = (
+            (1, 'Key words for use in RFCs', 'Requirement levels.',
+             ['requirements'], ['S. Bradner']),
+            (2, 'Transport Layer Security', 'Encryption of the key words '
+             'exchanged between hosts.', ['tls', 'cryptography'],
+             ['E. Rescorla']),
+            (3, 'Cryptographic hashes', 'Hashing functions.', [],
+             ['S. Bradner', 'J. Doe']),
+        )
+        for number, title, abstract, words, names in entries:
+            rfc = Rfc(id=number, title=title,
+                      date_month=1, date_year=1,
+                      current_status=Status.UNKNOWN,
+                      publication_status=Status.UNKNOWN)
+            rfc.abstract.append(Abstract(par=abstract))
+            rfc.keywords.extend(Keyword(word) for word in words)
+            rfc.authors.extend(Author(name=name) for name in names)
+            self.session.add(rfc)
+        self.session.commit()
+        with self.engine.begin() as connection:
+            search.rebuild(connection)
+
+    def ids(self, *terms):
+        return [rfc.id for rfc in query_search(self.session, terms)]
+
+    def test_ranking(self):
+        # A match in the title ranks above one in the abstract
+        self.assertEqual([1, 2], self.ids('words'))
+
+    def test_phrase_and_prefix(self):
+        self.assertEqual([1, 2], self.ids('"key words"'))
+        self.assertEqual([], self.ids('"words key"'))
+        self.assertEqual([3, 2], self.ids('crypt*'))
+
+    def test_terms_are_combined(self):
+        self.assertEqual([2], self.ids('key', 'tls'))
+
+    def test_columns_and_stemming(self):
+        self.assertEqual([1, 3], sorted(self.ids('authors:bradner')))
+        self.assertEqual([3], self.ids('hash'))
+
+    def test_rebuild(self):
+        self.session.get(Rfc, 3).title = 'Something else'
+        self.session.commit()
+        with self.engine.begin() as connection:
+            search.rebuild(connection)
+        self.assertEqual([], self.ids('title:cryptographic'))
+
+    def test_syntax_error(self):
+        with self.assertRaises(OperationalError):
+            self.ids('AND')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+import os
+import sys
+import tempfile
+import unittest
+
+from ietf.utility import scheduler
+
+# Stand-in for rsync: `fake-rsync STATE_DIR NAME FAILURES SECONDS` logs when
+# it runs, prints itemized changes and progress, takes SECONDS, and exits
+# with status 23 for its first FAILURES runs
+FAKE_RSYNC = r'''
+import os, sys, time
+state_dir, name, failures = sys.argv[1], sys.argv[2], int(sys.argv[3])
+seconds = float(sys.argv[4])
+runs_path = os.path.join(state_dir, name + '.runs')
+runs = len(open(runs_path).read()) if os.path.exists(runs_path) else 0
+with open(runs_path, 'a') as runs_file:
+    runs_file.write('x')
+with open(os.path.join(state_dir, 'log'), 'a') as log:
+    log.write('start {}\n'.format(name))
+sys.stdout.write('>f+++++++++ {}-{}.txt\n'.format(name, runs))
+sys.stdout.write('          1,024  50%    1.00MB/s    0:00:00\r')
+sys.stdout.write('          2,048 100%    1.00MB/s    0:00:00 '
+                 '(xfr#1, to-chk=0/2)\n')
+sys.stdout.flush()
+time.sleep(seconds)
+with open(os.path.join(state_dir, 'log'), 'a') as log:
+    log.write('end {}\n'.format(name))
+sys.exit(23 if runs < failures else 0)
+'''
+
+
+class TestScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.script = os.path.join(self.tmp_dir.name, 'fake-rsync')
+        with open(self.script, 'w') as script_file:
+            script_file.write(FAKE_RSYNC)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def job(self, name, failures=0, priority=1, seconds=0.2, stage=None):
+        return scheduler.Job(name, [sys.executable, self.script,
+                                    self.tmp_dir.name, name, str(failures),
+                                    str(seconds)],
+                             priority, stage)
+
+    def write_log(self, line):
+        with open(os.path.join(self.tmp_dir.name, 'log'), 'a') as log:
+            log.write(line + '\n')
+
+    def log(self):
+        with open(os.path.join(self.tmp_dir.name, 'log')) as log:
+            return log.read().split('\n')[:-1]
+
+    def test_run_job(self):
+        progress = []
+        result = scheduler.run_job(self.job('rfc'),
+                                   on_progress=progress.append)
+        self.assertTrue(result.ok)
+        self.assertEqual((1, 2048, 1), (result.attempts, result.bytes,
+                                        result.files))
+        self.assertEqual(['>f+++++++++ rfc-0.txt\n'], result.output)
+        self.assertEqual([1024, 2048], [update.bytes for update in progress])
+
+    def test_retries(self):
+        waits = []
+        result = scheduler.run_job(self.job('rfc', failures=2), retries=3,
+                                   backoff=0.5, sleep=waits.append)
+        self.assertTrue(result.ok)
+        self.assertEqual(3, result.attempts)
+        self.assertEqual([0.5, 1.0], waits)
+        # What every attempt transferred is kept
+        self.assertEqual(3, len(result.output))
+        self.assertEqual((6144, 3), (result.bytes, result.files))
+
+        result = scheduler.run_job(self.job('draft', failures=5), retries=1,
+                                   sleep=waits.append)
+        self.assertFalse(result.ok)
+        self.assertEqual((23, 2), (result.exitcode, result.attempts))
+
+    def test_fatal_exit_status_not_retried(self):
+        job = scheduler.Job('rfc', [sys.executable, '-c', 'exit(1)'])
+        result = scheduler.run_job(job, sleep=self.fail)
+        self.assertEqual((1, 1), (result.exitcode, result.attempts))
+
+    def test_run_jobs(self):
+        done = []
+        jobs = [self.job('draft'), self.job('iana'), self.job('rfc',
+                                                              priority=0)]
+        results = scheduler.run_jobs(jobs, workers=1,
+                                     on_done=lambda result:
+                                     done.append(result.name))
+        self.assertEqual(['rfc', 'draft', 'iana'], done)
+        self.assertEqual({'draft', 'iana', 'rfc'}, set(results))
+        # One at a time
+        self.assertEqual(['start rfc', 'end rfc', 'start draft', 'end draft',
+                          'start iana', 'end iana'], self.log())
+
+    def test_workers_bound_concurrency(self):
+        jobs = [self.job(str(number)) for number in range(4)]
+        scheduler.run_jobs(jobs, workers=2)
+        running = peak = 0
+        for line in self.log():
+            running += 1 if line.startswith('start') else -1
+            peak = max(peak, running)
+        self.assertEqual(2, peak)
+
+    def test_stage_overlaps_other_jobs(self):
+        def build(result):
+            self.assertEqual(['>f+++++++++ rfc-0.txt\n'], result.output)
+            self.write_log('build')
+
+        jobs = [self.job('draft', seconds=1.5),
+                self.job('rfc', priority=0, stage=build)]
+        scheduler.run_jobs(jobs, workers=2)
+        log = self.log()
+        # Built after its own transfer, while the other was still running
+        self.assertLess(log.index('end rfc'), log.index('build'))
+        self.assertLess(log.index('build'), log.index('end draft'))
+
+    def test_stage_errors_are_raised(self):
+        def build(result):
+            raise ValueError('build failed')
+
+        jobs = [self.job('draft', seconds=0.5),
+                self.job('rfc', priority=0, stage=build)]
+        with self.assertRaises(ValueError):
+            scheduler.run_jobs(jobs, workers=2)
+        # The other transfers were still waited for
+        self.assertEqual('end draft', self.log()[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
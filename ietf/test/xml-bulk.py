@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+import os
+import unittest
+
+import ietf.xml.bulk as bulk
+import ietf.xml.index as index
+from ietf.sql.base import Base
+from ietf.sql.rfc import Keyword, Rfc
+from ietf.test.helpers import dump
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+
+class TestXmlBulk(unittest.TestCase):
+    data_dir = os.path.join(os.path.dirname(__file__), 'data')
+    data_files = ('bcp-index.xml', 'fyi-index.xml', 'rfc-index.xml',
+                  'rfc_not_issued-index.xml', 'std-index.xml')
+
+    def create_engine(self):
+        engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(engine, checkfirst=True)
+        return engine
+
+    def test_same_as_orm(self):
+        for data_file in type(self).data_files:
+            path = os.path.join(type(self).data_dir, data_file)
+            # Load the index through the ORM
+            orm_engine = self.create_engine()
+            session = sessionmaker(bind=orm_engine)()
+            index.add_all(session, path)
+            session.commit()
+            # Load the index through the bulk loader
+            bulk_engine = self.create_engine()
+            with bulk_engine.begin() as connection:
+                bulk.add_all(connection, path)
+
+            self.assertEqual(dump(orm_engine), dump(bulk_engine))
+
+    def test_small_batches(self):
+        path = os.path.join(type(self).data_dir, 'rfc-index.xml')
+        engine = self.create_engine()
+        with engine.begin() as connection:
+            loader = bulk.BulkLoader(connection, batch_size=1)
+            for entry in index.iterentries(path):
+                loader.add_entry(entry)
+            loader.flush()
+        session = sessionmaker(bind=engine)()
+        self.assertEqual(3, session.query(Rfc).count())
+        rfc8180 = session.query(Rfc).filter(Rfc.id == 8180).one()
+        self.assertEqual(3, len(rfc8180.authors))
+
+    def test_existing_keywords(self):
+        path = os.path.join(type(self).data_dir, 'rfc-index.xml')
+        engine = self.create_engine()
+        session = sessionmaker(bind=engine)()
+        session.add(Keyword('one'))
+        session.commit()
+        with engine.begin() as connection:
+            bulk.add_all(connection, path)
+        # The existing keyword is reused rather than duplicated
+        keyword = session.query(Keyword).filter(Keyword.word == 'one').one()
+        self.assertEqual(1, keyword.id)
+        self.assertEqual([10, 8174], [rfc.id for rfc in keyword.rfcs])
+
+
+if __name__ == '__main__':
+    unittest.main()
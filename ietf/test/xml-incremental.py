@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+import os
+import shutil
+import tempfile
+import unittest
+
+from ietf.sql.base import Base
+from ietf.sql.fingerprint import Fingerprint
+from ietf.sql.rfc import Abstract, Author, Rfc
+from ietf.xml.incremental import UpdateCounts, update_all
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+
+class TestXmlIncremental(unittest.TestCase):
+    data_file = os.path.join(os.path.dirname(__file__), 'data/rfc-index.xml')
+
+    def setUp(self):
+        # Work on a copy of the index that the tests can modify
+        self.tmp_dir = tempfile.mkdtemp()
+        self.index_path = os.path.join(self.tmp_dir, 'rfc-index.xml')
+        shutil.copy(type(self).data_file, self.index_path)
+        # sqlalchemy engine and session
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine, checkfirst=True)
+        self.session = sessionmaker(bind=self.engine)()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def update(self):
+        with self.engine.begin() as connection:
+            return update_all(connection, self.index_path)
+
+    def edit_index(self, old, new):
+        with open(self.index_path) as index_file:
+            contents = index_file.read()
+        self.assertIn(old, contents)
+        with open(self.index_path, 'w') as index_file:
+            index_file.write(contents.replace(old, new))
+
+    def test_initial_load(self):
+        self.assertEqual(UpdateCounts(3, 0, 0), self.update())
+        self.assertEqual(3, self.session.query(Rfc).count())
+        self.assertEqual(3, self.session.query(Fingerprint).count())
+
+    def test_unchanged(self):
+        self.update()
+        self.assertEqual(UpdateCounts(0, 0, 0), self.update())
+        self.assertEqual(3, self.session.query(Rfc).count())
+        self.assertEqual(5, self.session.query(Author).count())
+
+    def test_changed(self):
+        self.update()
+        self.edit_index('<name>K. Pister</name>', '<name>K. Pister II</name>')
+        self.assertEqual(UpdateCounts(0, 1, 0), self.update())
+        rfc8180 = self.session.query(Rfc).filter(Rfc.id == 8180).one()
+        self.assertEqual(['X. Vilajosana', 'K. Pister II', 'T. Watteyne'],
+                         [author.name for author in rfc8180.authors])
+        # The other RFCs' rows are untouched
+        self.assertEqual(5, self.session.query(Author).count())
+        self.assertEqual(2, self.session.query(Abstract).count())
+
+    def test_removed(self):
+        self.update()
+        with open(self.index_path) as index_file:
+            contents = index_file.read()
+        # Drop the entry for RFC 8180
+        begin = contents.index('<rfc-entry>')
+        end = contents.index('</rfc-entry>') + len('</rfc-entry>')
+        with open(self.index_path, 'w') as index_file:
+            index_file.write(contents[:begin] + contents[end:])
+
+        self.assertEqual(UpdateCounts(0, 0, 1), self.update())
+        self.assertIsNone(
+            self.session.query(Rfc).filter(Rfc.id == 8180).one_or_none()
+        )
+        self.assertEqual(2, self.session.query(Author).count())
+        self.assertEqual(2, self.session.query(Fingerprint).count())
+
+    def test_without_fingerprints(self):
+        # Rows loaded before fingerprints existed are replaced wholesale
+        self.update()
+        self.session.query(Fingerprint).delete()
+        self.session.commit()
+        self.assertEqual(UpdateCounts(3, 0, 0), self.update())
+        self.assertEqual(3, self.session.query(Rfc).count())
+        self.assertEqual(5, self.session.query(Author).count())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+import os
+import unittest
+import xml.etree.ElementTree as ET
+
+import ietf.xml.bcp as bcp
+import ietf.xml.fyi as fyi
+import ietf.xml.index as index
+import ietf.xml.rfc as rfc
+import ietf.xml.rfc_not_issued as rfc_not_issued
+import ietf.xml.std as std
+from ietf.sql.base import Base
+from ietf.test.helpers import dump
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+
+class TestXmlIndex(unittest.TestCase):
+    data_dir = os.path.join(os.path.dirname(__file__), 'data')
+    data_files = (('bcp-index.xml', bcp),
+                  ('fyi-index.xml', fyi),
+                  ('rfc-index.xml', rfc),
+                  ('rfc_not_issued-index.xml', rfc_not_issued),
+                  ('std-index.xml', std))
+
+    def create_session(self):
+        engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(engine, checkfirst=True)
+        return engine, sessionmaker(bind=engine)()
+
+    def test_iterentries(self):
+        path = os.path.join(type(self).data_dir, 'rfc-index.xml')
+        tags = [entry.tag for entry in index.iterentries(path)]
+        self.assertEqual(3, len(tags))
+        self.assertTrue(all(tag == index._clark('rfc-entry') for tag in tags))
+
+    def test_iterentries_clears(self):
+        path = os.path.join(type(self).data_dir, 'rfc-index.xml')
+        seen = []
+        for entry in index.iterentries(path):
+            seen.append(entry)
+        # Entries from earlier iterations have been emptied
+        self.assertEqual(0, len(seen[0]))
+        self.assertEqual(0, len(seen[1]))
+
+    def test_add_all(self):
+        for data_file, module in type(self).data_files:
+            path = os.path.join(type(self).data_dir, data_file)
+            # Load the index the tree-based way
+            tree_engine, tree_session = self.create_session()
+            module.add_all(tree_session, ET.parse(path).getroot())
+            tree_session.commit()
+            # Load the index the streaming way
+            stream_engine, stream_session = self.create_session()
+            index.add_all(stream_session, path)
+            stream_session.commit()
+
+            self.assertEqual(dump(tree_engine), dump(stream_engine))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+import os
+import tempfile
+import unittest
+import xml.etree.ElementTree
+from concurrent.futures import Future
+from unittest import mock
+
+import ietf.xml.bulk as bulk
+import ietf.xml.parallel as parallel
+from ietf.sql.base import Base
+from ietf.test.helpers import dump
+from sqlalchemy import create_engine
+
+
+class InlineExecutor:
+    """Executor running each task as it is submitted, in this process."""
+
+    def __init__(self, *args, **kwargs):
+        self.submitted = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def submit(self, function, *args):
+        self.submitted += 1
+        future = Future()
+        future.set_result(function(*args))
+        return future
+
+
+class TestXmlParallel(unittest.TestCase):
+    data_dir = os.path.join(os.path.dirname(__file__), 'data')
+    data_files = ('bcp-index.xml', 'fyi-index.xml', 'rfc-index.xml',
+                  'rfc_not_issued-index.xml', 'std-index.xml')
+
+    def create_engine(self):
+        engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(engine, checkfirst=True)
+        return engine
+
+    def test_split_entries(self):
+        path = os.path.join(type(self).data_dir, 'rfc-index.xml')
+        with open(path, 'rb') as index_file:
+            data = index_file.read()
+        header, ranges = parallel.split_entries(data, chunk_size=2)
+        self.assertTrue(header.startswith(b'<rfc-index '))
+        self.assertIn(b'xmlns="http://www.rfc-editor.org/rfc-index"', header)
+        # Three entries split into chunks of two and one
+        self.assertEqual(2, len(ranges))
+        first = data[ranges[0][0]:ranges[0][1]]
+        self.assertTrue(first.startswith(b'<rfc-entry>'))
+        self.assertTrue(first.endswith(b'</rfc-entry>'))
+        self.assertEqual(2, first.count(b'<rfc-entry>'))
+        self.assertEqual(1, data[ranges[1][0]:ranges[1][1]].count(
+            b'<rfc-entry>'))
+
+    def test_split_without_root(self):
+        with self.assertRaises(xml.etree.ElementTree.ParseError):
+            parallel.split_entries(b'<rfc-entry></rfc-entry>')
+
+    def test_same_records(self):
+        for data_file in type(self).data_files:
+            path = os.path.join(type(self).data_dir, data_file)
+            serial = list(parallel.iterrecords(path, 1, digests=True))
+            in_pool = list(parallel.iterrecords(path, 2, digests=True))
+            self.assertEqual(serial, in_pool)
+
+    def test_bounded_tasks(self):
+        path = os.path.join(type(self).data_dir, 'rfc-index.xml')
+        executor = InlineExecutor()
+        with mock.patch.object(parallel, 'ProcessPoolExecutor',
+                               return_value=executor) as pool, \
+                mock.patch.object(parallel, 'TASKS_PER_WORKER', 1):
+            # Three chunks of one entry, at most two of them in flight
+            records = parallel.iterrecords(path, workers=2, chunk_size=1)
+            first = next(records)
+            self.assertEqual(2, executor.submitted)
+            rest = list(records)
+        self.assertEqual(3, executor.submitted)
+        # Workers are never forked from a possibly threaded process
+        self.assertEqual('forkserver', pool.call_args.kwargs[
+            'mp_context'].get_start_method())
+        self.assertEqual(list(parallel.iterrecords(path, 1)), [first] + rest)
+
+    def test_same_as_serial(self):
+        for data_file in type(self).data_files:
+            path = os.path.join(type(self).data_dir, data_file)
+            # Load the index serially
+            serial_engine = self.create_engine()
+            with serial_engine.begin() as connection:
+                bulk.add_all(connection, path)
+            # Load the index with a pool of worker processes
+            parallel_engine = self.create_engine()
+            with parallel_engine.begin() as connection:
+                parallel.add_all(connection, path, workers=2)
+
+            self.assertEqual(dump(serial_engine), dump(parallel_engine))
+
+    def test_unsplittable_as_serial(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'rfc-index.xml')
+            # An empty index fails as it does when parsed serially
+            open(path, 'wb').close()
+            for workers in (1, 2):
+                with self.assertRaisesRegex(xml.etree.ElementTree.ParseError,
+                                            '^no element found'):
+                    list(parallel.iterrecords(path, workers))
+            # So does one that is not even XML
+            with open(path, 'wb') as index_file:
+                index_file.write(b'<rfc-entry>')
+            for workers in (1, 2):
+                with self.assertRaises(xml.etree.ElementTree.ParseError):
+                    list(parallel.iterrecords(path, workers))
+            # An index without the root tag yields no records at all
+            with open(path, 'wb') as index_file:
+                index_file.write(b'<index/>')
+            self.assertEqual([], list(parallel.iterrecords(path, 2)))
+
+
+if __name__ == '__main__':
+    unittest.main()
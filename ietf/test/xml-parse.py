@@ -5,6 +5,7 @@ import xml.etree.ElementTree as ET
 import ietf.xml.parse as parse
 
 from ietf.xml.enum import Status, Stream
+from ietf.xml.record import AuthorRecord
 
 
 class TestParse(unittest.TestCase):
@@ -545,6 +546,48 @@ class TestParse(unittest.TestCase):
         self.assertEqual('10.17487/RFC8174',
                          parse.find_doi(self.entries[2]))
 
+    def test_decode_entry(self):
+        # A single pass yields the same values as the individual finders
+        finders = (('doc_id', parse.find_doc_id),
+                   ('title', parse.find_title),
+                   ('authors', parse.find_author),
+                   ('date', parse.find_date),
+                   ('formats', parse.find_format),
+                   ('keywords', parse.find_keywords),
+                   ('abstract', parse.find_abstract),
+                   ('draft', parse.find_draft),
+                   ('notes', parse.find_notes),
+                   ('obsoletes', parse.find_obsoletes),
+                   ('obsoleted_by', parse.find_obsoleted_by),
+                   ('updates', parse.find_updates),
+                   ('updated_by', parse.find_updated_by),
+                   ('is_also', parse.find_is_also),
+                   ('see_also', parse.find_see_also),
+                   ('current_status', parse.find_current_status),
+                   ('publication_status', parse.find_publication_status),
+                   ('stream', parse.find_stream),
+                   ('area', parse.find_area),
+                   ('wg_acronym', parse.find_wg_acronym),
+                   ('errata_url', parse.find_errata_url),
+                   ('doi', parse.find_doi))
+        for entry in self.entries:
+            record = parse.decode_entry(entry)
+            self.assertEqual(len(finders), len(record))
+            for field, find in finders:
+                value = getattr(record, field)
+                if field == 'authors':
+                    value = [author._asdict() for author in value]
+                self.assertEqual(find(entry), value)
+
+    def test_decode_entry_interned(self):
+        # RFCs 10 and 8174 both have the keyword "One", decoded separately
+        first = parse.decode_entry(self.entries[1])
+        second = parse.decode_entry(self.entries[2])
+        self.assertEqual(['one', 'two'], first.keywords)
+        self.assertEqual(['one'], second.keywords)
+        self.assertIs(first.keywords[0], second.keywords[0])
+        self.assertIsInstance(first.authors[0], AuthorRecord)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""Full-text index of the plaintext bodies of the mirrored RFCs.
+
+The index lives in an SQLite file of its own next to the DB.  Each RFC's
+text is split into chunks of whole paragraphs, and each chunk is a row of
+an FTS5 table along with its byte offset in the file.  The row ID of a chunk
+is the RFC number shifted left by `_CHUNK_BITS`, plus the chunk's position,
+so that the chunks of one RFC are a contiguous range of row IDs.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, Iterator, List, NamedTuple, Set, Tuple
+from urllib.parse import quote
+import mmap
+import multiprocessing
+import os
+import re
+import sqlite3
+
+# Size above which a chunk is closed at the next paragraph break
+CHUNK_BYTES = 2048
+
+# Files handed to a worker process at a time
+FILES_PER_TASK = 16
+
+_CHUNK_BITS = 20
+
+# Plaintext RFCs in the mirror, e.g. `rfc2119.txt`
+_FILE_RE = re.compile(r'^rfc(\d+)\.txt$')
+
+# One or more blank lines, possibly holding the form feed of a page break
+_BREAK_RE = re.compile(rb'\n(?:[ \t\r\f]*\n)+')
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS body_file ('
+    'rfc_id INTEGER PRIMARY KEY, mtime_ns INTEGER NOT NULL, '
+    'size INTEGER NOT NULL)',
+    "CREATE VIRTUAL TABLE IF NOT EXISTS body USING fts5("
+    "offset UNINDEXED, text, tokenize = 'porter unicode61')",
+)
+
+
+class BodyMatch(NamedTuple):
+    rfc_id: int
+    offset: int  # Byte offset of the matching paragraphs in the file
+    snippet: str  # Matched terms are in [brackets]
+
+
+def body_path(db_path: str) -> str:
+    """Return the path of the body index kept next to the DB at `db_path`.
+    """
+    return os.path.splitext(db_path)[0] + '.body.sqlite3'
+
+
+def split_chunks(data: bytes, chunk_bytes: int = CHUNK_BYTES,
+                 ) -> Iterator[Tuple[int, bytes]]:
+    """Yield the byte offset and contents of consecutive runs of whole
+    paragraphs of `data`, each closed once it reaches `chunk_bytes`.
+
+    Blank chunks are skipped.
+    """
+    start = 0
+    for match in _BREAK_RE.finditer(data):
+        if match.start() - start >= chunk_bytes:
+            if data[start:match.start()].strip():
+                yield start, data[start:match.start()]
+            start = match.end()
+    if data[start:].strip():
+        yield start, data[start:]
+
+
+def read_chunks(path: str, chunk_bytes: int = CHUNK_BYTES,
+                ) -> List[Tuple[int, str]]:
+    """Return the chunks of the text file at `path` as (offset, text)."""
+    with open(path, 'rb') as text_file:
+        if os.fstat(text_file.fileno()).st_size == 0:
+            return []  # Empty files cannot be mapped
+        with mmap.mmap(text_file.fileno(), 0,
+                       access=mmap.ACCESS_READ) as data:
+            return [(offset, chunk.decode('utf-8', 'replace'))
+                    for offset, chunk in split_chunks(data, chunk_bytes)]
+
+
+def _read_files(paths: List[Tuple[int, str]], chunk_bytes: int,
+                ) -> List[Tuple[int, List[Tuple[int, str]]]]:
+    """Return the chunks of each (number, path) in `paths` inside a worker
+    process.
+    """
+    return [(number, read_chunks(path, chunk_bytes))
+            for number, path in paths]
+
+
+def iterchunks(paths: List[Tuple[int, str]], workers: int = None,
+               chunk_bytes: int = CHUNK_BYTES,
+               ) -> Iterator[Tuple[int, List[Tuple[int, str]]]]:
+    """Yield each (number, path) of `paths` as (number, chunks) in order.
+
+    Files are read `FILES_PER_TASK` at a time by a pool of `workers`
+    processes, which defaults to one per CPU.  With a single worker they are
+    read in this process.
+    """
+    tasks = [paths[start:start + FILES_PER_TASK]
+             for start in range(0, len(paths), FILES_PER_TASK)]
+    if workers == 1:
+        for task in tasks:
+            yield from _read_files(task, chunk_bytes)
+        return
+    # Forking a process that runs other threads can deadlock the child
+    context = multiprocessing.get_context('forkserver')
+    with ProcessPoolExecutor(workers, mp_context=context) as executor:
+        for read in executor.map(_read_files, tasks, repeat(chunk_bytes)):
+            yield from read
+
+
+def _rowid_range(number: int) -> Tuple[int, int]:
+    """Return the first and last row IDs the chunks of `number` can take."""
+    first = number << _CHUNK_BITS
+    return first, first + (1 << _CHUNK_BITS) - 1
+
+
+def mirrored_files(rfc_dir: str) -> Dict[int, os.stat_result]:
+    """Return the stat of each plaintext RFC in `rfc_dir` by number."""
+    files = {}
+    with os.scandir(rfc_dir) as entries:
+        for entry in entries:
+            match = _FILE_RE.match(entry.name)
+            if match and entry.is_file():
+                files[int(match.group(1))] = entry.stat()
+    return files
+
+
+def _named_files(rfc_dir: str, names) -> Tuple[Dict[int, os.stat_result],
+                                                Set[int]]:
+    """Return the stat of each plaintext RFC of `rfc_dir` among `names` by
+    number, and the numbers of every plaintext RFC `names` lists, including
+    deleted ones.
+    """
+    files = {}
+    candidates = set()
+    for name in names:
+        match = _FILE_RE.match(name)
+        if match:
+            number = int(match.group(1))
+            candidates.add(number)
+            try:
+                files[number] = os.stat(os.path.join(rfc_dir, name))
+            except FileNotFoundError:  # Deleted
+                pass
+    return files, candidates
+
+
+def update(rfc_dir: str, path: str, workers: int = None,
+           chunk_bytes: int = CHUNK_BYTES, names=None) -> int:
+    """Bring the body index at `path` up to date with the plaintext RFCs in
+    `rfc_dir` and return the number of files (re)indexed.
+
+    If `names` is given, only the files of `rfc_dir` it names are looked at,
+    instead of every file in it.  An index that is new or empty has never
+    seen the other files either, so it is always built from every file.
+
+    Files are split into chunks of about `chunk_bytes`.  Only files that
+    were added or changed since the last update are read, by a pool of
+    `workers` processes (see `iterchunks`).  This process is the only one
+    writing to the index.
+    """
+    connection = sqlite3.connect(path)
+    try:
+        with connection:
+            tables = {name for (name,) in connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'")}
+            for statement in _SCHEMA:
+                connection.execute(statement)
+            if not {'body', 'body_file'} <= tables:
+                # Either table is meaningless without the other
+                connection.execute('DELETE FROM body_file')
+                connection.execute('DELETE FROM body')
+            indexed = {number: (mtime_ns, size) for number, mtime_ns, size
+                       in connection.execute('SELECT * FROM body_file')}
+            if names is None or not indexed:
+                files = mirrored_files(rfc_dir)
+                candidates = None
+            else:
+                files, candidates = _named_files(rfc_dir, names)
+            stale = [number for number in indexed if number not in files and
+                     (candidates is None or number in candidates)]
+            changed = sorted(
+                number for number, stat in files.items()
+                if indexed.get(number) != (stat.st_mtime_ns, stat.st_size)
+            )
+            for number in stale + changed:
+                connection.execute(
+                    'DELETE FROM body WHERE rowid BETWEEN ? AND ?',
+                    _rowid_range(number),
+                )
+            connection.executemany('DELETE FROM body_file WHERE rfc_id = ?',
+                                   [(number,) for number in stale])
+
+            paths = [(number, os.path.join(rfc_dir, 'rfc{}.txt'.format(
+                number))) for number in changed]
+            for number, chunks in iterchunks(paths, workers, chunk_bytes):
+                first, _ = _rowid_range(number)
+                connection.executemany(
+                    'INSERT INTO body (rowid, offset, text) '
+                    'VALUES (?, ?, ?)',
+                    [(first + position, offset, text) for
+                     position, (offset, text) in enumerate(chunks)],
+                )
+            connection.executemany(
+                'INSERT OR REPLACE INTO body_file VALUES (?, ?, ?)',
+                [(number, files[number].st_mtime_ns, files[number].st_size)
+                 for number in changed],
+            )
+            if stale or changed:
+                # Merge the index into as few b-trees as possible
+                connection.execute(
+                    "INSERT INTO body (body) VALUES ('optimize')"
+                )
+    finally:
+        connection.close()
+    return len(changed)
+
+
+def search(path: str, match: str, limit: int = 20) -> List[BodyMatch]:
+    """Return the best matching chunk of each of the `limit` RFCs whose
+    bodies best match the FTS5 query `match`, best first.
+
+    The index at `path` is opened read-only.  Raises sqlite3.OperationalError
+    if it cannot be read or `match` is not a valid query.
+    """
+    connection = sqlite3.connect('file:{}?mode=ro'.format(quote(path)),
+                                 uri=True)
+    try:
+        # Rank every matching chunk, keeping the first of each RFC
+        best = {}
+        for (rowid,) in connection.execute(
+            'SELECT rowid FROM body WHERE body MATCH ? ORDER BY rank',
+            (match,),
+        ):
+            best.setdefault(rowid >> _CHUNK_BITS, rowid)
+            if len(best) == limit:
+                break
+        if not best:
+            return []
+        # Only build snippets of the chunks that are shown
+        rows = connection.execute(
+            "SELECT rowid, offset, snippet(body, 1, '[', ']', '...', 16) "
+            'FROM body WHERE body MATCH ? AND rowid IN ({})'.format(
+                ', '.join('?' * len(best))),
+            [match] + list(best.values()),
+        )
+        found = {rowid: (offset, snippet) for rowid, offset, snippet in rows}
+    finally:
+        connection.close()
+    return [BodyMatch(number, found[rowid][0],
+                      ' '.join(found[rowid][1].split()))
+            for number, rowid in best.items()]
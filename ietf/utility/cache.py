@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+from contextlib import redirect_stdout
+from ietf.utility.environment import get_db_path
+import functools
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import sys
+
+# Total size of the cached output above which the least recently used
+# results are evicted
+MAX_BYTES = 16 * 1024 * 1024
+
+# Value of `result.used` for the result being used now
+_NEXT_USE = 'SELECT COALESCE(MAX(used), 0) + 1 FROM result'
+
+# Arguments that do not affect a command's output
+_IGNORED_ARGS = ('func',)
+
+
+def cache_path(db_path: str) -> str:
+    """Return the path of the result cache kept next to the DB at
+    `db_path`.
+    """
+    return os.path.splitext(db_path)[0] + '.cache.sqlite3'
+
+
+def db_stamp(db_path: str) -> str:
+    """Return a string that changes whenever the DB at `db_path` does."""
+    stat = os.stat(db_path)
+    return '{}:{}'.format(stat.st_mtime_ns, stat.st_size)
+
+
+def args_key(args) -> str:
+    """Return a key identifying the output of the command `args` runs."""
+    normalized = {name: value for name, value in vars(args).items()
+                  if name not in _IGNORED_ARGS}
+    encoded = json.dumps(normalized, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """Output of previous command runs, stored in an SQLite file.
+
+    Each result is tagged with the stamp of the DB it was computed from and
+    is only returned for that same stamp.  Once the cached output grows past
+    `max_bytes`, the least recently used results are evicted.
+    """
+
+    def __init__(self, path: str, max_bytes: int = MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.connection = sqlite3.connect(path, timeout=5)
+        try:
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS result ('
+                'key TEXT PRIMARY KEY, stamp TEXT NOT NULL, '
+                'output TEXT NOT NULL, size INTEGER NOT NULL, '
+                'used INTEGER NOT NULL)'  # Larger is more recent
+            )
+            self.connection.execute(
+                'CREATE INDEX IF NOT EXISTS ix_result_used ON result (used)'
+            )
+        except BaseException:
+            self.connection.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def get(self, key: str, stamp: str):
+        """Return the output stored for `key` and `stamp`, or None."""
+        with self.connection:
+            row = self.connection.execute(
+                'SELECT output FROM result WHERE key = ? AND stamp = ?',
+                (key, stamp),
+            ).fetchone()
+            if row is None:
+                return None
+            self.connection.execute(
+                'UPDATE result SET used = ({}) '
+                'WHERE key = ?'.format(_NEXT_USE), (key,)
+            )
+        return row[0]
+
+    def put(self, key: str, stamp: str, output: str):
+        """Store `output` for `key` and `stamp`, then evict the least recently
+        used results until the cache fits in `max_bytes`.
+        """
+        size = len(output.encode('utf-8'))
+        with self.connection:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO result '
+                'VALUES (?, ?, ?, ?, ({}))'.format(_NEXT_USE),
+                (key, stamp, output, size),
+            )
+            # Results computed from another version of the DB are dead
+            self.connection.execute('DELETE FROM result WHERE stamp != ?',
+                                    (stamp,))
+            total = self.connection.execute(
+                'SELECT COALESCE(SUM(size), 0) FROM result'
+            ).fetchone()[0]
+            rows = self.connection.execute(
+                'SELECT key, size FROM result ORDER BY used'
+            )
+            evicted = []
+            for old_key, old_size in rows:
+                if total <= self.max_bytes:
+                    break
+                evicted.append((old_key,))
+                total -= old_size
+            self.connection.executemany('DELETE FROM result WHERE key = ?',
+                                        evicted)
+
+
+def clear(db_path: str):
+    """Drop every result cached for the DB at `db_path`."""
+    try:
+        os.remove(cache_path(db_path))
+    except FileNotFoundError:
+        pass
+
+
+def cached(func):
+    """Decorate the `func` of a read-only subcommand so that its printed
+    output is reused by later runs with the same arguments against the same
+    DB.
+
+    Runs that open files in $EDITOR or $PAGER are never cached, and a cache
+    that cannot be used is ignored.
+    """
+    @functools.wraps(func)
+    def wrapper(args):
+        if getattr(args, 'editor', False) or getattr(args, 'pager', False):
+            return func(args)
+        db_path = get_db_path()
+        try:
+            cache = ResultCache(cache_path(db_path))
+        except sqlite3.Error:
+            return func(args)
+        with cache:
+            key = args_key(args)
+            stamp = db_stamp(db_path)
+            try:
+                output = cache.get(key, stamp)
+            except sqlite3.Error:
+                return func(args)
+            if output is not None:
+                sys.stdout.write(output)
+                sys.exit(0)
+            # Run the command, keeping what it prints
+            buffer = io.StringIO()
+            status = 0
+            try:
+                with redirect_stdout(buffer):
+                    func(args)
+            except SystemExit as stop:
+                status = stop.code
+            except BaseException:
+                sys.stdout.write(buffer.getvalue())  # Show what was printed
+                raise
+            output = buffer.getvalue()
+            sys.stdout.write(output)
+            if not status:  # Only keep the output of successful runs
+                try:
+                    cache.put(key, stamp, output)
+                except sqlite3.Error:
+                    pass
+            sys.exit(status)
+    return wrapper
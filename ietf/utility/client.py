@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Forward commands to a running `ietf serve`.
+
+Only the standard library is imported here so that forwarding a command
+costs no more than starting the interpreter.
+"""
+import json
+import os
+import socket
+import sys
+
+# Name of the socket inside the `ietf` data dir
+SOCKET_NAME = 'serve.sock'
+
+
+def socket_path() -> str:
+    """Return the path of the socket `ietf serve` listens on."""
+    # Same location as `BaseDirectory.save_data_path('ietf')`, without
+    # importing xdg
+    data_home = (os.environ.get('XDG_DATA_HOME') or
+                 os.path.join(os.path.expanduser('~'), '.local', 'share'))
+    return os.path.join(data_home, 'ietf', SOCKET_NAME)
+
+
+def send(path: str, request: dict):
+    """Send `request` to the server listening at `path` and return its
+    reply, or None if no server answered.
+    """
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(path)
+            client.sendall(json.dumps(request).encode('utf-8') + b'\n')
+            client.shutdown(socket.SHUT_WR)
+            chunks = []
+            while True:
+                chunk = client.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        return json.loads(b''.join(chunks).decode('utf-8'))
+    except (OSError, ValueError):  # No server, or it went away
+        return None
+
+
+def forward(argv, path: str = None):
+    """Run the command `argv` in a running `ietf serve` and print its output.
+
+    Return the command's exit status, or None if it must be run locally
+    because no server is running or the command cannot be served.
+    """
+    if path is None:
+        path = socket_path()
+    if not os.path.exists(path):
+        return None
+    reply = send(path, {'argv': list(argv)})
+    if reply is None or reply.get('local'):
+        return None
+    sys.stdout.write(reply['stdout'])
+    sys.stdout.flush()
+    sys.stderr.write(reply['stderr'])
+    sys.stderr.flush()
+    return reply['status']
@@ -1,15 +1,22 @@
 #!/usr/bin/env python3
-from ietf.sql.base import Base
 from ietf.sql.bcp import Bcp
 from ietf.sql.fyi import Fyi
+from ietf.sql.pragma import listen
 from ietf.sql.rfc import Rfc
+from ietf.sql.schema import is_current
 from ietf.sql.std import Std
 from sqlalchemy import create_engine
+from sqlalchemy.engine import URL
 from sqlalchemy.orm import sessionmaker
+from urllib.parse import quote
 from xdg import BaseDirectory
 import os
 import sys
 
+# Engine of each DB opened by this process, with the identity of the file it
+# was opened on
+_engines = {}
+
 
 def get_app_dir(sub_dir='') -> str:
     """Return the path to the XDG dir or exit 1."""
@@ -37,12 +44,56 @@ def get_db_path(no_warn=False) -> str:
     return db_path
 
 
+def _read_only_url(db_path: str) -> URL:
+    """Return the URL opening the DB at `db_path` read-only, so that readers
+    never take a write lock.
+    """
+    return URL.create('sqlite', database='file:' + quote(db_path),
+                      query={'mode': 'ro', 'uri': 'true'})
+
+
+def _open_db(db_path: str):
+    """Return a read-only engine for the DB at `db_path`, with the 'read'
+    settings of `ietf.sql.pragma`, or exit 1 if the DB's schema is older than
+    this version of the program expects.
+
+    Readers never write to the DB, so only `mirror` upgrades it.
+    """
+    engine = listen(create_engine(_read_only_url(db_path)), 'read', db_path)
+    with engine.connect() as connection:
+        current = is_current(connection)
+    if not current:
+        engine.dispose()
+        print("The database at '{}' was built by an older version.  "
+              "Run the `mirror` subcommand to upgrade it."
+              .format(db_path))
+        sys.exit(1)
+    return engine
+
+
+def get_db_engine(db_path: str):
+    """Return a read-only engine for the DB at `db_path`.
+
+    The engine is created, and the schema version checked, once per process;
+    a DB file that has been replaced since gets a new engine.
+    """
+    stat = os.stat(db_path)
+    identity = (stat.st_dev, stat.st_ino)
+    cached = _engines.get(db_path)
+    if cached is not None:
+        cached_identity, engine = cached
+        if cached_identity == identity:
+            return engine
+        engine.dispose()
+    engine = _open_db(db_path)
+    _engines[db_path] = (identity, engine)
+    return engine
+
+
 def get_db_session():
     """Return a DB session."""
     db_path = get_db_path()
-    engine = create_engine("sqlite:///{}".format(db_path))
-    Base.metadata.create_all(engine, checkfirst=True)
-    Session = sessionmaker(bind=engine)()
+    Session = sessionmaker(bind=get_db_engine(db_path))()
     return Session
 
 
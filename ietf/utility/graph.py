@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+from array import array
+from bisect import bisect_left
+from collections import deque
+from ietf.sql.bcp import Bcp
+from ietf.sql.fyi import Fyi
+from ietf.sql.rfc import (IsAlso, ObsoletedBy, Obsoletes, Rfc, SeeAlso,
+                          UpdatedBy, Updates,)
+from ietf.sql.std import Std
+from ietf.xml.enum import DocumentType
+from sqlalchemy import select
+from typing import Dict, Iterator, List, Tuple
+import os
+import sqlalchemy.engine
+import struct
+import sys
+import tempfile
+
+Node = Tuple[DocumentType, int]
+
+# Tables holding the edges of each relation, all of which start at an RFC
+RELATIONS = {'obsoletes': Obsoletes,
+             'obsoleted_by': ObsoletedBy,
+             'updates': Updates,
+             'updated_by': UpdatedBy,
+             'is_also': IsAlso,
+             'see_also': SeeAlso}
+
+# Tables holding documents that are nodes even without any edges
+_DOC_TABLES = ((DocumentType.RFC, Rfc), (DocumentType.STD, Std),
+               (DocumentType.BCP, Bcp), (DocumentType.FYI, Fyi))
+
+_TYPES = list(DocumentType)
+_TYPE_CODES = {doc_type: code for code, doc_type in enumerate(_TYPES)}
+
+# File header: magic, number of nodes, then the number of edges per relation.
+# The arrays that follow are little-endian too, whatever the host.
+_MAGIC = b'IETFGRF1'
+_HEADER = struct.Struct('<8sI' + 'I' * len(RELATIONS))
+_SWAP = sys.byteorder != 'little'
+
+# Graph of each DB loaded by this process, with the mtimes of the DB and of
+# the graph file at the time
+_loaded = {}
+
+
+def _encode(node: Node) -> int:
+    """Return `node` as a single integer that sorts by type, then ID."""
+    doc_type, doc_id = node
+    return _TYPE_CODES[doc_type] << 32 | doc_id
+
+
+def _decode(key: int) -> Node:
+    return _TYPES[key >> 32], key & 0xffffffff
+
+
+def _read(graph_file, typecode: str, count: int) -> array:
+    """Return the `count` little-endian items read from `graph_file`."""
+    items = array(typecode)
+    items.fromfile(graph_file, count)
+    if _SWAP:
+        items.byteswap()
+    return items
+
+
+def _write(graph_file, items: array):
+    """Write `items` to `graph_file` in little-endian byte order."""
+    if _SWAP:
+        items = array(items.typecode, items)
+        items.byteswap()
+    items.tofile(graph_file)
+
+
+class Graph:
+    """The graph of documents linked by the relations in `RELATIONS`.
+
+    Nodes are (DocumentType, int) pairs.  They are stored as a sorted array
+    of integer keys, and each relation as a compressed sparse row adjacency:
+    the targets of node i are `targets[offsets[i]:offsets[i + 1]]`, in the
+    order of the rows of the relation's table.
+    """
+
+    def __init__(self, keys: array, edges: Dict[str, Tuple[array, array]]):
+        self.keys = keys
+        self.edges = edges
+        self._reverse = {}  # Inverted adjacencies, built on demand
+
+    @classmethod
+    def from_connection(cls, connection: sqlalchemy.engine.Connection):
+        """Build the graph from the DB reachable through `connection`."""
+        rows = {}
+        keys = set()
+        for doc_type, table in _DOC_TABLES:
+            for doc_id in connection.execute(select(table.id)).scalars():
+                keys.add(_encode((doc_type, doc_id)))
+        for name, table in RELATIONS.items():
+            rows[name] = connection.execute(
+                select(table.rfc_id, table.doc_type, table.doc_id).
+                where(table.rfc_id.is_not(None)).
+                order_by(table.rfc_id, table.id)
+            ).all()
+            for rfc_id, doc_type, doc_id in rows[name]:
+                keys.add(_encode((DocumentType.RFC, rfc_id)))
+                keys.add(_encode((doc_type, doc_id)))
+        keys = array('q', sorted(keys))
+
+        edges = {}
+        for name, relation_rows in rows.items():
+            counts = [0] * len(keys)
+            targets = array('i')
+            for rfc_id, doc_type, doc_id in relation_rows:
+                source = bisect_left(keys, _encode((DocumentType.RFC, rfc_id)))
+                counts[source] += 1
+                targets.append(bisect_left(keys, _encode((doc_type, doc_id))))
+            offsets = array('i', [0])
+            for count in counts:
+                offsets.append(offsets[-1] + count)
+            edges[name] = (offsets, targets)
+        return cls(keys, edges)
+
+    @classmethod
+    def load(cls, path: str):
+        """Return the graph saved at `path`, or None if the file is not a
+        complete graph in the current format.
+        """
+        with open(path, 'rb') as graph_file:
+            header = graph_file.read(_HEADER.size)
+            if len(header) != _HEADER.size:
+                return None
+            magic, node_count, *edge_counts = _HEADER.unpack(header)
+            if magic != _MAGIC:
+                return None
+            try:
+                keys = _read(graph_file, 'q', node_count)
+                edges = {}
+                for name, edge_count in zip(RELATIONS, edge_counts):
+                    offsets = _read(graph_file, 'i', node_count + 1)
+                    targets = _read(graph_file, 'i', edge_count)
+                    edges[name] = (offsets, targets)
+            except (EOFError, ValueError):  # Truncated by an interrupted save
+                return None
+        return cls(keys, edges)
+
+    def save(self, path: str):
+        """Write the graph to `path`, replacing any previous file atomically.
+
+        The new file is written under a unique name and flushed to disk
+        before it replaces the old one, so that a crash or a concurrent save
+        leaves a complete graph in place.
+        """
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(path) or os.curdir,
+            prefix=os.path.basename(path) + '.', suffix='.tmp',
+        )
+        try:
+            with os.fdopen(fd, 'wb') as graph_file:
+                graph_file.write(_HEADER.pack(
+                    _MAGIC, len(self.keys),
+                    *(len(self.edges[name][1]) for name in RELATIONS)
+                ))
+                _write(graph_file, self.keys)
+                for name in RELATIONS:
+                    offsets, targets = self.edges[name]
+                    _write(graph_file, offsets)
+                    _write(graph_file, targets)
+                graph_file.flush()
+                os.fsync(graph_file.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def _index(self, node: Node) -> int:
+        """Return the position of `node`, or -1 if it is not in the graph."""
+        key = _encode(node)
+        index = bisect_left(self.keys, key)
+        if index < len(self.keys) and self.keys[index] == key:
+            return index
+        return -1
+
+    def _targets(self, index: int, relation: str, reverse: bool = False):
+        if reverse:
+            offsets, targets = self._reversed(relation)
+        else:
+            offsets, targets = self.edges[relation]
+        return targets[offsets[index]:offsets[index + 1]]
+
+    def _reversed(self, relation: str) -> Tuple[array, array]:
+        """Return the adjacency of `relation` with every edge inverted."""
+        if relation not in self._reverse:
+            offsets, targets = self.edges[relation]
+            incoming = [[] for _ in self.keys]
+            for source in range(len(self.keys)):
+                for target in targets[offsets[source]:offsets[source + 1]]:
+                    incoming[target].append(source)
+            reverse_offsets = array('i', [0])
+            reverse_targets = array('i')
+            for sources in incoming:
+                reverse_targets.extend(sources)
+                reverse_offsets.append(len(reverse_targets))
+            self._reverse[relation] = (reverse_offsets, reverse_targets)
+        return self._reverse[relation]
+
+    def __contains__(self, node: Node) -> bool:
+        return self._index(node) >= 0
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def neighbours(self, node: Node, relation: str) -> List[Node]:
+        """Return the documents `node` links to through `relation`."""
+        index = self._index(node)
+        if index < 0:
+            return []
+        return [_decode(self.keys[target])
+                for target in self._targets(index, relation)]
+
+    def bfs(self, node: Node, relations: Tuple[str, ...],
+            reverse: bool = False) -> Iterator[Tuple[Node, int]]:
+        """Yield every document reachable from `node` through `relations`
+        with its distance from `node`, nearest first.
+
+        `node` itself is yielded first, at distance 0.  If `reverse` is true
+        the edges are followed backwards.
+        """
+        start = self._index(node)
+        if start < 0:
+            return
+        seen = {start}
+        queue = deque([(start, 0)])
+        while queue:
+            index, depth = queue.popleft()
+            yield _decode(self.keys[index]), depth
+            for relation in relations:
+                for target in self._targets(index, relation, reverse):
+                    if target not in seen:
+                        seen.add(target)
+                        queue.append((target, depth + 1))
+
+    def dfs(self, node: Node, relations: Tuple[str, ...],
+            reverse: bool = False) -> Iterator[Tuple[Node, int, str]]:
+        """Yield the depth-first spanning tree rooted at `node` as
+        (document, depth, relation) triplets in pre-order.
+
+        `relation` is the relation through which the document was reached,
+        or None for `node` itself.  Every document is yielded once.
+        """
+        start = self._index(node)
+        if start < 0:
+            return
+        seen = {start}
+        stack = [(start, 0, None)]
+        while stack:
+            index, depth, via = stack.pop()
+            yield _decode(self.keys[index]), depth, via
+            children = []
+            for relation in relations:
+                for target in self._targets(index, relation, reverse):
+                    if target not in seen:
+                        seen.add(target)
+                        children.append((target, depth + 1, relation))
+            stack.extend(reversed(children))  # Visit in edge order
+
+    def descendants(self, node: Node, relations: Tuple[str, ...],
+                    ) -> List[Node]:
+        """Return every document reachable from `node` through `relations`,
+        excluding `node`, nearest first.
+        """
+        return [found for found, depth in self.bfs(node, relations)
+                if depth > 0]
+
+    def ancestors(self, node: Node, relations: Tuple[str, ...],
+                  ) -> List[Node]:
+        """Return every document from which `node` is reachable through
+        `relations`, excluding `node`, nearest first.
+        """
+        return [found for found, depth in
+                self.bfs(node, relations, reverse=True) if depth > 0]
+
+    def current(self, node: Node) -> Node:
+        """Return the document that currently replaces `node`.
+
+        The latest obsoleting document is followed until a document that
+        nothing obsoletes, or one already visited, is reached.
+        """
+        index = self._index(node)
+        if index < 0:
+            return node
+        seen = {index}
+        while True:
+            targets = self._targets(index, 'obsoleted_by')
+            if not targets or targets[-1] in seen:
+                return _decode(self.keys[index])
+            index = targets[-1]
+            seen.add(index)
+
+    def updated_by(self, node: Node) -> List[Node]:
+        """Return every document that updates `node`, directly or through
+        another updating document.
+        """
+        return self.descendants(node, ('updated_by',))
+
+
+def graph_path(db_path: str) -> str:
+    """Return the path of the graph saved next to the DB at `db_path`."""
+    return os.path.splitext(db_path)[0] + '.graph'
+
+
+def build(connection: sqlalchemy.engine.Connection, db_path: str) -> Graph:
+    """Build the graph of the DB at `db_path` and save it next to the DB."""
+    graph = Graph.from_connection(connection)
+    graph.save(graph_path(db_path))
+    return graph
+
+
+def load(connection: sqlalchemy.engine.Connection, db_path: str) -> Graph:
+    """Return the graph saved next to the DB at `db_path`, or build it from
+    the DB if it is missing, incomplete or older than the DB.
+
+    A graph built here is not saved: only `mirror` writes the graph file.
+    The graph is kept in memory until the DB or the graph file changes.
+    """
+    path = graph_path(db_path)
+    db_mtime = os.path.getmtime(db_path)
+    try:
+        graph_mtime = os.path.getmtime(path)
+    except FileNotFoundError:
+        graph_mtime = None
+    cached = _loaded.get(db_path)
+    if cached is not None and cached[0] == (db_mtime, graph_mtime):
+        return cached[1]
+    graph = None
+    if graph_mtime is not None and graph_mtime >= db_mtime:
+        graph = Graph.load(path)
+    if graph is None:
+        graph = Graph.from_connection(connection)
+    _loaded[db_path] = ((db_mtime, graph_mtime), graph)
+    return graph
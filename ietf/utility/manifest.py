@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Manifest of the mirrored files, kept up to date from the changes rsync
+itemizes, so that later stages only process what changed.
+"""
+from typing import Iterable, NamedTuple, Set
+import hashlib
+import os
+import sqlite3
+
+# rsync option printing one line per changed file: its itemized changes
+# (11 characters), a space, then its path relative to the destination
+OUT_FORMAT = '--out-format=%i %n'
+
+# Width of the itemized changes that start each line
+_FLAGS_WIDTH = 11
+
+# Bytes read at a time when hashing a file
+_BLOCK_SIZE = 1024 * 1024
+
+
+class Changes(NamedTuple):
+    """Paths, relative to a document type's directory, that a transfer
+    added, modified or deleted.
+    """
+    added: Set[str]
+    modified: Set[str]
+    deleted: Set[str]
+
+    def paths(self) -> Set[str]:
+        """Return every path that changed."""
+        return self.added | self.modified | self.deleted
+
+
+def parse_itemized(lines: Iterable[str]) -> Changes:
+    """Return the file changes listed in the rsync output `lines`, printed
+    with `OUT_FORMAT`.
+
+    Directories, links and files whose attributes alone changed are
+    ignored.
+    """
+    changes = Changes(set(), set(), set())
+    for line in lines:
+        line = line.rstrip('\n')
+        flags = line[:_FLAGS_WIDTH]
+        path = line[_FLAGS_WIDTH + 1:]
+        if not path or path.endswith('/'):
+            continue
+        if flags.startswith('*deleting'):
+            changes.deleted.add(path)
+        elif flags[0] in '>c' and flags[1] == 'f':  # File transferred
+            if flags[2:].strip('+'):
+                changes.modified.add(path)
+            else:  # Every attribute is new
+                changes.added.add(path)
+    return changes
+
+
+def file_hash(path: str) -> str:
+    """Return the SHA-256 of the contents of the file at `path`."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as hashed_file:
+        for block in iter(lambda: hashed_file.read(_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def manifest_path(top_dir: str) -> str:
+    """Return the path of the manifest of the mirror in `top_dir`."""
+    return os.path.join(top_dir, 'manifest.sqlite3')
+
+
+class Manifest:
+    """Path, size, mtime and hash of each mirrored file by document type,
+    stored in an SQLite file.
+    """
+
+    def __init__(self, path: str):
+        self.connection = sqlite3.connect(path, timeout=5)
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS file ('
+            'doc_type TEXT NOT NULL, path TEXT NOT NULL, '
+            'size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, '
+            'sha256 TEXT NOT NULL, PRIMARY KEY (doc_type, path))'
+        )
+
+    def close(self):
+        self.connection.close()
+
+    def get(self, doc_type: str, path: str):
+        """Return the (size, mtime_ns, sha256) recorded for `path`, or None.
+        """
+        return self.connection.execute(
+            'SELECT size, mtime_ns, sha256 FROM file '
+            'WHERE doc_type = ? AND path = ?', (doc_type, path),
+        ).fetchone()
+
+    def apply(self, doc_type: str, root: str, changes: Changes) -> Changes:
+        """Record `changes` to the files of `doc_type` under `root` and
+        return them without the modified files whose contents are unchanged.
+
+        Files reported as added or modified that no longer exist are
+        recorded as deleted.
+        """
+        applied = Changes(set(), set(), set(changes.deleted))
+        with self.connection:
+            for path in sorted(changes.added | changes.modified):
+                full_path = os.path.join(root, path)
+                try:
+                    stat = os.stat(full_path)
+                    digest = file_hash(full_path)
+                except FileNotFoundError:
+                    applied.deleted.add(path)
+                    continue
+                old = self.get(doc_type, path)
+                if old is None:
+                    applied.added.add(path)
+                elif old[2] != digest:
+                    applied.modified.add(path)
+                self.connection.execute(
+                    'INSERT OR REPLACE INTO file VALUES (?, ?, ?, ?, ?)',
+                    (doc_type, path, stat.st_size, stat.st_mtime_ns, digest),
+                )
+            self.connection.executemany(
+                'DELETE FROM file WHERE doc_type = ? AND path = ?',
+                [(doc_type, path) for path in applied.deleted],
+            )
+        return applied
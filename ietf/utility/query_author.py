@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 from ietf.sql.rfc import Author, Rfc
+from sqlalchemy import and_, exists, or_, select
+from sqlalchemy.orm import aliased
 from string import ascii_uppercase
 
 
@@ -11,119 +13,83 @@ def _has_capital(the_string):
         return False
 
 
+def _match_author(column, term):
+    """Return a criterion matching RFCs with an author whose `column` matches
+    `term`.
+
+    `term` is matched exactly if any author in the DB matches it exactly, and
+    case-insensitively otherwise.  The check for an exact match is an
+    uncorrelated subquery, so it is evaluated once as part of the statement
+    instead of as a separate probe query.
+    """
+    term = term.replace('*', '%')  # Substitute wildcard character
+    probe = aliased(Author)  # Keep the probe from correlating with `Author`
+    no_exact = ~exists().where(getattr(probe, column.key) == term)
+    # SQLite's LIKE ignores ASCII case and, unlike `ilike`, can use the
+    # column's NOCASE index
+    matches = or_(column == term, and_(no_exact, column.like(term)))
+    return Rfc.id.in_(select(Author.rfc_id).where(matches))
+
+
+def query_author(Session, names=None, titles=None, orgs=None, abbrevs=None):
+    """Return a query that, if run, would return RFCs whose authors match every
+    string in `names`, `titles`, `orgs` and `abbrevs`.
+
+    Each string is matched against the authors' names, titles, organizations
+    or organization abbreviations respectively, as described in
+    `query_author_by_name`.  All criteria are compiled into a single SQL
+    statement.
+    """
+    criteria = []
+    for column, terms in ((Author.name, names),
+                          (Author.title, titles),
+                          (Author.organization, orgs),
+                          (Author.org_abbrev, abbrevs)):
+        for term in terms or ():
+            criteria.append(_match_author(column, term))
+    return Session.query(Rfc).filter(*criteria)
+
+
 def query_author_by_name(Session, names):
     """Return a query that, if run, would return RFCs whose authors match every
     string in `names`.
 
-    The matching on `names` is case-insensitive.  Asterisks (*) in passed names
-    are replaced with percent signs (%) to function as wildcards in the actual
-    SQL query.
+    The matching on `names` is case-insensitive unless an author's name
+    matches exactly.  Asterisks (*) in passed names are replaced with percent
+    signs (%) to function as wildcards in the actual SQL query.
     """
-    # Assemble a query for each name
-    queries = []  # Empty list to store queries
-    for name in names:
-        name = name.replace('*', '%')  # Substitute wildcard character
-        # Attempt an exact search
-        query = Session.query(Rfc).join(Author).filter(Author.name == name)
-        if query.first():  # If that returns something, add the query
-            queries.append(query)
-        else:  # Otherwise add a case-insensitive query
-            queries.append(
-                Session.query(Rfc).join(Author).
-                filter(Author.name.ilike(name))
-            )
-    # Build a query of intersections
-    query_to_run = queries[0]  # Assign first query
-    for query in queries[1:]:  # Start at second element in list
-        query_to_run = query_to_run.intersect(query)
-    # Return the built query
-    return query_to_run
+    return query_author(Session, names=names)
 
 
 def query_author_by_org(Session, orgs):
     """Return a query that, if run, would return all RFCs whose authors'
     organizations match every string in `orgs`.
 
-    The matching on `orgs` is case-insensitive.  Asterisks (*) in passed orgs
-    are replaced with percent signs (%) to function as wildcards in the actual
-    SQL query.
+    The matching on `orgs` is case-insensitive unless an author's
+    organization matches exactly.  Asterisks (*) in passed orgs are replaced
+    with percent signs (%) to function as wildcards in the actual SQL query.
     """
-    # Assemble a query for each org
-    queries = []  # Empty list to store queries
-    for org in orgs:
-        org = org.replace('*', '%')  # Substitute wildcard character
-        # Attempt an exact search
-        query = Session.query(Rfc).join(Author).\
-            filter(Author.organization == org)
-        if query.first():  # If that returns something, add the query
-            queries.append(query)
-        else:  # Otherwise add a case-insensitive query
-            queries.append(
-                Session.query(Rfc).join(Author).
-                filter(Author.organization.ilike(org))
-            )
-    # Build a query of intersections
-    query_to_run = queries[0]  # Assign first query
-    for query in queries[1:]:  # Start at second element in list
-        query_to_run = query_to_run.intersect(query)
-    # Return the built query
-    return query_to_run
+    return query_author(Session, orgs=orgs)
 
 
 def query_author_by_orgabbrev(Session, abbrevs):
     """Return a query that, if run, would return all RFCs whose authors'
     abbreviations match every string in `abbrevs`.
 
-    The matching on `abbrevs` is case-insensitive.  Asterisks (*) in passed
-    abbreviations are replaced with percent signs (%) to function as wildcards
-    in the actual SQL query.
+    The matching on `abbrevs` is case-insensitive unless an author's
+    abbreviation matches exactly.  Asterisks (*) in passed abbreviations are
+    replaced with percent signs (%) to function as wildcards in the actual SQL
+    query.
     """
-    # Assemble a query for each abbrev
-    queries = []  # Empty list to store queries
-    for abbrev in abbrevs:
-        abbrev = abbrev.replace('*', '%')  # Substitute wildcard character
-        # Attempt an exact search
-        query = Session.query(Rfc).join(Author).\
-            filter(Author.org_abbrev == abbrev)
-        if query.first():  # If that returns something, add the query
-            queries.append(query)
-        else:  # Otherwise add a case-insensitive query
-            queries.append(
-                Session.query(Rfc).join(Author).
-                filter(Author.org_abbrev.ilike(abbrev))
-            )
-    # Build a query of intersections
-    query_to_run = queries[0]  # Assign first query
-    for query in queries[1:]:  # Start at second element in list
-        query_to_run = query_to_run.intersect(query)
-    # Return the built query
-    return query_to_run
+    return query_author(Session, abbrevs=abbrevs)
 
 
 def query_author_by_title(Session, titles):
     """Return a query that, if run, would return all RFCs whose authors' titles
     match every string in `titles`.
 
-    The matching on `titles` is case-insensitive.  Asterisks (*) in passed
-    titles are replaced with percent signs (%) to function as wildcards in the
-    actual SQL query.
+    The matching on `titles` is case-insensitive unless an author's title
+    matches exactly.  Asterisks (*) in passed titles are replaced with percent
+    signs (%) to function as wildcards in the actual SQL query.
     """
-    # Assemble a query for each title
-    queries = []  # Empty list to store queries
-    for title in titles:
-        title = title.replace('*', '%')  # Substitute wildcard character
-        # Attempt an exact search
-        query = Session.query(Rfc).join(Author).filter(Author.title == title)
-        if query.first():  # If that returns something, add the query
-            queries.append(query)
-        else:  # Otherwise add a case-insensitive query
-            queries.append(
-                Session.query(Rfc).join(Author).
-                filter(Author.title.ilike(title))
-            )
-    # Build a query of intersections
-    query_to_run = queries[0]  # Assign first query
-    for query in queries[1:]:  # Start at second element in list
-        query_to_run = query_to_run.intersect(query)
-    # Return the built query
-    return query_to_run
+    return query_author(Session, titles=titles)
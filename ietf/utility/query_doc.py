@@ -1,54 +1,218 @@
 #!/usr/bin/env python3
 from ietf.sql.bcp import Bcp
 from ietf.sql.fyi import Fyi
-from ietf.sql.rfc import Rfc
+from ietf.sql.rfc import ObsoletedBy, Rfc, UpdatedBy
 from ietf.sql.rfc_not_issued import RfcNotIssued
 from ietf.sql.std import Std
 from ietf.xml.enum import DocumentType
+from sqlalchemy import (String, and_, bindparam, cast, func, literal, or_,
+                        select,)
+from sqlalchemy.orm import aliased
+
+# Most IDs bound in a single `IN (...)` list, keeping statements below the
+# 999 parameters that SQLite allowed before version 3.32
+_MAX_IDS = 900
+
+
+def _chunks(numbers):
+    """Yield `numbers` in lists of at most `_MAX_IDS` elements."""
+    numbers = list(numbers)
+    for start in range(0, len(numbers), _MAX_IDS):
+        yield numbers[start:start + _MAX_IDS]
+
+
+def _query_by_ids(session, cls, numbers, options=()):
+    """Return a dict mapping each of `numbers` to the `cls` row with that ID,
+    or to None if there is no such row.
+
+    The rows are looked up with one `IN (...)` query per `_MAX_IDS` numbers,
+    applying the loader `options` to each query.
+    """
+    docs = dict.fromkeys(numbers)
+    for chunk in _chunks(docs):
+        for doc in session.query(cls).options(*options).\
+                filter(cls.id.in_(chunk)):
+            docs[doc.id] = doc
+    return docs
+
+
+# Statement looking up a row by its ID, per class, built on first use and
+# then executed with the ID as its only bound parameter, so that its compiled
+# form is found in the engine's cache without rebuilding it on every call
+_ID_STATEMENTS = {}
+
+
+def _query_by_id(session, cls, number):
+    """Return the `cls` row with ID `number`, or None."""
+    statement = _ID_STATEMENTS.get(cls)
+    if statement is None:
+        statement = select(cls).where(cls.id == bindparam('id'))
+        _ID_STATEMENTS[cls] = statement
+    return session.execute(statement, {'id': number}).scalar_one_or_none()
 
 
 def query_rfc(session, number):
-    row = session.query(Rfc).\
-                  filter(Rfc.id == number).\
-                  one_or_none()
-    return row
+    """Return an Rfc object or None."""
+    return _query_by_id(session, Rfc, number)
+
+
+def query_rfcs(session, numbers, options=()):
+    """Return a dict mapping each of `numbers` to its Rfc or None."""
+    return _query_by_ids(session, Rfc, numbers, options)
+
+
+# Document types with a table of their own
+_CHAIN_TYPES = {DocumentType.RFC: Rfc,
+                DocumentType.STD: Std,
+                DocumentType.BCP: Bcp,
+                DocumentType.FYI: Fyi}
+
+
+def _chain_cte(relation, numbers):
+    """Return a recursive CTE walking `relation` (ObsoletedBy or UpdatedBy)
+    from each of the RFCs in `numbers`.
+
+    Each row is (start, depth, doc_type, doc_id), where depth 0 is the
+    existing RFC `start` itself and every further step follows the latest
+    `relation` row of the previous RFC.  Only RFCs have further steps, and an
+    RFC already on the path is never revisited, so cycles terminate.
+    """
+    anchor = select(
+        Rfc.id.label('start'),
+        literal(0).label('depth'),
+        literal(DocumentType.RFC.name).label('doc_type'),
+        Rfc.id.label('doc_id'),
+        ('/' + cast(Rfc.id, String) + '/').label('path'),
+    ).where(Rfc.id.in_(numbers))
+    chain = anchor.cte('chain', recursive=True)
+
+    step = aliased(relation)
+    later = aliased(relation)
+    latest = select(func.max(later.id)).\
+        where(later.rfc_id == chain.c.doc_id).\
+        scalar_subquery()
+    hop = '/' + cast(step.doc_id, String) + '/'
+    recursive = select(
+        chain.c.start,
+        chain.c.depth + 1,
+        cast(step.doc_type, String),
+        step.doc_id,
+        chain.c.path + cast(step.doc_id, String) + '/',
+    ).where(chain.c.doc_type == DocumentType.RFC.name,
+            step.id == latest,
+            step.doc_type.in_(list(_CHAIN_TYPES)),
+            or_(step.doc_type != DocumentType.RFC,
+                ~chain.c.path.contains(hop)))
+    return chain.union_all(recursive)
+
+
+def query_rfc_chains(session, relation, numbers):
+    """Return a dict mapping each existing RFC in `numbers` to its chain of
+    `relation` (ObsoletedBy or UpdatedBy) documents.
+
+    Each chain is a list of (DocumentType, int) pairs starting with the RFC
+    itself and ending with the document that nothing further obsoletes or
+    updates.  All chains are resolved in a single query.
+    """
+    chains = {}
+    for chunk in _chunks(numbers):
+        chain = _chain_cte(relation, chunk)
+        rows = session.execute(
+            select(chain.c.start, chain.c.doc_type, chain.c.doc_id).
+            order_by(chain.c.start, chain.c.depth)
+        )
+        for start, doc_type, doc_id in rows:
+            chains.setdefault(start, []).append((DocumentType[doc_type],
+                                                 doc_id))
+    return chains
+
+
+def _query_chain_ends(session, relation, numbers, options=()):
+    """Return a dict mapping each RFC in `numbers` to the document at the end
+    of its `relation` chain, or to None if either does not exist.
+
+    RFCs at the end of a chain are loaded, with the loader `options`, in the
+    same query that resolves the chains; other document types with one
+    further query per type.
+    """
+    docs = dict.fromkeys(numbers)
+    pending = {}  # Starts of the chains ending in other document types
+    for chunk in _chunks(docs):
+        chain = _chain_cte(relation, chunk)
+        # Keep the last row of every chain
+        deepest = select(chain.c.start,
+                         func.max(chain.c.depth).label('depth')).\
+            group_by(chain.c.start).\
+            subquery()
+        ends = select(chain.c.start, chain.c.doc_type, chain.c.doc_id, Rfc).\
+            join(deepest, and_(chain.c.start == deepest.c.start,
+                               chain.c.depth == deepest.c.depth)).\
+            outerjoin(Rfc, and_(chain.c.doc_type == DocumentType.RFC.name,
+                                Rfc.id == chain.c.doc_id)).\
+            options(*options)
+        for start, doc_type, doc_id, rfc in session.execute(ends):
+            if doc_type == DocumentType.RFC.name:
+                docs[start] = rfc
+            else:
+                pending.setdefault((DocumentType[doc_type], doc_id), []).\
+                    append(start)
+    for node, doc in query_docs(session, pending).items():
+        for start in pending[node]:
+            docs[start] = doc
+    return docs
+
+
+def query_docs(session, nodes, options=()):
+    """Return a dict mapping each (DocumentType, int) pair in `nodes` to its
+    document, or to None if it does not exist or is of a type with no table.
+
+    Documents are loaded with one `IN (...)` query per type; the loader
+    `options` apply to RFCs.
+    """
+    docs = dict.fromkeys(nodes)
+    by_type = {}
+    for doc_type, doc_id in docs:
+        by_type.setdefault(doc_type, []).append(doc_id)
+    for doc_type, numbers in by_type.items():
+        cls = _CHAIN_TYPES.get(doc_type)
+        if cls is None:
+            continue
+        found = _query_by_ids(session, cls,
+                              numbers, options if cls is Rfc else ())
+        for doc_id, doc in found.items():
+            docs[(doc_type, doc_id)] = doc
+    return docs
+
+
+def query_rfcs_updates(session, numbers, options=()):
+    """Return a dict mapping each RFC in `numbers` to its most up-to-date
+    document, following updates transitively.
+
+    RFCs that nothing updates map to themselves and nonexistent RFCs map to
+    None.  The loader `options` apply to RFCs.
+    """
+    return _query_chain_ends(session, UpdatedBy, numbers, options)
 
 
 def query_rfc_updates(session, number):
     """Return the most up-to-date document for RFC `number`."""
-    orig = query_rfc(session, number)
-    # If there are no updates then return the original
-    if (orig is None) or (not orig.updated_by):
-        return orig
-    # Else return the latest document
-    else:
-        update_doc = orig.updated_by[-1]
-        update_type = update_doc.doc_type
-        update_id = update_doc.doc_id
-        if update_type is DocumentType.RFC:
-            return query_rfc(session, update_id)
-        elif update_type is DocumentType.STD:
-            return query_std(session, update_id)
-        elif update_type is DocumentType.BCP:
-            return query_bcp(session, update_id)
-        elif update_type is DocumentType.FYI:
-            return query_fyi(session, update_id)
-        else:
-            return orig
+    return query_rfcs_updates(session, [number])[number]
+
+
+def query_rfcs_obsoletes(session, numbers, options=()):
+    """Return a dict mapping each RFC in `numbers` to the latest RFC that
+    obsoletes it, following obsoletions transitively.
+
+    RFCs that nothing obsoletes map to themselves and nonexistent RFCs map to
+    None.  The loader `options` apply to RFCs.
+    """
+    return _query_chain_ends(session, ObsoletedBy, numbers, options)
 
 
 def query_rfc_obsoletes(session, number):
     """Return the latest RFC that obsoletes `number` if such an RFC exists,
     otherwise return RFC `number`."""
-    # Lookup RFC `number`
-    cur_rfc = query_rfc(session, number)
-    # If there is no updated_by then return the original
-    if (cur_rfc is None) or (not cur_rfc.obsoleted_by):
-        return cur_rfc
-    # Else recurse
-    else:
-        obsoleting_id = cur_rfc.obsoleted_by[-1].doc_id
-        return query_rfc_obsoletes(session, obsoleting_id)
+    return query_rfcs_obsoletes(session, [number])[number]
 
 
 def query_rfc_see_also(session, number):
@@ -57,28 +221,77 @@ def query_rfc_see_also(session, number):
 
 def query_rfc_not_issued(session, number):
     """Return an RfcNotIssued object or None."""
-    row = session.query(RfcNotIssued).\
-        filter(RfcNotIssued.id == number).\
-        one_or_none()
-    return row
+    return _query_by_id(session, RfcNotIssued, number)
+
+
+def query_rfcs_not_issued(session, numbers):
+    """Return a dict mapping each of `numbers` to its RfcNotIssued or None."""
+    return _query_by_ids(session, RfcNotIssued, numbers)
 
 
 def query_std(session, number):
-    row = session.query(Std).\
-                  filter(Std.id == number).\
-                  one_or_none()
-    return row
+    """Return a Std object or None."""
+    return _query_by_id(session, Std, number)
+
+
+def query_stds(session, numbers):
+    """Return a dict mapping each of `numbers` to its Std or None."""
+    return _query_by_ids(session, Std, numbers)
 
 
 def query_bcp(session, number):
-    row = session.query(Bcp).\
-                  filter(Bcp.id == number).\
-                  one_or_none()
-    return row
+    """Return a Bcp object or None."""
+    return _query_by_id(session, Bcp, number)
+
+
+def query_bcps(session, numbers):
+    """Return a dict mapping each of `numbers` to its Bcp or None."""
+    return _query_by_ids(session, Bcp, numbers)
 
 
 def query_fyi(session, number):
-    row = session.query(Fyi).\
-                  filter(Fyi.id == number).\
-                  one_or_none()
-    return row
+    """Return a Fyi object or None."""
+    return _query_by_id(session, Fyi, number)
+
+
+def query_fyis(session, numbers):
+    """Return a dict mapping each of `numbers` to its Fyi or None."""
+    return _query_by_ids(session, Fyi, numbers)
+
+
+# Statement selecting the (id, title) rows whose ID is in the expanding
+# parameter `ids`, per document type, built on first use like
+# `_ID_STATEMENTS`
+_TITLE_STATEMENTS = {}
+
+
+def query_titles(session, doc_type, numbers):
+    """Return a dict mapping each of `numbers` to the (id, title) row of the
+    `doc_type` document with that ID, or to None if there is no such
+    document.
+
+    The rows are plain Core rows, read without loading any ORM object, with
+    one query per `_MAX_IDS` numbers.  Pending changes are flushed first if
+    the session autoflushes, as they would be by an ORM query.
+    """
+    statement = _TITLE_STATEMENTS.get(doc_type)
+    if statement is None:
+        table = _CHAIN_TYPES[doc_type].__table__
+        statement = select(table.c.id, table.c.title).\
+            where(table.c.id.in_(bindparam('ids', expanding=True)))
+        _TITLE_STATEMENTS[doc_type] = statement
+    if session.autoflush:
+        session.flush()
+    connection = session.connection()
+    docs = dict.fromkeys(numbers)
+    for chunk in _chunks(docs):
+        for row in connection.execute(statement, {'ids': chunk}):
+            docs[row.id] = row
+    return docs
+
+
+def query_title(session, doc_type, number):
+    """Return the (id, title) row of the `doc_type` document `number`, or
+    None.
+    """
+    return query_titles(session, doc_type, [number])[number]
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+from ietf.sql.rfc import Rfc
+from ietf.sql.search import rank, rfc_search
+
+
+def query_search(Session, search_terms, options=()):
+    """Return a query that, if run, would return the RFCs matching the FTS5
+    query `search_terms`, best match first.
+
+    The terms are joined with spaces, so every term must match.  Each term
+    can be a phrase in double quotes, a prefix ending in `*` or any other
+    FTS5 query syntax, such as `title:` to search a single column.
+    """
+    match = ' '.join(search_terms)
+    return Session.query(Rfc).options(*options).\
+        join(rfc_search, rfc_search.c.rowid == Rfc.id).\
+        filter(rfc_search.c.rfc_search.op('MATCH')(match)).\
+        order_by(rank(), Rfc.id)
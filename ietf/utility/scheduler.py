@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Run rsync transfers a few at a time, retrying the ones that fail, and
+start the stages that depend on each transfer as soon as it is done.
+"""
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from subprocess import PIPE, Popen
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+import re
+import time
+
+# Exit statuses of a complete transfer; 24 means that some source files
+# vanished while being transferred
+SUCCESS_EXITCODES = (0, 24)
+
+# Exit statuses that another attempt would not change: syntax or usage
+# error, incompatible protocols and unsupported action
+_FATAL_EXITCODES = (1, 2, 4)
+
+# Line printed by `--info=progress2`, e.g.
+# `  1,234,567  45%  1.23MB/s    0:00:12 (xfr#12, to-chk=100/2000)`
+_PROGRESS_RE = re.compile(r'^\s*([\d,]+)\s+\d+%\s+\S+\s+\S+'
+                          r'(?:\s+\(xfr#(\d+), \w+-chk=\d+/\d+\))?\s*$')
+
+
+class Job(NamedTuple):
+    name: str
+    command: List[str]
+    priority: int = 0  # Jobs with lower priorities start first
+    # Run with the job's result once the transfer is done
+    stage: Optional[Callable[['Result'], None]] = None
+
+
+class Progress(NamedTuple):
+    name: str
+    attempt: int
+    bytes: int  # Transferred so far, over every attempt
+    files: int
+    elapsed: float  # Seconds since the first attempt started
+
+
+class Result(NamedTuple):
+    name: str
+    exitcode: int  # Of the last attempt
+    attempts: int
+    bytes: int
+    files: int
+    elapsed: float
+    output: List[str]  # Every line but progress, over every attempt
+
+    @property
+    def ok(self) -> bool:
+        return self.exitcode in SUCCESS_EXITCODES
+
+
+def run_job(job: Job, retries: int = 3, backoff: float = 1.0,
+            on_progress: Callable[[Progress], None] = None,
+            sleep: Callable[[float], None] = time.sleep) -> Result:
+    """Run the rsync command of `job` until it succeeds or fails for good.
+
+    A failed transfer is attempted again up to `retries` times, waiting
+    `backoff` seconds before the first retry and twice as long before each
+    following one.  The progress rsync reports with `--info=progress2` is
+    passed to `on_progress` as it comes.
+    """
+    start = time.monotonic()
+    output = []
+    total_bytes = total_files = 0
+    for attempt in range(1, retries + 2):
+        process = Popen(job.command, stdout=PIPE, universal_newlines=True)
+        attempt_bytes = attempt_files = 0
+        # Universal newlines turn the carriage returns ending each progress
+        # update into line breaks
+        for line in process.stdout:
+            match = _PROGRESS_RE.match(line)
+            if match is None:
+                if line.strip():
+                    output.append(line)
+                continue
+            attempt_bytes = int(match.group(1).replace(',', ''))
+            if match.group(2):
+                attempt_files = int(match.group(2))
+            if on_progress is not None:
+                on_progress(Progress(
+                    job.name, attempt, total_bytes + attempt_bytes,
+                    total_files + attempt_files, time.monotonic() - start,
+                ))
+        exitcode = process.wait()
+        total_bytes += attempt_bytes
+        total_files += attempt_files
+        if (exitcode in SUCCESS_EXITCODES or exitcode in _FATAL_EXITCODES or
+                attempt > retries):
+            break
+        sleep(backoff * 2 ** (attempt - 1))
+    return Result(job.name, exitcode, attempt, total_bytes, total_files,
+                  time.monotonic() - start, output)
+
+
+def run_jobs(jobs: Iterable[Job], workers: int = 2, retries: int = 3,
+             backoff: float = 1.0,
+             on_progress: Callable[[Progress], None] = None,
+             on_done: Callable[[Result], None] = None) -> Dict[str, Result]:
+    """Run `jobs` with at most `workers` at a time, lowest priority first,
+    and return their results by name once every job and stage is done.
+
+    Each job is run by `run_job`, from a thread of its own.  `on_progress`
+    is called from those threads, and `on_done` from this one as each job
+    finishes.  The `stage` of a finished job is then started right away on
+    another thread, one stage at a time, while the remaining transfers go
+    on.  An exception raised by a stage is raised again here once all jobs
+    and stages are done.
+    """
+    results = {}
+    stage_futures = []
+    with ThreadPoolExecutor(workers) as executor, \
+            ThreadPoolExecutor(1) as stages:
+        futures = {executor.submit(run_job, job, retries, backoff,
+                                   on_progress): job
+                   for job in sorted(jobs, key=lambda job: job.priority)}
+        for future in as_completed(futures):
+            result = future.result()
+            results[result.name] = result
+            if on_done is not None:
+                on_done(result)
+            stage = futures[future].stage
+            if stage is not None:
+                stage_futures.append(stages.submit(stage, result))
+    for future in stage_futures:
+        future.result()  # Raise what the stage raised, if anything
+    return results
@@ -5,19 +5,25 @@ import sqlalchemy.orm
 import xml.etree.ElementTree
 
 
+def add_entry(session: sqlalchemy.orm.session.Session,
+              entry: xml.etree.ElementTree.Element):
+    """Add a single BCP `entry` to sqlalchemy `session`."""
+    doc_id = find_doc_id(entry)
+    title = find_title(entry)
+
+    bcp = Bcp(
+        # Create the Fyi object with its single-column values set
+        id=doc_id,
+        title=title,
+    )
+
+    session.add(bcp)
+
+
 def add_all(session: sqlalchemy.orm.session.Session,
             root: xml.etree.ElementTree.Element):
     """Add all BCP entries from XML `root` to sqlalchemy `session`."""
 
     entries = findall(root, 'bcp-entry')
     for entry in entries:
-        doc_id = find_doc_id(entry)
-        title = find_title(entry)
-
-        bcp = Bcp(
-            # Create the Fyi object with its single-column values set
-            id=doc_id,
-            title=title,
-        )
-
-        session.add(bcp)
+        add_entry(session, entry)
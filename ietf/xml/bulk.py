@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+from ietf.sql.base import Base
+from ietf.sql.bcp import Bcp
+from ietf.sql.fyi import Fyi
+from ietf.sql.rfc import (Abstract, Author, FileFormat, IsAlso, Keyword,
+                          ObsoletedBy, Obsoletes, Rfc, SeeAlso, Stream,
+                          UpdatedBy, Updates, rfc_keyword,)
+from ietf.sql.rfc_not_issued import RfcNotIssued
+from ietf.sql.std import Std
+from ietf.xml.index import entry_type, iterentries
+from ietf.xml.record import RfcRecord
+from sqlalchemy import func, select
+from typing import Optional, Tuple
+import ietf.xml.parse as parse
+import sqlalchemy.engine
+import xml.etree.ElementTree
+
+# Number of pending rows that triggers a write to the DB
+BATCH_SIZE = 5000
+
+# Map each entry type to the table holding its rows
+ENTRY_TABLES = {
+    'bcp-entry': Bcp.__table__,
+    'fyi-entry': Fyi.__table__,
+    'rfc-entry': Rfc.__table__,
+    'rfc-not-issued-entry': RfcNotIssued.__table__,
+    'std-entry': Std.__table__,
+}
+
+# Tables whose primary key is assigned by the loader
+_ID_TABLES = (Abstract, Author, Bcp, FileFormat, Fyi, IsAlso, Keyword,
+              ObsoletedBy, Obsoletes, Rfc, RfcNotIssued, SeeAlso, Std, Stream,
+              UpdatedBy, Updates)
+
+# Child tables holding lists of document references for an RFC, keyed by the
+# field of an RfcRecord holding the list
+_DOC_ID_TABLES = (('obsoletes', Obsoletes),
+                  ('obsoleted_by', ObsoletedBy),
+                  ('updates', Updates),
+                  ('updated_by', UpdatedBy),
+                  ('is_also', IsAlso),
+                  ('see_also', SeeAlso))
+
+Record = Tuple[str, Optional[RfcRecord]]
+
+
+def parse_entry(entry: xml.etree.ElementTree.Element) -> Record:
+    """Return the type of `entry` and its decoded record.
+
+    The record only holds plain values, so it can be passed between
+    processes.  Entries of unknown types are returned with a record of None.
+    """
+    kind = entry_type(entry)
+    if kind not in ENTRY_TABLES:
+        return kind, None
+    return kind, parse.decode_entry(entry)
+
+
+class BulkLoader:
+    """Write index entries to the DB as batches of Core inserts.
+
+    Rows are buffered per table and written with a single `executemany` per
+    table, bypassing the ORM unit of work.  Primary keys are assigned by the
+    loader in the same order that the ORM path would assign them, so both
+    paths produce identical DB contents.
+    """
+
+    def __init__(self, connection: sqlalchemy.engine.Connection,
+                 batch_size: int = BATCH_SIZE):
+        self.connection = connection
+        self.batch_size = batch_size
+        self.pending = 0  # Number of buffered rows
+        # Rows waiting to be written, in dependency order
+        self.rows = {}
+        for table in Base.metadata.sorted_tables:
+            self.rows[table] = []
+        # Next free primary key for each table
+        self.next_id = {}
+        for cls in _ID_TABLES:
+            max_id = connection.execute(select(func.max(cls.id))).scalar()
+            self.next_id[cls.__table__] = (max_id or 0) + 1
+        # Existing keywords
+        self.keywords = dict(
+            connection.execute(select(Keyword.word, Keyword.id)).all()
+        )
+
+    def add_row(self, table, row: dict) -> int:
+        """Buffer `row` for `table`, assigning it a primary key if needed."""
+        if table in self.next_id:
+            row.setdefault('id', self.next_id[table])
+            self.next_id[table] = max(self.next_id[table], row['id'] + 1)
+        self.rows[table].append(row)
+        self.pending += 1
+        return row.get('id')
+
+    def _keyword_id(self, word: str) -> int:
+        """Return the ID of keyword `word`, buffering a new row if needed."""
+        keyword_id = self.keywords.get(word)
+        if keyword_id is None:
+            keyword_id = self.add_row(Keyword.__table__, {'word': word})
+            self.keywords[word] = keyword_id
+        return keyword_id
+
+    def _add_rfc(self, record: RfcRecord):
+        """Buffer the rows for a single parsed RFC and its children."""
+        year, month, day = record.date
+        rfc_id = self.add_row(Rfc.__table__, {
+            'id': record.doc_id,
+            'title': record.title,
+            'date_year': year, 'date_month': month, 'date_day': day,
+            'draft': record.draft,
+            'notes': record.notes,
+            'current_status': record.current_status,
+            'publication_status': record.publication_status,
+            'area': record.area,
+            'wg_acronym': record.wg_acronym,
+            'errata_url': record.errata_url,
+            'doi': record.doi,
+        })
+        for name, title, organization, org_abbrev in record.authors:
+            self.add_row(Author.__table__, {'name': name,
+                                            'title': title,
+                                            'organization': organization,
+                                            'org_abbrev': org_abbrev,
+                                            'rfc_id': rfc_id})
+        for filetype, char_count, page_count in record.formats:
+            self.add_row(FileFormat.__table__, {'filetype': filetype,
+                                                'char_count': char_count,
+                                                'page_count': page_count,
+                                                'rfc_id': rfc_id})
+        keyword_ids = []
+        for word in record.keywords:
+            keyword_id = self._keyword_id(word)
+            if keyword_id not in keyword_ids:  # Keep (rfc, keyword) unique
+                keyword_ids.append(keyword_id)
+        for keyword_id in keyword_ids:
+            self.add_row(rfc_keyword, {'rfc_id': rfc_id,
+                                       'keyword_id': keyword_id})
+        for par in record.abstract:
+            self.add_row(Abstract.__table__, {'par': par, 'rfc_id': rfc_id})
+        for name, cls in _DOC_ID_TABLES:
+            for doc_type, doc_id in getattr(record, name):
+                self.add_row(cls.__table__, {'doc_id': doc_id,
+                                             'doc_type': doc_type,
+                                             'rfc_id': rfc_id})
+        for value in record.stream:
+            self.add_row(Stream.__table__, {'stream': value,
+                                            'rfc_id': rfc_id})
+
+    def add_record(self, kind: str, record: Optional[RfcRecord]):
+        """Buffer the rows for a record returned by `parse_entry`, writing
+        them out once a full batch is pending.
+        """
+        if kind == 'rfc-entry':
+            self._add_rfc(record)
+        elif kind == 'rfc-not-issued-entry':
+            self.add_row(ENTRY_TABLES[kind], {'id': record.doc_id})
+        elif record is not None:  # Ignore unknown entry types
+            self.add_row(ENTRY_TABLES[kind], {'id': record.doc_id,
+                                              'title': record.title})
+        if self.pending >= self.batch_size:
+            self.flush()
+
+    def add_entry(self, entry: xml.etree.ElementTree.Element):
+        """Buffer the rows for `entry`, writing them out once a full batch
+        is pending.
+        """
+        self.add_record(*parse_entry(entry))
+
+    def flush(self):
+        """Write every buffered row to the DB."""
+        for table, rows in self.rows.items():
+            if rows:
+                self.connection.execute(table.insert(), rows)
+                self.rows[table] = []
+        self.pending = 0
+
+
+def add_all(connection: sqlalchemy.engine.Connection, source):
+    """Add all entries from the XML index at `source` to the DB reachable
+    through `connection` using batched Core inserts.
+    """
+    loader = BulkLoader(connection)
+    for entry in iterentries(source):
+        loader.add_entry(entry)
+    loader.flush()
@@ -5,19 +5,26 @@ from .parse import findall, find_doc_id, find_title
 import sqlalchemy.orm
 import xml.etree.ElementTree
 
+
+def add_entry(session: sqlalchemy.orm.session.Session,
+              entry: xml.etree.ElementTree.Element):
+    """Add a single FYI `entry` to sqlalchemy `session`."""
+    doc_id = find_doc_id(entry)
+    title = find_title(entry)
+
+    fyi = Fyi(
+        # Create the Fyi object with its single-column values set
+        id=doc_id,
+        title=title,
+    )
+
+    session.add(fyi)
+
+
 def add_all(session: sqlalchemy.orm.session.Session,
             root: xml.etree.ElementTree.Element):
     """Add all FYI entries from XML `root` to sqlalchemy `session`."""
 
     entries = findall(root, 'fyi-entry')
     for entry in entries:
-        doc_id = find_doc_id(entry)
-        title = find_title(entry)
-
-        fyi = Fyi(
-            # Create the Fyi object with its single-column values set
-            id=doc_id,
-            title=title,
-        )
-
-        session.add(fyi)
+        add_entry(session, entry)
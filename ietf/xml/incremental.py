@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+from ietf.sql.base import Base
+from ietf.sql.fingerprint import Fingerprint
+from ietf.xml.bulk import ENTRY_TABLES, BulkLoader
+from ietf.xml.parallel import iterrecords
+from sqlalchemy import select
+from typing import NamedTuple
+import sqlalchemy.engine
+
+# Tables holding rows that belong to an RFC
+_RFC_CHILD_TABLES = [table for table in Base.metadata.sorted_tables
+                     if 'rfc_id' in table.c]
+
+
+class UpdateCounts(NamedTuple):
+    """Number of entries touched by `update_all`."""
+    added: int
+    changed: int
+    removed: int
+
+
+def _delete(connection: sqlalchemy.engine.Connection, entry_type: str,
+            doc_id: int):
+    """Delete the rows and fingerprint of a single entry."""
+    if entry_type == 'rfc-entry':
+        for table in _RFC_CHILD_TABLES:
+            connection.execute(table.delete().where(table.c.rfc_id == doc_id))
+    table = ENTRY_TABLES[entry_type]
+    connection.execute(table.delete().where(table.c.id == doc_id))
+    connection.execute(
+        Fingerprint.__table__.delete().
+        where(Fingerprint.entry_type == entry_type).
+        where(Fingerprint.doc_id == doc_id)
+    )
+
+
+def update_all(connection: sqlalchemy.engine.Connection, source,
+               workers: int = 1) -> UpdateCounts:
+    """Bring the DB reachable through `connection` in line with the XML index
+    at `source`, touching only the entries that were added, changed or
+    removed since the last load.
+
+    Entries are parsed by `workers` processes (see
+    `ietf.xml.parallel.iterrecords`).  If the DB holds rows that were loaded
+    without fingerprints, every table is emptied and the whole index is
+    loaded again.
+    """
+    stored = dict(
+        ((entry_type, doc_id), digest) for entry_type, doc_id, digest in
+        connection.execute(select(Fingerprint.entry_type, Fingerprint.doc_id,
+                                  Fingerprint.digest))
+    )
+    if not stored:  # Start from an empty DB
+        for table in reversed(Base.metadata.sorted_tables):
+            connection.execute(table.delete())
+
+    loader = BulkLoader(connection)
+    added = changed = 0
+    for entry_type, record, digest in iterrecords(source, workers,
+                                                  digests=True):
+        if record is None:  # Ignore unknown entry types
+            continue
+        key = (entry_type, record.doc_id)
+        old_digest = stored.pop(key, None)
+        if old_digest == digest:  # Unchanged since the last load
+            continue
+        elif old_digest is None:
+            added += 1
+        else:
+            changed += 1
+            _delete(connection, *key)
+        loader.add_record(entry_type, record)
+        loader.add_row(Fingerprint.__table__, {'entry_type': entry_type,
+                                               'doc_id': record.doc_id,
+                                               'digest': digest})
+    loader.flush()
+
+    # Whatever was not seen in the index has been removed from it
+    for key in stored:
+        _delete(connection, *key)
+
+    return UpdateCounts(added, changed, len(stored))
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+from ietf.xml import bcp, fyi, rfc, rfc_not_issued, std
+from ietf.xml.parse import _clark
+from typing import Iterator
+import hashlib
+import sqlalchemy.orm
+import xml.etree.ElementTree
+
+
+def entry_type(entry: xml.etree.ElementTree.Element) -> str:
+    """Return the tag of `entry` without its namespace, e.g. 'rfc-entry'."""
+    return entry.tag.rpartition('}')[2]
+
+
+def fingerprint(entry: xml.etree.ElementTree.Element) -> str:
+    """Return a digest of the canonical form of `entry`."""
+    canonical = xml.etree.ElementTree.canonicalize(
+        xml.etree.ElementTree.tostring(entry, encoding='unicode')
+    )
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+# Number of entries to add between flushes of the session
+FLUSH_EVERY = 1000
+
+# Map each top-level entry tag to the function that adds it to a session
+HANDLERS = {
+    _clark('bcp-entry'): bcp.add_entry,
+    _clark('fyi-entry'): fyi.add_entry,
+    _clark('rfc-entry'): rfc.add_entry,
+    _clark('rfc-not-issued-entry'): rfc_not_issued.add_entry,
+    _clark('std-entry'): std.add_entry,
+}
+
+
+def iterentries(source) -> Iterator[xml.etree.ElementTree.Element]:
+    """Yield each top-level entry of the XML index at `source` as soon as its
+    closing tag has been parsed.
+
+    `source` is a path or a file object.  Each entry is discarded from the
+    partially built tree once the caller has finished with it, so memory use
+    stays flat regardless of the size of the index.
+    """
+    context = xml.etree.ElementTree.iterparse(source,
+                                              events=('start', 'end'))
+    _, root = next(context)  # The first event starts the root element
+    depth = 0  # Number of open elements below the root
+    for event, element in context:
+        if event == 'start':
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:  # `element` is a direct child of the root
+                yield element
+                element.clear()  # Release the entry's subtree
+                root.clear()  # Drop every child parsed so far
+
+
+def add_all(session: sqlalchemy.orm.session.Session, source):
+    """Add all entries from the XML index at `source` to sqlalchemy `session`
+    in a single streaming pass.
+
+    The session is flushed periodically so that pending objects do not
+    accumulate in memory for the length of the load.
+    """
+    for count, entry in enumerate(iterentries(source), start=1):
+        handler = HANDLERS.get(entry.tag)
+        if handler is not None:  # Ignore unknown entry types
+            handler(session, entry)
+        if count % FLUSH_EVERY == 0:
+            session.flush()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from ietf.xml.bulk import BulkLoader, parse_entry
+from ietf.xml.index import fingerprint, iterentries
+from ietf.xml.record import RfcRecord
+from typing import Iterator, List, Optional, Tuple
+import mmap
+import multiprocessing
+import os
+import re
+import sqlalchemy.engine
+import xml.etree.ElementTree
+
+# Number of entries handed to a worker process at a time
+CHUNK_SIZE = 250
+
+# Chunks submitted to the pool ahead of the one being consumed, per worker
+TASKS_PER_WORKER = 2
+
+# Start tag of the index's root element, which declares its namespaces
+_ROOT_RE = re.compile(rb'<rfc-index\b[^>]*>')
+
+# A complete top-level entry; entries never nest
+_ENTRY_RE = re.compile(
+    rb'<((?:bcp|fyi|rfc|rfc-not-issued|std)-entry)\b[^>]*>.*?</\1\s*>',
+    re.DOTALL,
+)
+
+# Entry type, parsed values and (optionally) fingerprint of an entry
+DigestedRecord = Tuple[str, Optional[RfcRecord], Optional[str]]
+
+
+def split_entries(data: bytes, chunk_size: int = CHUNK_SIZE,
+                  ) -> Tuple[bytes, List[Tuple[int, int]]]:
+    """Return the root start tag of the raw XML index `data` and the byte
+    ranges of consecutive runs of `chunk_size` top-level entries.
+
+    Raise xml.etree.ElementTree.ParseError if `data` has no root start tag.
+    """
+    root = _ROOT_RE.search(data)
+    if root is None:
+        raise xml.etree.ElementTree.ParseError('no <rfc-index> element found')
+    header = root.group(0)
+    ranges = []
+    start = end = None
+    count = 0
+    for match in _ENTRY_RE.finditer(data):
+        if start is None:
+            start = match.start()
+        end = match.end()
+        count += 1
+        if count == chunk_size:
+            ranges.append((start, end))
+            start = None
+            count = 0
+    if start is not None:  # Trailing partial chunk
+        ranges.append((start, end))
+    return header, ranges
+
+
+def _parse(entry: xml.etree.ElementTree.Element,
+           digests: bool) -> DigestedRecord:
+    """Parse a single `entry`, fingerprinting it if `digests` is set."""
+    kind, record = parse_entry(entry)
+    digest = fingerprint(entry) if digests else None
+    return kind, record, digest
+
+
+def _parse_chunk(header: bytes, chunk: bytes,
+                 digests: bool) -> List[DigestedRecord]:
+    """Parse the raw entries in `chunk` inside a worker process."""
+    root = xml.etree.ElementTree.fromstring(header + chunk + b'</rfc-index>')
+    return [_parse(entry, digests) for entry in root]
+
+
+def iterrecords(path: str, workers: int = None, digests: bool = False,
+                chunk_size: int = CHUNK_SIZE) -> Iterator[DigestedRecord]:
+    """Yield the parsed records of every entry in the XML index at `path` in
+    document order.
+
+    Entries are parsed in chunks of `chunk_size` by a pool of `workers`
+    processes, which defaults to one per CPU.  At most `TASKS_PER_WORKER`
+    chunks per worker are parsed ahead of the records being consumed.  With
+    a single worker the index is parsed serially in this process.  The
+    fingerprint of each entry is only computed if `digests` is set.
+
+    Workers are started by a fork server rather than forked from this
+    process, which may be running other threads, such as `mirror`'s
+    transfers.
+
+    An index that cannot be split into entries, such as an empty one, is
+    left to the serial parser, so that it fails with the same ParseError.
+    """
+    if workers != 1 and os.path.getsize(path) > 0:
+        with open(path, 'rb') as index_file, \
+                mmap.mmap(index_file.fileno(), 0,
+                          access=mmap.ACCESS_READ) as data:
+            try:
+                header, ranges = split_entries(data, chunk_size)
+            except xml.etree.ElementTree.ParseError:
+                pass
+            else:
+                yield from _iterchunks(data, header, ranges, workers,
+                                       digests)
+                return
+
+    for entry in iterentries(path):
+        yield _parse(entry, digests)
+
+
+def _iterchunks(data: bytes, header: bytes, ranges: List[Tuple[int, int]],
+                workers: Optional[int],
+                digests: bool) -> Iterator[DigestedRecord]:
+    """Yield the parsed records of the entries of `data` in the byte
+    `ranges`, parsing each range in a pool of `workers` processes.
+    """
+    window = TASKS_PER_WORKER * (workers or os.cpu_count() or 1)
+    context = multiprocessing.get_context('forkserver')
+    with ProcessPoolExecutor(workers, mp_context=context) as executor:
+        # Copy each chunk out of the mapping only as it is submitted, and
+        # keep at most `window` chunks in flight so that memory stays
+        # bounded however slowly the records are consumed
+        pending = deque()
+        for start, end in ranges:
+            if len(pending) == window:
+                yield from pending.popleft().result()
+            pending.append(executor.submit(_parse_chunk, header,
+                                           data[start:end], digests))
+        while pending:
+            yield from pending.popleft().result()
+
+
+def add_all(connection: sqlalchemy.engine.Connection, path: str,
+            workers: int = None):
+    """Add all entries from the XML index at `path` to the DB reachable
+    through `connection`, parsing them with a pool of `workers` processes.
+
+    This process is the only one writing to the DB.
+    """
+    loader = BulkLoader(connection)
+    for kind, record, _ in iterrecords(path, workers):
+        loader.add_record(kind, record)
+    loader.flush()
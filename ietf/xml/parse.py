@@ -2,6 +2,7 @@
 from typing import List, Dict, Tuple
 import xml.etree.ElementTree
 from .enum import DocumentType, FileType, Month, Status, Stream
+from .record import AuthorRecord, DocRef, FormatRecord, RfcRecord, intern
 
 NAMESPACE = {'index': 'http://www.rfc-editor.org/rfc-index'}
 
@@ -12,20 +13,203 @@ def findall(root: xml.etree.ElementTree.Element, entry_type: str) -> List[xml.et
     return root.findall('index:{}'.format(entry_type), NAMESPACE)
 
 
+def _clark(tag: str) -> str:
+    """Return `tag` in the index namespace using Clark notation."""
+    return '{{{}}}{}'.format(NAMESPACE['index'], tag)
+
+
+# Clark-notation names of the elements nested inside an entry's children
+_AUTHOR_NAME = _clark('name')
+_AUTHOR_TITLE = _clark('title')
+_AUTHOR_ORGANIZATION = _clark('organization')
+_AUTHOR_ORG_ABBREV = _clark('org-abbrev')
+_DATE_YEAR = _clark('year')
+_DATE_MONTH = _clark('month')
+_DATE_DAY = _clark('day')
+_FORMAT_FILE_FORMAT = _clark('file-format')
+_FORMAT_CHAR_COUNT = _clark('char-count')
+_FORMAT_PAGE_COUNT = _clark('page-count')
+_KW = _clark('kw')
+_P = _clark('p')
+_DOC_ID = _clark('doc-id')
+
+
+def _decode_text(element: xml.etree.ElementTree.Element) -> str:
+    return element.text.strip()
+
+
+def _decode_raw_text(element: xml.etree.ElementTree.Element) -> str:
+    return element.text
+
+
+def _decode_interned_text(element: xml.etree.ElementTree.Element) -> str:
+    return intern(element.text)
+
+
+def _decode_doc_id(element: xml.etree.ElementTree.Element) -> int:
+    # Strip the three DocumentType letters off the ID
+    return int(element.text.strip()[3:])
+
+
+def _decode_author(element: xml.etree.ElementTree.Element) -> AuthorRecord:
+    name = intern(element.find(_AUTHOR_NAME).text.strip())
+    # Only the name is guaranteed to exist
+    title = element.find(_AUTHOR_TITLE)
+    if title is not None:
+        title = intern(title.text.strip())
+    organization = element.find(_AUTHOR_ORGANIZATION)
+    if organization is not None:
+        organization = intern(organization.text)
+    org_abbrev = element.find(_AUTHOR_ORG_ABBREV)
+    if org_abbrev is not None:
+        org_abbrev = intern(org_abbrev.text.strip())
+    return AuthorRecord(name, title, organization, org_abbrev)
+
+
+def _decode_date(element: xml.etree.ElementTree.Element,
+                 ) -> Tuple[int, int, int]:
+    year = int(element.find(_DATE_YEAR).text)
+    month = Month[element.find(_DATE_MONTH).text.strip()].value
+    day = element.find(_DATE_DAY)  # Not guaranteed to exist
+    if day is not None:
+        day = int(day.text)
+    return (year, month, day)
+
+
+def _decode_format(element: xml.etree.ElementTree.Element,
+                   ) -> FormatRecord:
+    file_format = FileType(element.find(_FORMAT_FILE_FORMAT).text.strip())
+    char_count = int(element.find(_FORMAT_CHAR_COUNT).text)
+    page_count = element.find(_FORMAT_PAGE_COUNT)  # Not guaranteed to exist
+    if page_count is not None:
+        page_count = int(page_count.text)
+    return FormatRecord(file_format, char_count, page_count)
+
+
+def _decode_keywords(element: xml.etree.ElementTree.Element) -> List[str]:
+    # Do not add empty strings
+    return [intern(kw.text.strip().lower()) for kw in element.iterfind(_KW)
+            if kw.text]
+
+
+def _decode_abstract(element: xml.etree.ElementTree.Element) -> List[str]:
+    return [par.text.strip() for par in element.iterfind(_P)]
+
+
+def _decode_doc_ids(element: xml.etree.ElementTree.Element) -> List[DocRef]:
+    doc_ids = []
+    for doc_id in element.iterfind(_DOC_ID):
+        text = doc_id.text  # Get the content of a doc-id element
+        doc_ids.append(DocRef(DocumentType[text[0:3]], int(text[3:])))
+    return doc_ids
+
+
+def _decode_status(element: xml.etree.ElementTree.Element) -> Status:
+    return Status(element.text)
+
+
+def _decode_stream(element: xml.etree.ElementTree.Element) -> Stream:
+    return Stream(element.text)
+
+
+def _empty_list() -> list:
+    return []
+
+
+def _none() -> None:
+    return None
+
+
+# Every field of a decoded entry as a tuple of
+# (field name, element tag, decoder, whether the element repeats, default)
+_FIELDS = (
+    ('doc_id', 'doc-id', _decode_doc_id, False, _none),
+    ('title', 'title', _decode_text, False, _none),
+    ('authors', 'author', _decode_author, True, _empty_list),
+    ('date', 'date', _decode_date, False, _none),
+    ('formats', 'format', _decode_format, True, _empty_list),
+    ('keywords', 'keywords', _decode_keywords, False, _empty_list),
+    ('abstract', 'abstract', _decode_abstract, False, _empty_list),
+    ('draft', 'draft', _decode_text, False, _none),
+    ('notes', 'notes', _decode_text, False, _none),
+    ('obsoletes', 'obsoletes', _decode_doc_ids, False, _empty_list),
+    ('obsoleted_by', 'obsoleted-by', _decode_doc_ids, False, _empty_list),
+    ('updates', 'updates', _decode_doc_ids, False, _empty_list),
+    ('updated_by', 'updated-by', _decode_doc_ids, False, _empty_list),
+    ('is_also', 'is-also', _decode_doc_ids, False, _empty_list),
+    ('see_also', 'see-also', _decode_doc_ids, False, _empty_list),
+    ('current_status', 'current-status', _decode_status, False, _none),
+    ('publication_status', 'publication-status', _decode_status, False,
+     _none),
+    ('stream', 'stream', _decode_stream, True, _empty_list),
+    ('area', 'area', _decode_interned_text, False, _none),
+    ('wg_acronym', 'wg_acronym', _decode_interned_text, False, _none),
+    ('errata_url', 'errata-url', _decode_text, False, _none),
+    ('doi', 'doi', _decode_raw_text, False, _none),
+)
+
+# Map the Clark-notation tag of an entry's child to the position of its field
+# in an RfcRecord, its decoder and whether it repeats
+_DISPATCH = {_clark(tag): (RfcRecord._fields.index(field), decoder, repeats)
+             for field, tag, decoder, repeats, _ in _FIELDS}
+
+# Map each field to its Clark-notation tag, decoder, repetition and default
+_BY_FIELD = {field: (_clark(tag), decoder, repeats, default)
+             for field, tag, decoder, repeats, default in _FIELDS}
+
+# Default factory of each field of an RfcRecord, in order
+_DEFAULTS = tuple(_BY_FIELD[field][3] for field in RfcRecord._fields)
+
+_MISSING = object()  # Marks a field whose element has not been seen yet
+
+
+def decode_entry(entry: xml.etree.ElementTree.Element) -> RfcRecord:
+    """Return every field of `entry` in a single pass over its children.
+
+    Each field of the returned record holds what the corresponding `find_*`
+    function returns, except that authors are AuthorRecords rather than
+    dicts.  For elements that may only occur once, the first occurrence
+    wins.
+    """
+    values = [_MISSING] * len(_DEFAULTS)
+    for child in entry:
+        spec = _DISPATCH.get(child.tag)
+        if spec is None:  # Not a field of interest
+            continue
+        index, decoder, repeats = spec
+        if repeats:
+            if values[index] is _MISSING:
+                values[index] = [decoder(child)]
+            else:
+                values[index].append(decoder(child))
+        elif values[index] is _MISSING:
+            values[index] = decoder(child)
+    # Fill in the fields that had no element
+    for index, default in enumerate(_DEFAULTS):
+        if values[index] is _MISSING:
+            values[index] = default()
+    return RfcRecord._make(values)
+
+
+def _find(entry: xml.etree.ElementTree.Element, field: str):
+    """Decode only `field` of `entry`."""
+    tag, decoder, repeats, default = _BY_FIELD[field]
+    if repeats:
+        return [decoder(child) for child in entry.iterfind(tag)]
+    child = entry.find(tag)
+    if child is None:
+        return default()
+    return decoder(child)
+
+
 def find_doc_id(entry: xml.etree.ElementTree.Element) -> int:
     """Retrieve the numerical part of `entry`'s ID"""
-    doc_id = entry.find('index:doc-id', NAMESPACE).text.strip()
-    # Strip the three DocumentType letters off the ID
-    return int(doc_id[3:])
+    return _find(entry, 'doc_id')
 
 
 def find_title(entry: xml.etree.ElementTree.Element) -> str:
     """Return the `title` element of `entry`."""
-    title = entry.find('index:title', NAMESPACE)
-    if title is not None:
-        return title.text.strip()
-    else:
-        return None
+    return _find(entry, 'title')
 
 
 def find_author(entry: xml.etree.ElementTree.Element) -> List[Dict[str, str]]:
@@ -35,53 +219,7 @@ def find_author(entry: xml.etree.ElementTree.Element) -> List[Dict[str, str]]:
     'title', 'orgaization', and 'org_abbrev'.  All will have values in the
     returned dict, but only 'name' is guaranteed to have a non-None value.
     """
-
-    author_entries = entry.findall('index:author', NAMESPACE)
-    authors = []
-
-    for author_entry in author_entries:
-        author = {}
-
-        # Set author's name
-        name = author_entry.find('index:name', NAMESPACE).text.strip()
-        author['name'] = name
-
-        # Set author's title, which is not guaranteed to exist
-        try:
-            title = author_entry.find('index:title', NAMESPACE).text
-        except AttributeError:
-            title = None
-        except:
-            raise
-        else:
-            title = title.strip()
-        author['title'] = title
-
-        # Set author's organization, which is not guaranteed to exist
-        try:
-            organization = author_entry.find('index:organization',
-                                             NAMESPACE).text
-        except AttributeError:
-            organization = None
-        except:
-            raise
-        author['organization'] = organization
-
-        # Set author's org_abbrev, which is not guaranteed to exist
-        try:
-            org_abbrev = author_entry.find('index:org-abbrev', NAMESPACE).text
-        except AttributeError:
-            org_abbrev = None
-        except:
-            raise
-        else:
-            org_abbrev = org_abbrev.strip()
-        author['org_abbrev'] = org_abbrev
-
-        # Add author to the list of authors
-        authors.append(author)
-
-    return authors
+    return [author._asdict() for author in _find(entry, 'authors')]
 
 
 def find_date(entry: xml.etree.ElementTree.Element) -> Tuple[int, int, int]:
@@ -94,28 +232,7 @@ def find_date(entry: xml.etree.ElementTree.Element) -> Tuple[int, int, int]:
     - 'day' is the day of the month.  Its value is either an integer in the
     range [0,31] or None.
     """
-    date_entry = entry.find('index:date', NAMESPACE)
-
-    # Set date's year
-    year = int(date_entry.find('index:year', NAMESPACE).text)
-
-    # Set date's month
-    month_str = date_entry.find('index:month', NAMESPACE).text.strip()
-    month = Month[month_str].value
-
-    # Set date's day of the month, which is not guaranteed to exist
-    ## Attempt to get the text from inside the XML day tag
-    try:
-        day_str = date_entry.find('index:day', NAMESPACE).text
-    except AttributeError:
-        day = None
-    except:
-        raise
-    ## If there was no exception convert the retrieved str to an int
-    else:
-        day = int(day_str)
-
-    return (year, month, day)
+    return _find(entry, 'date')
 
 
 def find_format(entry: xml.etree.ElementTree.Element) -> List[Tuple[FileType,
@@ -127,92 +244,29 @@ def find_format(entry: xml.etree.ElementTree.Element) -> List[Tuple[FileType,
     int -- the character count
     int/None -- the page count
     """
-
-    format_entries = entry.findall('index:format', NAMESPACE)
-    formats = []
-
-    for format_entry in format_entries:
-        # Get the file format
-        file_format = FileType(format_entry.find('index:file-format',
-                                                 NAMESPACE).text.strip())
-
-        # Get the character count
-        char_count = int(format_entry.find('index:char-count', NAMESPACE).text)
-
-        # Get the page count, which is not guaraneed to exist
-        ## Attempt to get the text from inside the XML page-count tag
-        try:
-            page_count_str = format_entry.find('index:page-count',
-                                               NAMESPACE).text
-        except AttributeError:
-            page_count = None
-        except:
-            raise
-        ## If there was no exception convert the retrieved str to an int
-        else:
-            page_count = int(page_count_str)
-
-        # Add the triplet to formats
-        formats.append((file_format, char_count, page_count))
-
-    return formats
+    return _find(entry, 'formats')
 
 
 def find_keywords(entry: xml.etree.ElementTree.Element) -> List[str]:
     """Return the list of keywords describing `entry`."""
-
-    keywords = []
-    try:
-        elements = entry.find('index:keywords', NAMESPACE).\
-                         findall('index:kw', NAMESPACE)
-        for element in elements:
-            if element.text:  # Do not add empty strings
-                keywords.append(element.text.strip().lower())
-    except AttributeError:
-        pass
-    except:
-        raise
-
-    return keywords
+    return _find(entry, 'keywords')
 
 
 def find_abstract(entry: xml.etree.ElementTree.Element) -> List[str]:
     """Return a list of strings containing the paragraphs composing `entry`'s
     `abstract` element.
     """
-
-    abstract = []
-    try:
-        abstract_pars = entry.find('index:abstract', NAMESPACE).\
-            findall('index:p', NAMESPACE)
-        for abstract_par in abstract_pars:
-            abstract.append(abstract_par.text.strip())
-    except AttributeError:
-        pass
-    except:
-        raise
-
-    return abstract
+    return _find(entry, 'abstract')
 
 
 def find_draft(entry: xml.etree.ElementTree.Element) -> str:
     """Return the `draft` element of `entry`."""
-    draft = entry.find('index:draft', NAMESPACE)
-
-    if draft is not None:
-        return draft.text.strip()
-    else:
-        return None
+    return _find(entry, 'draft')
 
 
 def find_notes(entry: xml.etree.ElementTree.Element) -> str:
     """Return the `notes` element of `entry`."""
-    notes = entry.find('index:notes', NAMESPACE)
-
-    if notes is not None:
-        return notes.text.strip()
-    else:
-        return None
+    return _find(entry, 'notes')
 
 
 def find_obsoletes(entry: xml.etree.ElementTree.Element) -> List[DocId]:
@@ -222,19 +276,7 @@ def find_obsoletes(entry: xml.etree.ElementTree.Element) -> List[DocId]:
     The first element of the tuple is a DocumentType.
     The second element is an integer.
     """
-
-    found_entry = entry.find('index:obsoletes', NAMESPACE)
-
-    doc_ids = []
-    if found_entry is not None:
-        obsoletes = found_entry.findall('index:doc-id', NAMESPACE)
-        for obsolete in obsoletes:
-            text = obsolete.text  # Get the content of a doc-id element
-            doc_type = DocumentType[text[0:3]]
-            doc_id = int(text[3:])
-            doc_ids.append((doc_type, doc_id))
-
-    return doc_ids
+    return _find(entry, 'obsoletes')
 
 
 def find_obsoleted_by(entry: xml.etree.ElementTree.Element) -> List[DocId]:
@@ -244,19 +286,7 @@ def find_obsoleted_by(entry: xml.etree.ElementTree.Element) -> List[DocId]:
     The first element of the tuple is a DocumentType.
     The second element is an integer.
     """
-
-    found_entry = entry.find('index:obsoleted-by', NAMESPACE)
-
-    doc_ids = []
-    if found_entry is not None:
-        obsoleted_by = found_entry.findall('index:doc-id', NAMESPACE)
-        for by in obsoleted_by:
-            text = by.text  # Get the content of a doc-id element
-            doc_type = DocumentType[text[0:3]]
-            doc_id = int(text[3:])
-            doc_ids.append((doc_type, doc_id))
-
-    return doc_ids
+    return _find(entry, 'obsoleted_by')
 
 
 def find_updates(entry: xml.etree.ElementTree.Element) -> List[DocId]:
@@ -266,19 +296,7 @@ def find_updates(entry: xml.etree.ElementTree.Element) -> List[DocId]:
     The first element of the tuple is a DocumentType.
     The second element is an integer.
     """
-
-    found_entry = entry.find('index:updates', NAMESPACE)
-
-    doc_ids = []
-    if found_entry is not None:
-        found_doc_ids = found_entry.findall('index:doc-id', NAMESPACE)
-        for doc_id in found_doc_ids:
-            text = doc_id.text  # Get the content of a doc-id element
-            doc_type = DocumentType[text[0:3]]
-            doc_num = int(text[3:])
-            doc_ids.append((doc_type, doc_num))
-
-    return doc_ids
+    return _find(entry, 'updates')
 
 
 def find_updated_by(entry: xml.etree.ElementTree.Element) -> List[DocId]:
@@ -288,19 +306,7 @@ def find_updated_by(entry: xml.etree.ElementTree.Element) -> List[DocId]:
     The first element of the tuple is a DocumentType.
     The second element is an integer.
     """
-
-    found_entry = entry.find('index:updated-by', NAMESPACE)
-
-    doc_ids = []
-    if found_entry is not None:
-        found_doc_ids = found_entry.findall('index:doc-id', NAMESPACE)
-        for doc_id in found_doc_ids:
-            text = doc_id.text  # Get the content of a doc-id element
-            doc_type = DocumentType[text[0:3]]
-            doc_num = int(text[3:])
-            doc_ids.append((doc_type, doc_num))
-
-    return doc_ids
+    return _find(entry, 'updated_by')
 
 
 def find_is_also(entry: xml.etree.ElementTree.Element) -> List[DocId]:
@@ -310,19 +316,7 @@ def find_is_also(entry: xml.etree.ElementTree.Element) -> List[DocId]:
     The first element of the tuple is a DocumentType.
     The second element is an integer.
     """
-
-    found_entry = entry.find('index:is-also', NAMESPACE)
-
-    doc_ids = []
-    if found_entry is not None:
-        found_doc_ids = found_entry.findall('index:doc-id', NAMESPACE)
-        for doc_id in found_doc_ids:
-            text = doc_id.text  # Get the content of a doc-id element
-            doc_type = DocumentType[text[0:3]]
-            doc_num = int(text[3:])
-            doc_ids.append((doc_type, doc_num))
-
-    return doc_ids
+    return _find(entry, 'is_also')
 
 
 def find_see_also(entry: xml.etree.ElementTree.Element) -> List[DocId]:
@@ -334,77 +328,39 @@ def find_see_also(entry: xml.etree.ElementTree.Element) -> List[DocId]:
     The first element of the tuple is a DocumentType.
     The second element is the ID number of that document.
     """
-
-    found_entry = entry.find('index:see-also', NAMESPACE)
-
-    doc_ids = []
-    if found_entry is not None:
-        found_doc_ids = found_entry.findall('index:doc-id', NAMESPACE)
-        for doc_id in found_doc_ids:
-            text = doc_id.text  # Get the content of a doc-id element
-            doc_type = DocumentType[text[0:3]]
-            doc_num = int(text[3:])
-            doc_ids.append((doc_type, doc_num))
-
-    return doc_ids
+    return _find(entry, 'see_also')
 
 
 def find_current_status(entry: xml.etree.ElementTree.Element) -> Status:
     """Return `entry`'s current status."""
-    return Status(entry.find('index:current-status', NAMESPACE).text)
+    return _find(entry, 'current_status')
 
 
 def find_publication_status(entry: xml.etree.ElementTree.Element) -> Status:
     """Return the status of `entry` at the time of its publication."""
-    return Status(entry.find('index:publication-status', NAMESPACE).text)
+    return _find(entry, 'publication_status')
 
 
 def find_stream(entry: xml.etree.ElementTree.Element) -> List[Stream]:
     """Return the `stream` element of `entry`."""
-    stream_entries = entry.findall('index:stream', NAMESPACE)
-
-    streams = []
-    for stream_entry in stream_entries:
-        streams.append(Stream(stream_entry.text))
-
-    return streams
+    return _find(entry, 'stream')
 
 
 def find_area(entry: xml.etree.ElementTree.Element) -> str:
     """Return the `area` element of `entry`."""
-    area_entry = entry.find('index:area', NAMESPACE)
-
-    if area_entry is not None:
-        return area_entry.text
-    else:
-        return None
+    return _find(entry, 'area')
 
 
 def find_wg_acronym(entry: xml.etree.ElementTree.Element) -> str:
     """Return the `wg_acronym` element of `entry`."""
-    acronym_entry = entry.find('index:wg_acronym', NAMESPACE)
-
-    if acronym_entry is not None:
-        return acronym_entry.text
-    else:
-        return None
+    return _find(entry, 'wg_acronym')
 
 
 def find_errata_url(entry: xml.etree.ElementTree.Element) -> str:
     """Return the `errata_url` element of `entry`."""
-    errata_entry = entry.find('index:errata-url', NAMESPACE)
-
-    if errata_entry is not None:
-        return errata_entry.text.strip()
-    else:
-        return None
+    return _find(entry, 'errata_url')
 
 
 def find_doi(entry: xml.etree.ElementTree.Element) -> str:
     """Return the `doi` element of `entry`."""
-    doi_entry = entry.find('index:doi', NAMESPACE)
-
-    if doi_entry is not None:
-        return doi_entry.text
-    else:
-        return None
+    return _find(entry, 'doi')
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+from .enum import DocumentType, FileType, Status, Stream
+from typing import List, NamedTuple, Optional, Tuple
+import sys
+
+
+def intern(value: Optional[str]) -> Optional[str]:
+    """Return the interned copy of `value` so that repeated values such as
+    organization names share a single string object.
+    """
+    if value is None:
+        return None
+    return sys.intern(value)
+
+
+class DocRef(NamedTuple):
+    """Reference to another document, e.g. RFC 2119 or BCP 14."""
+    doc_type: DocumentType
+    doc_id: int
+
+
+class AuthorRecord(NamedTuple):
+    """An author of an RFC.  Only `name` is guaranteed to be set."""
+    name: str
+    title: Optional[str]
+    organization: Optional[str]
+    org_abbrev: Optional[str]
+
+
+class FormatRecord(NamedTuple):
+    """A format an RFC is available in."""
+    filetype: FileType
+    char_count: int
+    page_count: Optional[int]
+
+
+class RfcRecord(NamedTuple):
+    """Every field of a decoded index entry.
+
+    Entries other than RFCs only set the fields their elements provide; the
+    rest hold None or an empty list.
+    """
+    doc_id: int
+    title: Optional[str]
+    authors: List[AuthorRecord]
+    date: Optional[Tuple[int, int, Optional[int]]]
+    formats: List[FormatRecord]
+    keywords: List[str]
+    abstract: List[str]
+    draft: Optional[str]
+    notes: Optional[str]
+    obsoletes: List[DocRef]
+    obsoleted_by: List[DocRef]
+    updates: List[DocRef]
+    updated_by: List[DocRef]
+    is_also: List[DocRef]
+    see_also: List[DocRef]
+    current_status: Optional[Status]
+    publication_status: Optional[Status]
+    stream: List[Stream]
+    area: Optional[str]
+    wg_acronym: Optional[str]
+    errata_url: Optional[str]
+    doi: Optional[str]
@@ -5,6 +5,19 @@ from .parse import findall, find_doc_id, find_title
 import sqlalchemy.orm
 import xml.etree.ElementTree
 
+
+def add_entry(session: sqlalchemy.orm.session.Session,
+              entry: xml.etree.ElementTree.Element):
+    """Add a single rfc-not-issued `entry` to sqlalchemy `session`."""
+    doc_id = find_doc_id(entry)
+
+    fyi = RfcNotIssued(
+        id=doc_id,
+    )
+
+    session.add(fyi)
+
+
 def add_all(session: sqlalchemy.orm.session.Session,
             root: xml.etree.ElementTree.Element):
     """Add all rfc-not-issued entries from XML `root` to sqlalchemy
@@ -13,10 +26,4 @@ def add_all(session: sqlalchemy.orm.session.Session,
 
     entries = findall(root, 'rfc-not-issued-entry')
     for entry in entries:
-        doc_id = find_doc_id(entry)
-
-        fyi = RfcNotIssued(
-            id=doc_id,
-        )
-
-        session.add(fyi)
+        add_entry(session, entry)